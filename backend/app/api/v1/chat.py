@@ -1,6 +1,8 @@
 # app/api/v1/chat.py
 
+import json
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 from app.schemas.chat import ChatRequest, ChatResponse
 from app.services.chat_service import ChatService
 
@@ -15,3 +17,23 @@ async def chat_with_archivist(request: ChatRequest):
     messages_dict = [m.model_dump() for m in request.messages]
     result = await chat_service.get_chat_response(messages_dict, request.context)
     return result
+
+@router.post("/stream")
+async def stream_chat_with_archivist(request: ChatRequest):
+    """
+    Same conversation turn as POST /, streamed as server-sent events:
+    `token` events while the reply is generated, a `suggested_movie` event
+    per enriched [[Title]] as soon as its lookup finishes, then `done`.
+    """
+    messages_dict = [m.model_dump() for m in request.messages]
+
+    async def event_stream():
+        async for event, data in chat_service.stream_chat_response(messages_dict, request.context):
+            yield f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        # Disable proxy buffering so events reach the browser as they are sent
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
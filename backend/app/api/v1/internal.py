@@ -0,0 +1,50 @@
+# app/api/v1/internal.py
+
+from fastapi import APIRouter, Depends
+from app.api.deps import get_current_active_superuser
+from app.db.session import get_pool_stats
+from app.core.cache import cache_stats
+from app.core.concurrency import gate_stats, thread_pool_stats
+from app.services.research_service import research_provider_stats
+from app.services.research_jobs import research_job_queue
+
+# Operational internals (pools, caches, queues): superusers only
+router = APIRouter(dependencies=[Depends(get_current_active_superuser)])
+
+@router.get("/stats/db-pool")
+def db_pool_stats():
+    """
+    Connection-pool utilisation for the sync and async engines:
+    checked-out connections, overflow, checkout wait times and timeouts.
+    """
+    return get_pool_stats()
+
+@router.get("/stats/caches")
+def lookup_cache_stats():
+    """
+    Hit/miss counters for every tiered cache (TMDB, OMDb, LLM explanations).
+    """
+    return cache_stats()
+
+@router.get("/stats/research-providers")
+def research_providers_stats():
+    """
+    EWMA latency and success rate per research provider (drives their ordering).
+    """
+    return research_provider_stats()
+
+@router.get("/stats/concurrency")
+def concurrency_stats():
+    """
+    In-flight/queued counts, rejections and saturation for the LLM gate and
+    the blocking-call thread pools.
+    """
+    return {"gates": gate_stats(), "thread_pools": thread_pool_stats()}
+
+@router.get("/stats/research-jobs")
+def research_jobs_stats():
+    """
+    Background research queue: backlog, jobs waiting on a retry backoff,
+    running jobs and outcome counters since startup.
+    """
+    return research_job_queue.stats()
@@ -1,7 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.db.session import get_db
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.session import get_async_db
 from app.services.research_service import ResearchService
+from app.services.research_jobs import research_job_queue
+from app.repositories.movie_repository import AsyncMovieRepository
+from app.repositories.research_job_repository import AsyncResearchJobRepository
+from app.core.concurrency import GateRejectedError
+from app.models.movie import Movie
+from app.models.research_job import SUCCEEDED
 from app.schemas.response import MovieRecommendation
 from pydantic import BaseModel
 
@@ -11,8 +19,23 @@ research_service = ResearchService()
 class ResearchRequest(BaseModel):
     title: str
 
+class ResearchJobAccepted(BaseModel):
+    job_id: str
+    status: str
+    status_url: str
+
+class ResearchJobStatus(BaseModel):
+    job_id: str
+    title: str
+    status: str # pending | running | succeeded | failed
+    attempts: int
+    error: Optional[str] = None
+    result: Optional[MovieRecommendation] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
 @router.post("/research")
-async def research_movie(request: ResearchRequest, db: Session = Depends(get_db)):
+async def research_movie(request: ResearchRequest, db: AsyncSession = Depends(get_async_db)):
     """
     Acts as a 'Deep Search' - researches a movie title, 
     analyzes it, and returns the cinematic profile.
@@ -25,6 +48,52 @@ async def research_movie(request: ResearchRequest, db: Session = Depends(get_db)
             detail="My cinematic sensors couldn't find enough deep data on this title yet. Try a more well-known movie!"
         )
     
+    return _to_recommendation(movie)
+
+@router.post("/jobs", status_code=202, response_model=ResearchJobAccepted)
+async def submit_research_job(request: ResearchRequest, http_request: Request, db: AsyncSession = Depends(get_async_db)):
+    """
+    Queues the same research as POST /research and returns immediately;
+    poll the returned status_url for the result.
+    """
+    try:
+        job = await research_job_queue.submit(db, request.title)
+    except GateRejectedError:
+        raise HTTPException(
+            status_code=503,
+            detail="The research queue is full right now. Please try again in a minute.",
+            headers={"Retry-After": "30"}
+        )
+    return ResearchJobAccepted(
+        job_id=job.id,
+        status=job.status,
+        status_url=str(http_request.url_for("get_research_job", job_id=job.id))
+    )
+
+@router.get("/jobs/{job_id}", response_model=ResearchJobStatus)
+async def get_research_job(job_id: str, db: AsyncSession = Depends(get_async_db)):
+    job = await AsyncResearchJobRepository.get_by_id(db, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Research job not found")
+
+    result = None
+    if job.status == SUCCEEDED and job.movie_id is not None:
+        movie = await AsyncMovieRepository.get_by_id(db, job.movie_id)
+        if movie:
+            result = _to_recommendation(movie)
+
+    return ResearchJobStatus(
+        job_id=job.id,
+        title=job.title,
+        status=job.status,
+        attempts=job.attempts,
+        error=job.error,
+        result=result,
+        created_at=job.created_at,
+        updated_at=job.updated_at
+    )
+
+def _to_recommendation(movie: Movie) -> MovieRecommendation:
     return MovieRecommendation(
         id=movie.id,
         title=movie.title,
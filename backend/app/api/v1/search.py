@@ -0,0 +1,51 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.session import get_async_db
+from app.services.catalog_service import catalog_service
+from app.repositories.movie_repository import AsyncMovieRepository
+from app.schemas.search import TitleSuggestion, TitleSearchResult, TitleSearchResponse, AutocompleteResponse
+
+router = APIRouter()
+
+@router.get("/", response_model=TitleSearchResponse)
+async def search_titles(
+    q: str = Query(..., min_length=1, max_length=255),
+    limit: int = Query(10, ge=1, le=50),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Typo-tolerant title search over the catalog, best match first.
+    """
+    catalog = await catalog_service.get_snapshot_async()
+    hits = catalog.search_titles(q, limit)
+    movies = {movie.id: movie for movie in await AsyncMovieRepository.get_by_ids(db, [hit.id for hit in hits])}
+
+    results = []
+    for hit in hits:
+        movie = movies.get(hit.id)
+        if movie:
+            results.append(TitleSearchResult(
+                id=movie.id,
+                title=movie.title,
+                score=hit.score,
+                year=movie.release_year,
+                poster=movie.poster_url,
+                content_type=movie.content_type
+            ))
+    return TitleSearchResponse(query=q, results=results)
+
+@router.get("/autocomplete", response_model=AutocompleteResponse)
+async def autocomplete_titles(
+    q: str = Query(..., min_length=1, max_length=255),
+    limit: int = Query(8, ge=1, le=20)
+):
+    """
+    Title suggestions as the user types. Served from the in-memory snapshot
+    only (no per-keystroke queries once it is loaded).
+    """
+    catalog = await catalog_service.get_snapshot_async()
+    suggestions = [
+        TitleSuggestion(id=hit.id, title=hit.title, score=hit.score)
+        for hit in catalog.autocomplete_titles(q, limit)
+    ]
+    return AutocompleteResponse(query=q, suggestions=suggestions)
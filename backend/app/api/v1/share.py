@@ -1,9 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.db.session import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.session import get_async_db
 from app.models.share import Share
-from app.repositories.share_repository import ShareRepository
-from app.repositories.movie_repository import MovieRepository
+from app.repositories.share_repository import AsyncShareRepository
+from app.repositories.movie_repository import AsyncMovieRepository
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 
@@ -21,7 +21,7 @@ class ShareResponse(BaseModel):
     url: str
 
 @router.post("/", response_model=ShareResponse)
-async def create_share(request: ShareCreate, db: Session = Depends(get_db)):
+async def create_share(request: ShareCreate, db: AsyncSession = Depends(get_async_db)):
     share = Share(
         mood=request.mood,
         intent=request.intent,
@@ -29,24 +29,20 @@ async def create_share(request: ShareCreate, db: Session = Depends(get_db)):
         context=request.context,
         movie_ids=request.movie_ids
     )
-    saved_share = ShareRepository.create(db, share)
+    saved_share = await AsyncShareRepository.create(db, share)
     return {
         "share_id": saved_share.id,
         "url": f"/share/{saved_share.id}"
     }
 
 @router.get("/{share_id}")
-async def get_share(share_id: str, db: Session = Depends(get_db)):
-    share = ShareRepository.get_by_id(db, share_id)
+async def get_share(share_id: str, db: AsyncSession = Depends(get_async_db)):
+    share = await AsyncShareRepository.get_by_id(db, share_id)
     if not share:
         raise HTTPException(status_code=404, detail="Share not found")
     
-    # Fetch movies associated with this share
-    movies = []
-    for mid in share.movie_ids:
-        movie = MovieRepository.get_by_id(db, mid)
-        if movie:
-            movies.append(movie)
+    # Fetch movies associated with this share (one query, original order)
+    movies = await AsyncMovieRepository.get_by_ids(db, share.movie_ids)
             
     return {
         "mood": share.mood,
@@ -0,0 +1,251 @@
+# app/core/cache.py
+
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from cachetools import TTLCache
+
+from app.core.config import get_settings
+from app.core.logger import get_logger
+from app.core.singleflight import SingleFlight
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+
+class DiskCacheStore:
+    """
+    Small SQLite key-value store shared by every TieredCache namespace.
+    Survives restarts and is safe to share between workers (WAL mode).
+    Evicts least-recently-accessed entries once the total payload size
+    exceeds `max_bytes`.
+    """
+
+    def __init__(self, path: str, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._writes_since_eviction = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cache_entries (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    stored_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    PRIMARY KEY (namespace, key)
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_cache_accessed ON cache_entries (accessed_at)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, namespace: str, key: str) -> Optional[Tuple[Any, float]]:
+        """
+        Returns (value, stored_at) or None.
+        """
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT value, stored_at FROM cache_entries WHERE namespace = ? AND key = ?",
+                (namespace, key)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE cache_entries SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                (time.time(), namespace, key)
+            )
+            conn.commit()
+        return json.loads(row[0]), row[1]
+
+    def set(self, namespace: str, key: str, value: Any, stored_at: float) -> None:
+        payload = json.dumps(value)
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (namespace, key, value, size, stored_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (namespace, key, payload, len(payload), stored_at, stored_at)
+            )
+            conn.commit()
+            self._writes_since_eviction += 1
+            if self._writes_since_eviction >= 100:
+                self._evict_locked()
+
+    def _evict_locked(self) -> None:
+        self._writes_since_eviction = 0
+        conn = self._connection()
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache_entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        # Trim to 90% of the budget so we don't evict on every write
+        to_free = total - int(self.max_bytes * 0.9)
+        freed = 0
+        victims = []
+        for namespace, key, size in conn.execute(
+            "SELECT namespace, key, size FROM cache_entries ORDER BY accessed_at"
+        ):
+            victims.append((namespace, key))
+            freed += size
+            if freed >= to_free:
+                break
+        conn.executemany("DELETE FROM cache_entries WHERE namespace = ? AND key = ?", victims)
+        conn.commit()
+        logger.info(f"🧹 Disk cache evicted {len(victims)} entries ({freed} bytes)")
+
+
+class TieredCache:
+    """
+    Two-tier cache: in-memory LRU/TTL in front of the shared DiskCacheStore.
+
+    Entries younger than `ttl` are fresh. Entries between `ttl` and
+    `ttl + stale_ttl` are served immediately while a background refresh
+    runs (stale-while-revalidate). Older entries are refetched inline.
+    Fetchers return None for results that must not be cached (errors, missing keys).
+    Concurrent misses and refreshes for the same key share one fetch (SingleFlight).
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl: float,
+        stale_ttl: float = 0,
+        memory_maxsize: int = settings.CACHE_MEMORY_MAXSIZE,
+        store: Optional[DiskCacheStore] = None
+    ):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.store = store
+        self._memory = TTLCache(maxsize=memory_maxsize, ttl=ttl + stale_ttl)
+        self._flight = SingleFlight()
+        self._refresh_tasks: Set[asyncio.Task] = set()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        _caches.append(self)
+
+    async def get_or_fetch(self, key: Any, fetch: Callable[[], Awaitable[Optional[Any]]]) -> Optional[Any]:
+        key = str(key)
+        entry = await self._lookup(key)
+
+        if entry is not None:
+            value, stored_at = entry
+            age = time.time() - stored_at
+            if age < self.ttl:
+                self.hits += 1
+                return value
+            if age < self.ttl + self.stale_ttl:
+                self.stale_hits += 1
+                self._schedule_refresh(key, fetch)
+                return value
+
+        self.misses += 1
+        return await self._flight.do(key, lambda: self._fetch_and_store(key, fetch))
+
+    async def get(self, key: Any) -> Optional[Any]:
+        """
+        Cached value (fresh or stale) without fetching; None on a miss.
+        """
+        entry = await self._lookup(str(key))
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[0]
+
+    async def set(self, key: Any, value: Any) -> None:
+        await self._store(str(key), value)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "hit_ratio": round((self.hits + self.stale_hits) / lookups, 3) if lookups else 0.0,
+            "memory_entries": len(self._memory),
+        }
+
+    async def _fetch_and_store(self, key: str, fetch: Callable[[], Awaitable[Optional[Any]]]) -> Optional[Any]:
+        value = await fetch()
+        if value is not None:
+            await self._store(key, value)
+        return value
+
+    async def _lookup(self, key: str) -> Optional[Tuple[Any, float]]:
+        entry = self._memory.get(key)
+        if entry is not None:
+            return entry
+        if self.store is None:
+            return None
+
+        try:
+            entry = await asyncio.to_thread(self.store.get, self.namespace, key)
+        except Exception as e:
+            logger.error(f"❌ Disk cache read failed ({self.namespace}): {e}")
+            return None
+        if entry is not None and time.time() - entry[1] < self.ttl + self.stale_ttl:
+            # Promote to the memory tier
+            self._memory[key] = entry
+            return entry
+        return None
+
+    async def _store(self, key: str, value: Any) -> None:
+        stored_at = time.time()
+        self._memory[key] = (value, stored_at)
+        if self.store is None:
+            return
+        try:
+            await asyncio.to_thread(self.store.set, self.namespace, key, value, stored_at)
+        except Exception as e:
+            logger.error(f"❌ Disk cache write failed ({self.namespace}): {e}")
+
+    def _schedule_refresh(self, key: str, fetch: Callable[[], Awaitable[Optional[Any]]]) -> None:
+        if self._flight.in_flight(key):
+            return
+
+        async def refresh():
+            try:
+                await self._flight.do(key, lambda: self._fetch_and_store(key, fetch))
+            except Exception as e:
+                logger.warning(f"⚠️ Background refresh failed ({self.namespace}:{key}): {e}")
+
+        # Keep a reference so the task isn't garbage-collected mid-flight
+        task = asyncio.create_task(refresh())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+
+_caches: List[TieredCache] = []
+
+
+def cache_stats() -> Dict[str, Dict[str, Any]]:
+    return {cache.namespace: cache.stats() for cache in _caches}
+
+
+disk_cache_store = (
+    DiskCacheStore(settings.CACHE_DB_PATH, settings.CACHE_MAX_DISK_BYTES)
+    if settings.CACHE_PERSISTENT_ENABLED else None
+)
@@ -0,0 +1,203 @@
+# app/core/circuit_breaker.py
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, Tuple, Type
+
+from app.core.config import get_settings
+from app.core.logger import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of calling a dependency whose circuit is open.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(f"Circuit '{name}' is open")
+        self.name = name
+
+
+class CircuitBreaker:
+    """
+    Failure-rate circuit breaker for one upstream dependency.
+
+    Closed: calls pass through and outcomes are recorded over a sliding
+    `window_seconds` window. Once at least `min_calls` outcomes are in the
+    window and the failure ratio reaches `failure_rate`, the circuit opens.
+    Open: calls fail fast with CircuitOpenError for `open_seconds`.
+    Half-open: up to `half_open_max_calls` probe calls are let through; a
+    success closes the circuit, a failure re-opens it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate: float = settings.CIRCUIT_FAILURE_RATE,
+        window_seconds: float = settings.CIRCUIT_WINDOW_SECONDS,
+        min_calls: int = settings.CIRCUIT_MIN_CALLS,
+        open_seconds: float = settings.CIRCUIT_OPEN_SECONDS,
+        half_open_max_calls: int = settings.CIRCUIT_HALF_OPEN_MAX_CALLS
+    ):
+        self.name = name
+        self.failure_rate = failure_rate
+        self.window_seconds = window_seconds
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = half_open_max_calls
+
+        self._lock = threading.Lock()
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state(time.monotonic())
+
+    def allow(self) -> bool:
+        """
+        Whether a call may go through now. Reserves a probe slot when half-open,
+        so every allowed call must be followed by record_success/record_failure/release.
+        """
+        with self._lock:
+            state = self._current_state(time.monotonic())
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and self._probes_in_flight < self.half_open_max_calls:
+                self._probes_in_flight += 1
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if self._current_state(now) == HALF_OPEN:
+                self._probes_in_flight = max(self._probes_in_flight - 1, 0)
+                self._transition(CLOSED, now)
+                return
+            self._record(now, True)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if self._current_state(now) == HALF_OPEN:
+                self._probes_in_flight = max(self._probes_in_flight - 1, 0)
+                self._transition(OPEN, now)
+                return
+            self._record(now, False)
+            failures = sum(1 for _, ok in self._outcomes if not ok)
+            if (
+                self._state == CLOSED
+                and len(self._outcomes) >= self.min_calls
+                and failures / len(self._outcomes) >= self.failure_rate
+            ):
+                self._transition(OPEN, now)
+
+    def release(self) -> None:
+        """
+        Gives back a probe slot without recording an outcome (e.g. the call was cancelled).
+        """
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._probes_in_flight = max(self._probes_in_flight - 1, 0)
+
+    @contextmanager
+    def guard(self, ignore: Tuple[Type[BaseException], ...] = ()) -> Iterator[None]:
+        """
+        Wraps one upstream call: fails fast while open and records the outcome.
+        Any exception raised inside the block counts as a failure, except the
+        `ignore` types (e.g. our own load shedding), which record nothing.
+        """
+        if not self.allow():
+            raise CircuitOpenError(self.name)
+        try:
+            yield
+        except ignore:
+            self.release()
+            raise
+        except Exception:
+            self.record_failure()
+            raise
+        except BaseException:
+            # Cancellation says nothing about the upstream's health
+            self.release()
+            raise
+        else:
+            self.record_success()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state(now)
+            self._trim(now)
+            failures = sum(1 for _, ok in self._outcomes if not ok)
+            return {
+                "state": state,
+                "calls": len(self._outcomes),
+                "failures": failures,
+                "failure_rate": round(failures / len(self._outcomes), 3) if self._outcomes else 0.0,
+                "rejected": self.rejected,
+                "retry_in_seconds": round(max(self._opened_at + self.open_seconds - now, 0.0), 1) if state == OPEN else 0.0,
+            }
+
+    # Callers must hold self._lock for the helpers below
+
+    def _current_state(self, now: float) -> str:
+        if self._state == OPEN and now - self._opened_at >= self.open_seconds:
+            self._transition(HALF_OPEN, now)
+        return self._state
+
+    def _transition(self, state: str, now: float) -> None:
+        if state == self._state:
+            return
+        logger.warning(f"🔌 Circuit '{self.name}': {self._state} -> {state}")
+        self._state = state
+        if state == OPEN:
+            self._opened_at = now
+        if state in (OPEN, CLOSED):
+            self._probes_in_flight = 0
+        if state == CLOSED:
+            self._outcomes.clear()
+
+    def _record(self, now: float, ok: bool) -> None:
+        self._outcomes.append((now, ok))
+        self._trim(now)
+
+    def _trim(self, now: float) -> None:
+        while self._outcomes and now - self._outcomes[0][0] > self.window_seconds:
+            self._outcomes.popleft()
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_registry_lock = threading.Lock()
+
+
+def get_breaker(name: str) -> CircuitBreaker:
+    """
+    Process-wide breaker for a named dependency, created on first use.
+    """
+    with _registry_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = _breakers[name] = CircuitBreaker(name)
+        return breaker
+
+
+def circuit_states() -> Dict[str, Dict[str, Any]]:
+    with _registry_lock:
+        breakers = list(_breakers.values())
+    return {breaker.name: breaker.snapshot() for breaker in breakers}
@@ -0,0 +1,213 @@
+# app/core/concurrency.py
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, TypeVar
+
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class GateRejectedError(Exception):
+    """
+    Raised when a BoundedGate or BoundedThreadPool is saturated: its wait
+    queue is full, or a caller waited longer than `queue_timeout` for a slot.
+    """
+
+    def __init__(self, name: str, reason: str):
+        super().__init__(f"Gate '{name}' rejected call: {reason}")
+        self.name = name
+        self.reason = reason
+
+
+class BoundedGate:
+    """
+    Admission control for an expensive async dependency: at most
+    `max_concurrency` calls run at once, at most `max_queue` callers wait for
+    a slot, and nobody waits longer than `queue_timeout`. Excess load is
+    rejected immediately instead of piling up behind a slow upstream.
+    """
+
+    def __init__(self, name: str, max_concurrency: int, max_queue: int, queue_timeout: float):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.in_flight = 0
+        self.queued = 0
+        self.completed = 0
+        self.rejected = 0
+
+    async def run(self, fn: Callable[[], Awaitable[T]]) -> T:
+        async with self.slot():
+            return await fn()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """
+        Holds one concurrency slot for the duration of the block (e.g. a
+        streamed response that is consumed incrementally).
+        """
+        if self.in_flight + self.queued >= self.max_concurrency + self.max_queue:
+            self.rejected += 1
+            raise GateRejectedError(self.name, "queue full")
+
+        self.queued += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise GateRejectedError(self.name, f"no slot within {self.queue_timeout:.1f}s")
+        finally:
+            self.queued -= 1
+
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+            self._semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "saturation": round(self.in_flight / self.max_concurrency, 3),
+        }
+
+
+class BoundedThreadPool:
+    """
+    Dedicated threads for blocking SDK calls so they never run on the event
+    loop. At most `max_workers` calls run and `max_queue` wait; beyond that
+    submissions are rejected. Callers stop waiting after `timeout`; a call
+    still queued at that point is dropped, one already running finishes in
+    the background (threads can't be interrupted) but its result is discarded.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue: int, timeout: float):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.pending = 0 # Submitted and not finished (queued + running)
+        self.active = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timeouts = 0
+
+    async def run(self, fn: Callable[..., T], *args: Any, timeout: Optional[float] = None, **kwargs: Any) -> T:
+        with self._lock:
+            if self.pending >= self.max_workers + self.max_queue:
+                self.rejected += 1
+                raise GateRejectedError(self.name, "queue full")
+            self.pending += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self.name)
+            executor = self._executor
+
+        future = executor.submit(self._call, functools.partial(fn, *args, **kwargs))
+        future.add_done_callback(self._finished)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=timeout or self.timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                self.timeouts += 1
+            future.cancel()
+            raise
+        except asyncio.CancelledError:
+            # Caller gave up (e.g. lost a hedged race): drop the call if it hasn't started
+            future.cancel()
+            raise
+
+    def _call(self, fn: Callable[[], T]) -> T:
+        with self._lock:
+            self.active += 1
+        try:
+            return fn()
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def _finished(self, future) -> None:
+        with self._lock:
+            self.pending -= 1
+            self.completed += 1
+
+    def shutdown(self) -> None:
+        # A later run() starts a fresh executor (e.g. the app lifespan restarting in tests)
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "active": self.active,
+                "queued": self.pending - self.active,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "timeouts": self.timeouts,
+                "saturation": round(self.active / self.max_workers, 3),
+            }
+
+
+_gates: Dict[str, BoundedGate] = {}
+_pools: Dict[str, BoundedThreadPool] = {}
+_registry_lock = threading.Lock()
+
+
+def get_gate(name: str, max_concurrency: int, max_queue: int, queue_timeout: float) -> BoundedGate:
+    """
+    Process-wide gate for a named dependency, created on first use.
+    """
+    with _registry_lock:
+        gate = _gates.get(name)
+        if gate is None:
+            gate = _gates[name] = BoundedGate(name, max_concurrency, max_queue, queue_timeout)
+        return gate
+
+
+def gate_stats() -> Dict[str, Dict[str, Any]]:
+    with _registry_lock:
+        gates = list(_gates.values())
+    return {gate.name: gate.stats() for gate in gates}
+
+
+def get_thread_pool(name: str, max_workers: int, max_queue: int, timeout: float) -> BoundedThreadPool:
+    """
+    Process-wide thread pool for a named group of blocking calls, created on first use.
+    """
+    with _registry_lock:
+        pool = _pools.get(name)
+        if pool is None:
+            pool = _pools[name] = BoundedThreadPool(name, max_workers, max_queue, timeout)
+        return pool
+
+
+def thread_pool_stats() -> Dict[str, Dict[str, Any]]:
+    with _registry_lock:
+        pools = list(_pools.values())
+    return {pool.name: pool.stats() for pool in pools}
+
+
+def shutdown_thread_pools() -> None:
+    with _registry_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        pool.shutdown()
@@ -1,12 +1,13 @@
 from pydantic_settings import BaseSettings
 from functools import lru_cache
-from typing import Optional
+from typing import Optional, Dict
 
 class Settings(BaseSettings):
     APP_NAME: str = "CinePulse AI"
     API_V1_STR: str = "/api/v1"
     DEBUG: bool = False
     SECRET_KEY: str = "super_secret_cinepulse_key_2024" # Default for dev, override in .env
+    METRICS_TOKEN: Optional[str] = None # Bearer token for Prometheus scrapes of /metrics; unset = superusers only
 
     # Server
     HOST: str = "0.0.0.0"
@@ -23,6 +24,18 @@ class Settings(BaseSettings):
     def POSTGRES_URL(self) -> str:
         return f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
 
+    @property
+    def POSTGRES_ASYNC_URL(self) -> str:
+        return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+
+    # Connection pool (applies to both the sync and async engines)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_TIMEOUT_MS: int = 15000
+
     # External APIs
     TMDB_API_KEY: Optional[str] = None
     OMDB_API_KEY: Optional[str] = None
@@ -30,6 +43,71 @@ class Settings(BaseSettings):
     FIRECRAWL_API_KEY: Optional[str] = None
     GOOGLE_API_KEY: Optional[str] = None
 
+    # Shared outbound HTTP client (one pooled client for the app lifetime)
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    HTTP_HTTP2: bool = False # Requires `pip install httpx[http2]`
+    HTTP_VERIFY_SSL: bool = True
+    HTTP_TIMEOUT_SECONDS: float = 20.0
+    HTTP_HOST_TIMEOUTS: Dict[str, float] = {
+        "api.themoviedb.org": 10.0,
+        "www.omdbapi.com": 10.0,
+        "serpapi.com": 15.0
+    }
+
+    # Persistent tiered cache for TMDB / OMDb lookups (memory LRU + SQLite on disk)
+    CACHE_PERSISTENT_ENABLED: bool = True
+    CACHE_DB_PATH: str = "data/cache/lookup_cache.sqlite3"
+    CACHE_MAX_DISK_BYTES: int = 256 * 1024 * 1024
+    CACHE_MEMORY_MAXSIZE: int = 2048
+    CACHE_TTL_SEARCH_SECONDS: int = 86400
+    CACHE_TTL_DETAILS_SECONDS: int = 7 * 86400
+    CACHE_TTL_PROVIDERS_SECONDS: int = 86400
+    CACHE_TTL_OMDB_SECONDS: int = 7 * 86400
+    CACHE_STALE_SECONDS: int = 7 * 86400 # Serve-stale-while-revalidate window
+    CACHE_TTL_EXPLANATIONS_SECONDS: int = 30 * 86400
+    EXPLANATION_CACHE_PERSISTENT: bool = True # Keep generated LLM explanations on disk too
+
+    # Gemini calls: async SDK behind a bounded gate (excess load is rejected, not queued forever)
+    LLM_MAX_CONCURRENCY: int = 8
+    LLM_MAX_QUEUE: int = 32
+    LLM_QUEUE_TIMEOUT_SECONDS: float = 2.0
+    LLM_TIMEOUT_SECONDS: float = 15.0
+    # One structured prompt for all top-k explanations instead of one call per title
+    GEMINI_BATCH_EXPLANATIONS: bool = True
+
+    # Thread pool for blocking provider SDK calls (Firecrawl), kept off the event loop
+    BLOCKING_POOL_MAX_WORKERS: int = 4
+    BLOCKING_POOL_MAX_QUEUE: int = 16
+    BLOCKING_CALL_TIMEOUT_SECONDS: float = 30.0
+
+    # Research provider racing: start the next provider if the current one
+    # hasn't answered within the hedge delay; first valid result wins
+    RESEARCH_HEDGING_ENABLED: bool = True
+    RESEARCH_HEDGE_DELAY_SECONDS: float = 1.5
+    RESEARCH_STATS_ALPHA: float = 0.2 # EWMA weight of the newest latency/success sample
+
+    # Background research jobs (POST /research/jobs): in-process workers over a
+    # persistent job table; failed attempts are retried with exponential backoff
+    RESEARCH_JOB_WORKERS: int = 2
+    RESEARCH_JOB_MAX_QUEUE: int = 100 # Submissions beyond this are rejected with 503
+    RESEARCH_JOB_MAX_ATTEMPTS: int = 3
+    RESEARCH_JOB_BACKOFF_SECONDS: float = 2.0 # Doubles per attempt, with jitter
+    RESEARCH_JOB_MAX_BACKOFF_SECONDS: float = 60.0
+    RESEARCH_JOB_TIMEOUT_SECONDS: float = 120.0 # Per attempt
+    # A running job's worker renews its lease every third of this; a job whose
+    # lease lapsed (worker process died) is picked up again by any worker
+    RESEARCH_JOB_LEASE_SECONDS: float = 60.0
+    RESEARCH_JOB_SWEEP_SECONDS: float = 30.0 # How often to look for due or orphaned jobs
+
+    # Circuit breakers for upstream dependencies (Gemini, TMDB, OMDb, research providers)
+    CIRCUIT_FAILURE_RATE: float = 0.5 # Open once this share of recent calls failed...
+    CIRCUIT_MIN_CALLS: int = 5 # ...out of at least this many
+    CIRCUIT_WINDOW_SECONDS: float = 60.0
+    CIRCUIT_OPEN_SECONDS: float = 30.0 # Fail fast this long before probing again
+    CIRCUIT_HALF_OPEN_MAX_CALLS: int = 1
+
     # Recommendation Weights
     EMOTION_WEIGHT: float = 0.30
     INTENT_WEIGHT: float = 0.25
@@ -37,6 +115,29 @@ class Settings(BaseSettings):
     CONTEXT_WEIGHT: float = 0.15
     PERSONALITY_WEIGHT: float = 0.10
 
+    # Catalog snapshot (in-memory columnar copy used by the recommend hot path)
+    CATALOG_REFRESH_SECONDS: int = 300
+
+    # Fuzzy title search over the catalog snapshot (trigram + prefix index)
+    TITLE_SEARCH_MIN_SCORE: float = 0.45 # Search/autocomplete hits below this are dropped
+    # Typos tolerated when resolving a mention to an existing catalog title (chat,
+    # research dedupe): one per 8 characters (none under 8), at most this many
+    TITLE_MATCH_MAX_EDITS: int = 2
+
+    # Per-recommendation enrichment (LLM reasoning + streaming providers)
+    ENRICHMENT_CONCURRENCY: int = 6
+    ENRICHMENT_TIMEOUT_SECONDS: float = 5.0
+
+    # End-to-end latency budget for /recommend (overridable per request via `budget_ms`).
+    # Enrichment that would overrun it falls back to template reasoning / DB providers.
+    RECOMMENDATION_BUDGET_MS: int = 2500
+    RECOMMENDATION_BUDGET_RESERVE_MS: int = 100  # Held back for response assembly
+
+    # Recommendation response cache (cleared whenever the catalog reloads)
+    RECOMMENDATION_CACHE_ENABLED: bool = True
+    RECOMMENDATION_CACHE_TTL_SECONDS: int = 300
+    RECOMMENDATION_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+
     class Config:
         env_file = ".env"
         case_sensitive = True
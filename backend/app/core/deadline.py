@@ -0,0 +1,35 @@
+# app/core/deadline.py
+
+import time
+from typing import Optional
+
+
+class Deadline:
+    """
+    Absolute per-request latency budget on the monotonic clock. Created once
+    at the edge of a request and passed down so every stage sizes its own
+    timeout from what is left rather than from a fixed constant.
+    """
+
+    def __init__(self, budget_seconds: float):
+        self.budget = budget_seconds
+        self.expires_at = time.monotonic() + budget_seconds
+
+    @classmethod
+    def from_ms(cls, budget_ms: int) -> "Deadline":
+        return cls(budget_ms / 1000.0)
+
+    def remaining(self) -> float:
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    def timeout(self, cap: Optional[float] = None, reserve: float = 0.0) -> float:
+        """
+        Time a single call may take: what is left after holding back `reserve`
+        for the work that still has to happen afterwards, capped at `cap`.
+        """
+        available = max(self.remaining() - reserve, 0.0)
+        return min(available, cap) if cap is not None else available
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0.0
@@ -0,0 +1,81 @@
+# app/core/http_client.py
+
+from typing import Optional
+import httpx
+from app.core.config import get_settings
+from app.core.logger import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _build_client() -> httpx.AsyncClient:
+    limits = httpx.Limits(
+        max_connections=settings.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY_SECONDS
+    )
+    http2 = settings.HTTP_HTTP2
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            logger.warning("HTTP_HTTP2 is enabled but 'h2' is not installed (pip install httpx[http2]); using HTTP/1.1.")
+            http2 = False
+
+    return httpx.AsyncClient(
+        limits=limits,
+        timeout=httpx.Timeout(settings.HTTP_TIMEOUT_SECONDS),
+        http2=http2,
+        # Setting verify=False sometimes helps on Windows if local certs are missing
+        verify=settings.HTTP_VERIFY_SSL
+    )
+
+
+async def open_http_client() -> httpx.AsyncClient:
+    """
+    Opens the application-wide pooled client. Called from the FastAPI lifespan.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _build_client()
+        logger.info("🌐 Shared HTTP client opened")
+    return _client
+
+
+async def close_http_client() -> None:
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+        logger.info("🌐 Shared HTTP client closed")
+    _client = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Returns the shared client, creating it lazily when running outside the
+    app lifespan (scripts, tests). Scripts should call close_http_client() when done.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _build_client()
+    return _client
+
+
+def timeout_for(url: str) -> httpx.Timeout:
+    """
+    Per-host timeout from HTTP_HOST_TIMEOUTS, falling back to HTTP_TIMEOUT_SECONDS.
+    """
+    host = httpx.URL(url).host
+    return httpx.Timeout(settings.HTTP_HOST_TIMEOUTS.get(host, settings.HTTP_TIMEOUT_SECONDS))
+
+
+def raise_for_upstream_error(response: httpx.Response) -> None:
+    """
+    Raises for responses that mean the upstream itself is unhealthy (5xx,
+    429), as opposed to a bad request, so circuit breakers only count those.
+    """
+    if response.status_code >= 500 or response.status_code == 429:
+        response.raise_for_status()
@@ -0,0 +1,117 @@
+# app/core/metrics.py
+
+import functools
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Deque, Dict, Iterator, Tuple
+
+import numpy as np
+
+QUANTILES = (0.5, 0.95, 0.99)
+LabelKey = Tuple[Tuple[str, str], ...]
+
+HELP = {
+    "cinepulse_stage_seconds": "Latency of recommendation pipeline stages.",
+    "cinepulse_external_call_seconds": "Latency of outbound TMDB/OMDb/Gemini calls.",
+    "cinepulse_db_query_seconds": "Latency of individual database statements.",
+}
+
+
+class LatencySummary:
+    """
+    Count/sum plus a sliding window of recent samples for p50/p95/p99.
+    """
+
+    def __init__(self, window: int = 2048):
+        self.count = 0
+        self.total = 0.0
+        self.samples: Deque[float] = deque(maxlen=window)
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.samples.append(value)
+
+    def quantiles(self) -> Dict[float, float]:
+        if not self.samples:
+            return {q: 0.0 for q in QUANTILES}
+        values = np.quantile(np.fromiter(self.samples, dtype=float), QUANTILES)
+        return dict(zip(QUANTILES, values.tolist()))
+
+
+class MetricsRegistry:
+    """
+    In-process latency summaries and gauges, rendered in the Prometheus
+    text exposition format by the /metrics endpoint.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._summaries: Dict[str, Dict[LabelKey, LatencySummary]] = {}
+        self._gauges: Dict[str, Dict[LabelKey, float]] = {}
+
+    def observe(self, name: str, seconds: float, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            summary = self._summaries.setdefault(name, {}).get(key)
+            if summary is None:
+                summary = self._summaries[name][key] = LatencySummary()
+            summary.observe(seconds)
+
+    def set_gauge(self, name: str, value: float, **labels: str) -> None:
+        with self._lock:
+            self._gauges.setdefault(name, {})[tuple(sorted(labels.items()))] = value
+
+    @contextmanager
+    def timer(self, name: str, **labels: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def timed(self, name: str, **labels: str) -> Callable:
+        """
+        Decorator that times an `async def` function.
+        """
+        def decorator(fn: Callable) -> Callable:
+            @functools.wraps(fn)
+            async def wrapper(*args, **kwargs):
+                with self.timer(name, **labels):
+                    return await fn(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def render_prometheus(self) -> str:
+        lines = []
+        with self._lock:
+            for name, series in sorted(self._summaries.items()):
+                lines.append(f"# HELP {name} {HELP.get(name, name)}")
+                lines.append(f"# TYPE {name} summary")
+                for key, summary in sorted(series.items()):
+                    for q, value in summary.quantiles().items():
+                        lines.append(f"{name}{_labels(key, quantile=str(q))} {value:.6f}")
+                    lines.append(f"{name}_sum{_labels(key)} {summary.total:.6f}")
+                    lines.append(f"{name}_count{_labels(key)} {summary.count}")
+            for name, series in sorted(self._gauges.items()):
+                lines.append(f"# TYPE {name} gauge")
+                for key, value in sorted(series.items()):
+                    lines.append(f"{name}{_labels(key)} {value}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(key: LabelKey, **extra: str) -> str:
+    pairs = list(key) + list(extra.items())
+    if not pairs:
+        return ""
+    rendered = ",".join(f'{k}="{_escape(v)}"' for k, v in pairs)
+    return "{" + rendered + "}"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+metrics = MetricsRegistry()
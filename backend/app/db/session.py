@@ -1,15 +1,32 @@
 # app/db/session.py
 
-from sqlalchemy import create_engine
+import time
+from typing import Any, Dict
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from app.core.config import get_settings
+from app.db.pool_metrics import InstrumentedQueuePool, InstrumentedAsyncQueuePool
+from app.core.metrics import metrics
 
 settings = get_settings()
 
+pool_options = dict(
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    pool_pre_ping=settings.DB_POOL_PRE_PING
+)
+
 engine = create_engine(
     settings.POSTGRES_URL,
     echo=False,
-    future=True
+    future=True,
+    poolclass=InstrumentedQueuePool,
+    connect_args={"options": f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"},
+    **pool_options
 )
 
 SessionLocal = sessionmaker(
@@ -18,6 +35,44 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+# Async engine for `async def` endpoints, so queries don't block the event loop
+async_engine = create_async_engine(
+    settings.POSTGRES_ASYNC_URL,
+    echo=False,
+    poolclass=InstrumentedAsyncQueuePool,
+    connect_args={"server_settings": {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)}},
+    **pool_options
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+
+def _instrument_queries(target: Engine, label: str) -> None:
+    """
+    Records every statement's execution time in the DB latency summary.
+    """
+    # The start time lives on the per-statement execution context, so a
+    # failed statement (no after_cursor_execute) leaves nothing behind
+    @event.listens_for(target, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._query_started_at = time.perf_counter()
+
+    @event.listens_for(target, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_query_started_at", None)
+        if started is not None:
+            metrics.observe("cinepulse_db_query_seconds", time.perf_counter() - started, engine=label)
+
+
+_instrument_queries(engine, "sync")
+_instrument_queries(async_engine.sync_engine, "async")
+
 
 def get_db():
     db = SessionLocal()
@@ -25,3 +80,18 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    """
+    Live connection-pool state and checkout counters for both engines.
+    """
+    return {
+        "sync": InstrumentedQueuePool.metrics.snapshot(engine.pool),
+        "async": InstrumentedAsyncQueuePool.metrics.snapshot(async_engine.sync_engine.pool),
+    }
@@ -1,17 +1,54 @@
 # app/main.py
 
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import get_settings
 from app.core.logger import get_logger
-from app.api.v1 import recommend, research, auth, users, watchlist, chat, share
+from app.core.http_client import open_http_client, close_http_client
+from app.api.deps import verify_metrics_access
+from app.api.v1 import recommend, research, auth, users, watchlist, chat, share, search, internal
+from app.db.session import SessionLocal, get_pool_stats
+from app.core.metrics import metrics
+from app.core.circuit_breaker import circuit_states
+from app.core.concurrency import gate_stats, thread_pool_stats, shutdown_thread_pools
+from app.core.cache import cache_stats
+from app.services.catalog_service import catalog_service
+from app.services.research_jobs import research_job_queue
 
 settings = get_settings()
 logger = get_logger(__name__)
 
+
+def _warm_catalog_snapshot():
+    # Warm the in-memory catalog snapshot so the first request doesn't pay for it
+    db = SessionLocal()
+    try:
+        catalog_service.load(db)
+    except Exception as e:
+        logger.warning(f"⚠️ Could not preload catalog snapshot (will load lazily): {e}")
+    finally:
+        db.close()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await open_http_client()
+    _warm_catalog_snapshot()
+    await research_job_queue.start()
+    logger.info("🚀 CinePulse AI Movie Recommendation API started")
+    yield
+    await research_job_queue.stop()
+    await close_http_client()
+    shutdown_thread_pools()
+    logger.info("🛑 CinePulse AI Movie Recommendation API stopped")
+
+
 app = FastAPI(
     title=settings.APP_NAME,
-    debug=settings.DEBUG
+    debug=settings.DEBUG,
+    lifespan=lifespan
 )
 
 # Configure CORS - Allow frontend to communicate with backend
@@ -31,19 +68,39 @@ app.include_router(users.router, prefix=f"{settings.API_V1_STR}/users", tags=["u
 app.include_router(watchlist.router, prefix=f"{settings.API_V1_STR}/watchlist", tags=["watchlist"])
 app.include_router(chat.router, prefix=f"{settings.API_V1_STR}/chat", tags=["chat"])
 app.include_router(share.router, prefix=f"{settings.API_V1_STR}/share", tags=["share"])
+app.include_router(search.router, prefix=f"{settings.API_V1_STR}/search", tags=["search"])
+app.include_router(internal.router, prefix=f"{settings.API_V1_STR}/internal", tags=["internal"])
 
 
 @app.get("/health", tags=["Health"])
 def health_check():
-    return {"status": "ok"}
+    # Open circuits mean degraded enrichment, not an unhealthy API
+    return {"status": "ok", "circuits": circuit_states()}
 
 
-@app.on_event("startup")
-def startup_event():
-    logger.info("🚀 CinePulse AI Movie Recommendation API started")
-
-
-@app.on_event("shutdown")
-def shutdown_event():
-    logger.info("🛑 CinePulse AI Movie Recommendation API stopped")
-
+@app.get(
+    "/metrics", tags=["Health"], response_class=PlainTextResponse,
+    dependencies=[Depends(verify_metrics_access)]
+)
+def metrics_endpoint():
+    """
+    Prometheus text exposition: per-stage, external-call and DB query
+    latency (p50/p95/p99, sum, count) plus connection-pool, concurrency-gate,
+    thread-pool, cache and research-job queue gauges. Restricted like
+    /internal: scrapers send METRICS_TOKEN as a bearer token.
+    """
+    for engine_label, stats in get_pool_stats().items():
+        for key, value in stats.items():
+            metrics.set_gauge(f"cinepulse_db_pool_{key}", value, engine=engine_label)
+    for gate_name, stats in gate_stats().items():
+        for key, value in stats.items():
+            metrics.set_gauge(f"cinepulse_gate_{key}", value, gate=gate_name)
+    for pool_name, stats in thread_pool_stats().items():
+        for key, value in stats.items():
+            metrics.set_gauge(f"cinepulse_thread_pool_{key}", value, pool=pool_name)
+    for namespace, stats in cache_stats().items():
+        for key, value in stats.items():
+            metrics.set_gauge(f"cinepulse_cache_{key}", value, namespace=namespace)
+    for key, value in research_job_queue.stats().items():
+        metrics.set_gauge(f"cinepulse_research_jobs_{key}", value)
+    return PlainTextResponse(metrics.render_prometheus(), media_type="text/plain; version=0.0.4")
@@ -1,8 +1,9 @@
 # app/models/movie.py
 
 from sqlalchemy import String, Integer, JSON
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, validates
 from app.db.base import Base
+from app.utils.text import normalize_title
 
 
 class Movie(Base):
@@ -16,6 +17,12 @@ class Movie(Base):
         String(255), nullable=False, index=True
     )
 
+    normalized_title: Mapped[str] = mapped_column(
+        String(255), nullable=True, unique=True, index=True
+        # normalize_title(title); one catalog row per title.
+        # Nullable only for rows not yet backfilled (scripts/migrate_normalized_title.py)
+    )
+
     content_type: Mapped[str] = mapped_column(
         String(20), nullable=False, default="movie"
         # movie | series
@@ -78,3 +85,10 @@ class Movie(Base):
     poster_url: Mapped[str] = mapped_column(
         String, nullable=True
     )
+
+    @validates("title")
+    def _sync_normalized_title(self, key, title):
+        # Bulk Core inserts/updates bypass this and set normalized_title themselves.
+        # A title with no letters or digits has no key (NULLs don't collide)
+        self.normalized_title = (normalize_title(title) if title else "") or None
+        return title
@@ -0,0 +1,64 @@
+# app/models/research_job.py
+
+import uuid
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import String, Integer, Text, DateTime, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+from app.db.base import Base
+
+PENDING = "pending"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+
+class ResearchJob(Base):
+    __tablename__ = "research_jobs"
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+    )
+
+    title: Mapped[str] = mapped_column(
+        String(255), nullable=False
+    )
+
+    status: Mapped[str] = mapped_column(
+        String(20), nullable=False, default=PENDING, index=True
+        # pending | running | succeeded | failed
+    )
+
+    attempts: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0
+    )
+
+    movie_id: Mapped[Optional[int]] = mapped_column(
+        Integer, ForeignKey("movies.id"), nullable=True
+        # Set once the job succeeds
+    )
+
+    error: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True
+        # Last failure, kept while retrying
+    )
+
+    available_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+        # Not claimable before this (retry backoff)
+    )
+
+    lease_expires_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+        # While running: renewed by the worker's heartbeat. Once it lapses
+        # the job counts as orphaned and may be claimed again
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
@@ -2,9 +2,11 @@
 
 from typing import List, Optional
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.models.movie import Movie
+from app.services.catalog_service import catalog_service
 
 
 class MovieRepository:
@@ -30,6 +32,17 @@ class MovieRepository:
         result = db.execute(stmt)
         return result.scalars().first()
 
+    @staticmethod
+    def get_by_ids(db: Session, movie_ids: List[int]) -> List[Movie]:
+        """
+        Fetch several movies in one query, preserving the order of `movie_ids`.
+        """
+        if not movie_ids:
+            return []
+        stmt = select(Movie).where(Movie.id.in_(movie_ids))
+        by_id = {movie.id: movie for movie in db.execute(stmt).scalars().all()}
+        return [by_id[mid] for mid in movie_ids if mid in by_id]
+
     @staticmethod
     def search_by_title(
         db: Session,
@@ -37,15 +50,13 @@ class MovieRepository:
         limit: int = 10
     ) -> List[Movie]:
         """
-        Search movies by title (case-insensitive).
+        Typo-tolerant title search, best match first. Candidates come from the
+        catalog snapshot's trigram index (no `ILIKE '%q%'` table scan); only
+        the hits are fetched from the database.
         """
-        stmt = (
-            select(Movie)
-            .where(Movie.title.ilike(f"%{query}%"))
-            .limit(limit)
-        )
-        result = db.execute(stmt)
-        return result.scalars().all()
+        catalog = catalog_service.get_snapshot(db)
+        movie_ids = [hit.id for hit in catalog.search_titles(query, limit)]
+        return MovieRepository.get_by_ids(db, movie_ids)
 
     @staticmethod
     def filter_by_constraints(
@@ -90,3 +101,55 @@ class MovieRepository:
         db.refresh(movie)
         return movie
 
+
+class AsyncMovieRepository:
+    """
+    AsyncSession counterpart of MovieRepository for `async def` code paths.
+    """
+
+    @staticmethod
+    async def get_by_id(db: AsyncSession, movie_id: int) -> Optional[Movie]:
+        stmt = select(Movie).where(Movie.id == movie_id)
+        result = await db.execute(stmt)
+        return result.scalars().first()
+
+    @staticmethod
+    async def get_by_ids(db: AsyncSession, movie_ids: List[int]) -> List[Movie]:
+        """
+        Fetch several movies in one query, preserving the order of `movie_ids`.
+        """
+        if not movie_ids:
+            return []
+        stmt = select(Movie).where(Movie.id.in_(movie_ids))
+        result = await db.execute(stmt)
+        by_id = {movie.id: movie for movie in result.scalars().all()}
+        return [by_id[mid] for mid in movie_ids if mid in by_id]
+
+    @staticmethod
+    async def search_by_title(
+        db: AsyncSession,
+        query: str,
+        limit: int = 10
+    ) -> List[Movie]:
+        catalog = await catalog_service.get_snapshot_async()
+        movie_ids = [hit.id for hit in catalog.search_titles(query, limit)]
+        return await AsyncMovieRepository.get_by_ids(db, movie_ids)
+
+    @staticmethod
+    async def get_by_normalized_title(db: AsyncSession, normalized_title: str) -> Optional[Movie]:
+        stmt = select(Movie).where(Movie.normalized_title == normalized_title)
+        result = await db.execute(stmt)
+        return result.scalars().first()
+
+    @staticmethod
+    async def get_by_tmdb_id(db: AsyncSession, tmdb_id: int) -> Optional[Movie]:
+        stmt = select(Movie).where(Movie.tmdb_id == tmdb_id)
+        result = await db.execute(stmt)
+        return result.scalars().first()
+
+    @staticmethod
+    async def save(db: AsyncSession, movie: Movie) -> Movie:
+        db.add(movie)
+        await db.commit()
+        await db.refresh(movie)
+        return movie
@@ -0,0 +1,111 @@
+from datetime import datetime, timedelta, timezone
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, or_, select, update
+from app.models.research_job import ResearchJob, PENDING, RUNNING, FAILED
+from typing import Any, List, Optional, Tuple
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+def _claimable(now: datetime):
+    # Pending and due, or running under a lease nobody renewed
+    return or_(
+        and_(
+            ResearchJob.status == PENDING,
+            or_(ResearchJob.available_at.is_(None), ResearchJob.available_at <= now)
+        ),
+        and_(
+            ResearchJob.status == RUNNING,
+            or_(ResearchJob.lease_expires_at.is_(None), ResearchJob.lease_expires_at < now)
+        )
+    )
+
+class AsyncResearchJobRepository:
+    @staticmethod
+    async def create(db: AsyncSession, job: ResearchJob) -> ResearchJob:
+        db.add(job)
+        await db.commit()
+        await db.refresh(job)
+        return job
+
+    @staticmethod
+    async def get_by_id(db: AsyncSession, job_id: str) -> Optional[ResearchJob]:
+        stmt = select(ResearchJob).where(ResearchJob.id == job_id)
+        result = await db.execute(stmt)
+        return result.scalars().first()
+
+    @staticmethod
+    async def get_claimable_ids(db: AsyncSession, max_attempts: int) -> List[str]:
+        now = utcnow()
+        stmt = (
+            select(ResearchJob.id)
+            .where(_claimable(now), ResearchJob.attempts < max_attempts)
+            .order_by(ResearchJob.created_at)
+        )
+        result = await db.execute(stmt)
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def claim(db: AsyncSession, job_id: str, max_attempts: int, lease_seconds: float) -> Optional[Tuple[str, int]]:
+        """
+        Atomically moves a claimable job to running and starts its lease.
+        Returns (title, attempt) or None if another worker has it, it is
+        finished, or it is not due yet.
+        """
+        now = utcnow()
+        stmt = (
+            update(ResearchJob)
+            .where(ResearchJob.id == job_id, _claimable(now), ResearchJob.attempts < max_attempts)
+            .values(
+                status=RUNNING,
+                attempts=ResearchJob.attempts + 1,
+                available_at=None,
+                lease_expires_at=now + timedelta(seconds=lease_seconds)
+            )
+            .returning(ResearchJob.title, ResearchJob.attempts)
+        )
+        row = (await db.execute(stmt)).first()
+        await db.commit()
+        return (row.title, row.attempts) if row else None
+
+    @staticmethod
+    async def extend_lease(db: AsyncSession, job_id: str, attempt: int, lease_seconds: float) -> bool:
+        stmt = (
+            update(ResearchJob)
+            .where(ResearchJob.id == job_id, ResearchJob.status == RUNNING, ResearchJob.attempts == attempt)
+            .values(lease_expires_at=utcnow() + timedelta(seconds=lease_seconds))
+        )
+        result = await db.execute(stmt)
+        await db.commit()
+        return result.rowcount == 1
+
+    @staticmethod
+    async def finish_attempt(db: AsyncSession, job_id: str, attempt: int, **values: Any) -> bool:
+        """
+        Records the outcome of one attempt, only if this worker still holds
+        it (the lease may have lapsed and the job been re-claimed).
+        """
+        stmt = (
+            update(ResearchJob)
+            .where(ResearchJob.id == job_id, ResearchJob.status == RUNNING, ResearchJob.attempts == attempt)
+            .values(lease_expires_at=None, **values)
+        )
+        result = await db.execute(stmt)
+        await db.commit()
+        return result.rowcount == 1
+
+    @staticmethod
+    async def fail_orphaned(db: AsyncSession, max_attempts: int) -> int:
+        # Orphaned with no attempts left (e.g. the title keeps killing workers)
+        stmt = (
+            update(ResearchJob)
+            .where(
+                ResearchJob.status == RUNNING,
+                ResearchJob.attempts >= max_attempts,
+                or_(ResearchJob.lease_expires_at.is_(None), ResearchJob.lease_expires_at < utcnow())
+            )
+            .values(status=FAILED, lease_expires_at=None, error="Worker stopped before the last attempt finished")
+        )
+        result = await db.execute(stmt)
+        await db.commit()
+        return result.rowcount
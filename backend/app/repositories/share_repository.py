@@ -1,4 +1,5 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.models.share import Share
 from typing import Optional
@@ -16,3 +17,18 @@ class ShareRepository:
         stmt = select(Share).where(Share.id == share_id)
         result = db.execute(stmt)
         return result.scalars().first()
+
+
+class AsyncShareRepository:
+    @staticmethod
+    async def create(db: AsyncSession, share: Share) -> Share:
+        db.add(share)
+        await db.commit()
+        await db.refresh(share)
+        return share
+
+    @staticmethod
+    async def get_by_id(db: AsyncSession, share_id: str) -> Optional[Share]:
+        stmt = select(Share).where(Share.id == share_id)
+        result = await db.execute(stmt)
+        return result.scalars().first()
@@ -2,6 +2,7 @@
 
 from typing import Optional, List
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
@@ -47,3 +48,46 @@ class UserRepository:
         db.commit()
         db.refresh(db_obj)
         return db_obj
+
+
+class AsyncUserRepository:
+    @staticmethod
+    async def get_by_email(db: AsyncSession, email: str) -> Optional[User]:
+        stmt = select(User).where(User.email == email)
+        result = await db.execute(stmt)
+        return result.scalars().first()
+
+    @staticmethod
+    async def get_by_id(db: AsyncSession, user_id: int) -> Optional[User]:
+        stmt = select(User).where(User.id == user_id)
+        result = await db.execute(stmt)
+        return result.scalars().first()
+
+    @staticmethod
+    async def create(db: AsyncSession, obj_in: UserCreate) -> User:
+        # Note: bcrypt hashing is CPU-bound; call from a worker thread on hot paths
+        db_obj = User(
+            email=obj_in.email,
+            hashed_password=get_password_hash(obj_in.password),
+            full_name=obj_in.full_name,
+            is_active=True,
+            is_superuser=False
+        )
+        db.add(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
+        return db_obj
+
+    @staticmethod
+    async def update(db: AsyncSession, db_obj: User, obj_in: UserUpdate) -> User:
+        if obj_in.email:
+            db_obj.email = obj_in.email
+        if obj_in.full_name:
+            db_obj.full_name = obj_in.full_name
+        if obj_in.password:
+            db_obj.hashed_password = get_password_hash(obj_in.password)
+
+        db.add(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
+        return db_obj
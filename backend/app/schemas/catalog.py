@@ -0,0 +1,28 @@
+# app/schemas/catalog.py
+
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+class CatalogRecord(BaseModel):
+    """
+    One movie/series entry from a catalog dump (JSON, JSONL or CSV).
+    """
+    title: str = Field(min_length=1, max_length=255)
+    overview: str
+    runtime: Optional[int] = Field(None, ge=0)
+    genres: List[str]
+    content_type: str = Field("movie", alias="type", max_length=20)
+    emotional_arc: List[str]
+    ending_type: str = Field(max_length=50)
+    pace: str = Field(max_length=50)
+    tone: str = Field(max_length=50)
+    release_year: Optional[int] = None
+    trailer_url: Optional[str] = None
+    streaming_platforms: List[dict] = []
+    backdrop_url: Optional[str] = None
+    tmdb_id: Optional[int] = None
+    poster_url: Optional[str] = None
+
+    class Config:
+        populate_by_name = True
+        extra = "ignore"
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional
 
 class RecommendationRequest(BaseModel):
@@ -6,3 +6,6 @@ class RecommendationRequest(BaseModel):
     intent: Optional[str] = None
     personality: Optional[str] = None
     context: Optional[dict] = None
+    limit: int = Field(3, ge=1, le=20) # Number of recommendations to return
+    offset: int = Field(0, ge=0, le=200) # Rank offset for paging deeper
+    budget_ms: Optional[int] = Field(None, ge=100, le=30000) # Overrides RECOMMENDATION_BUDGET_MS
@@ -15,8 +15,10 @@ class MovieRecommendation(BaseModel):
     reasons: List[str]
     reasoning: str # Keep for backward compat or detailed text
     alignmentScores: Optional[Dict[str, float]] = None
+    degraded: List[str] = [] # Parts served from fallbacks: "reasoning", "streaming"
 
 class RecommendationResponse(BaseModel):
     recommendations: List[MovieRecommendation]
     explanation: str
+    degraded: List[str] = [] # Union of the per-recommendation degraded parts
 
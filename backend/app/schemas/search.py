@@ -0,0 +1,22 @@
+# app/schemas/search.py
+
+from pydantic import BaseModel
+from typing import List, Optional
+
+class TitleSuggestion(BaseModel):
+    id: int
+    title: str
+    score: float # 0-1, higher is a closer match
+
+class TitleSearchResult(TitleSuggestion):
+    year: Optional[int] = None
+    poster: Optional[str] = None
+    content_type: str = "movie"
+
+class TitleSearchResponse(BaseModel):
+    query: str
+    results: List[TitleSearchResult] = []
+
+class AutocompleteResponse(BaseModel):
+    query: str
+    suggestions: List[TitleSuggestion] = []
@@ -0,0 +1,223 @@
+# app/services/catalog_loader.py
+
+import csv
+import json
+import time
+from typing import Any, Dict, Iterator, List, Optional, TextIO
+
+from pydantic import ValidationError
+from sqlalchemy import insert, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.models.movie import Movie
+from app.schemas.catalog import CatalogRecord
+from app.utils.text import normalize_title
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+LIST_FIELDS = ("genres", "emotional_arc", "streaming_platforms")
+
+
+def _iter_json_array(f: TextIO, read_size: int = 1 << 16) -> Iterator[Any]:
+    """
+    Incrementally decodes a top-level JSON array without loading the whole file.
+    """
+    decoder = json.JSONDecoder()
+    buffer = f.read(read_size)
+    eof = not buffer
+    position = 0
+    started = False
+
+    def read_more():
+        nonlocal buffer, position, eof
+        chunk = f.read(read_size)
+        eof = not chunk
+        buffer = buffer[position:] + chunk
+        position = 0
+
+    while True:
+        # Skip whitespace and separators, refilling the buffer as needed
+        while True:
+            while position < len(buffer) and (buffer[position].isspace() or buffer[position] == ","):
+                position += 1
+            if position < len(buffer) or eof:
+                break
+            read_more()
+        if position >= len(buffer):
+            raise ValueError("Unexpected end of JSON array")
+
+        if not started:
+            if buffer[position] != "[":
+                raise ValueError("Expected a JSON array at the top level")
+            started = True
+            position += 1
+            continue
+        if buffer[position] == "]":
+            return
+
+        try:
+            item, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            read_more()
+            continue
+        if end == len(buffer) and not eof:
+            # The value may have been cut at the buffer boundary; re-decode with more input
+            read_more()
+            continue
+        yield item
+        position = end
+
+
+def _iter_jsonl(f: TextIO) -> Iterator[Any]:
+    for line in f:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def _iter_csv(f: TextIO) -> Iterator[Dict[str, Any]]:
+    for row in csv.DictReader(f):
+        record: Dict[str, Any] = {}
+        for key, value in row.items():
+            if value is None or value == "":
+                continue
+            if key in LIST_FIELDS:
+                # Either a JSON list or a pipe-separated string ("Drama|Crime")
+                value = json.loads(value) if value.lstrip().startswith("[") else value.split("|")
+            record[key] = value
+        yield record
+
+
+def iter_catalog_records(path: str, fmt: Optional[str] = None) -> Iterator[Any]:
+    """
+    Streams raw records from a JSON array, JSONL or CSV catalog dump.
+    """
+    fmt = fmt or path.rsplit(".", 1)[-1].lower()
+    readers = {"json": _iter_json_array, "jsonl": _iter_jsonl, "ndjson": _iter_jsonl, "csv": _iter_csv}
+    if fmt not in readers:
+        raise ValueError(f"Unsupported catalog format: {fmt}")
+
+    with open(path, "r", encoding="utf-8", newline="" if fmt == "csv" else None) as f:
+        yield from readers[fmt](f)
+
+
+class CatalogLoader:
+    """
+    Bulk importer for catalog dumps. Records are validated, grouped into
+    batches and written with one existence lookup plus one multi-row
+    INSERT and one bulk UPDATE per batch, matching existing rows on
+    `tmdb_id` first and then on the normalized title (which is unique).
+    Only the fields present in a record are written: updates leave the
+    other columns alone and inserts use the column defaults for them.
+    """
+
+    def __init__(self, db: Session, batch_size: int = 1000, update_existing: bool = True):
+        self.db = db
+        self.batch_size = batch_size
+        self.update_existing = update_existing
+        self.stats = {"inserted": 0, "updated": 0, "skipped": 0, "invalid": 0}
+
+    def load(self, records: Iterator[Any]) -> Dict[str, Any]:
+        started = time.perf_counter()
+        batch: List[Dict[str, Any]] = []
+
+        for line_no, raw in enumerate(records, start=1):
+            try:
+                record = CatalogRecord.model_validate(raw)
+            except ValidationError as e:
+                self.stats["invalid"] += 1
+                logger.warning(f"⚠️ Skipping invalid record #{line_no}: {e.errors()[0].get('msg')}")
+                continue
+
+            # Only the fields the dump supplies: a missing key must neither
+            # overwrite an existing column (e.g. a synced poster) with NULL
+            # nor replace a column default on insert
+            row = record.model_dump(exclude_unset=True)
+            row["normalized_title"] = normalize_title(row["title"]) or None
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                self._write_batch(batch)
+                batch = []
+                self._log_progress(started)
+
+        if batch:
+            self._write_batch(batch)
+
+        elapsed = time.perf_counter() - started
+        written = self.stats["inserted"] + self.stats["updated"]
+        result = {**self.stats, "seconds": round(elapsed, 2), "rows_per_second": round(written / elapsed, 1) if elapsed else 0.0}
+        logger.info(f"✅ Catalog load complete: {result}")
+        return result
+
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        # Last occurrence wins for duplicates inside one batch; the normalized
+        # title is unique in the table, so it is also unique per batch.
+        # Rows without one (no letters or digits) are never deduped by title
+        by_key: Dict[Any, Dict[str, Any]] = {}
+        keyless: List[Dict[str, Any]] = []
+        for row in batch:
+            if row["normalized_title"]:
+                by_key[row["normalized_title"]] = row
+            else:
+                keyless.append(row)
+        rows = list(by_key.values()) + keyless
+
+        normalized_titles = [row["normalized_title"] for row in rows if row["normalized_title"]]
+        tmdb_ids = [row["tmdb_id"] for row in rows if row.get("tmdb_id")]
+        stmt = select(Movie.id, Movie.normalized_title, Movie.tmdb_id).where(
+            or_(Movie.normalized_title.in_(normalized_titles), Movie.tmdb_id.in_(tmdb_ids))
+        )
+        existing_by_title: Dict[str, int] = {}
+        existing_by_tmdb: Dict[int, int] = {}
+        for movie_id, normalized_title, tmdb_id in self.db.execute(stmt):
+            if normalized_title:
+                existing_by_title.setdefault(normalized_title, movie_id)
+            if tmdb_id:
+                existing_by_tmdb.setdefault(tmdb_id, movie_id)
+
+        inserts: List[Dict[str, Any]] = []
+        updates: List[Dict[str, Any]] = []
+        for row in rows:
+            movie_id = existing_by_tmdb.get(row.get("tmdb_id")) or existing_by_title.get(row["normalized_title"])
+            if movie_id is None:
+                inserts.append(row)
+            elif self.update_existing:
+                updates.append({"id": movie_id, **row})
+            else:
+                self.stats["skipped"] += 1
+
+        try:
+            if inserts:
+                self.db.execute(insert(Movie), inserts)
+            if updates:
+                self.db.execute(update(Movie), updates)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        self.stats["inserted"] += len(inserts)
+        self.stats["updated"] += len(updates)
+        self.stats["skipped"] += len(batch) - len(rows)
+
+    def _log_progress(self, started: float) -> None:
+        elapsed = time.perf_counter() - started
+        written = self.stats["inserted"] + self.stats["updated"]
+        logger.info(
+            f"📦 {written} rows written ({self.stats['inserted']} new, {self.stats['updated']} updated), "
+            f"{written / elapsed:.0f} rows/s"
+        )
+
+
+def load_catalog_file(
+    db: Session,
+    path: str,
+    fmt: Optional[str] = None,
+    batch_size: int = 1000,
+    update_existing: bool = True
+) -> Dict[str, Any]:
+    loader = CatalogLoader(db, batch_size=batch_size, update_existing=update_existing)
+    return loader.load(iter_catalog_records(path, fmt))
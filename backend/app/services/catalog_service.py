@@ -0,0 +1,321 @@
+# app/services/catalog_service.py
+
+import asyncio
+import threading
+import time
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from app.models.movie import Movie
+from app.db.session import SessionLocal
+from app.utils.text import normalize_title
+from app.services.title_index import TitleHit, TitleIndex
+from app.core.config import get_settings
+from app.core.logger import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+CATEGORICAL_COLUMNS = ("tone", "pace", "ending_type")
+MISSING_CODE = -1
+
+
+class CatalogSnapshot:
+    """
+    Immutable, columnar copy of the fields the recommend hot path filters
+    and scores on. Categorical columns are stored as small int codes so
+    constraint filtering is a single vectorized mask. Titles are kept with
+    a normalized-title index for exact catalog lookups, and a fuzzy
+    TitleIndex for search, autocomplete and approximate matches. The index
+    is built with the snapshot, so it is never built on a request: the
+    service loads snapshots off the event loop and only then swaps them in.
+    """
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        runtimes: np.ndarray,
+        codes: Dict[str, np.ndarray],
+        vocab: Dict[str, List[str]],
+        genre_matrix: np.ndarray,
+        genre_vocab: List[str],
+        titles: Optional[List[str]] = None,
+        version: int = 0,
+        generation: int = 0
+    ):
+        self.ids = ids
+        self.runtimes = runtimes
+        self.codes = codes
+        self.vocab = vocab
+        self.genre_matrix = genre_matrix
+        self.genre_vocab = genre_vocab
+        self.titles = titles or []
+        self.version = version
+        # Incremented on every load; lets dependent caches detect any reload
+        self.generation = generation
+        self._code_lookup = {
+            column: {value: code for code, value in enumerate(values)}
+            for column, values in vocab.items()
+        }
+        self._genre_lookup = {genre: i for i, genre in enumerate(genre_vocab)}
+        # normalized title -> row index; the lowest id wins for duplicates.
+        # Titles that normalize to "" (punctuation only) have no key
+        self.title_index: Dict[str, int] = {}
+        for i, title in enumerate(self.titles):
+            normalized = normalize_title(title) if title else ""
+            if normalized:
+                self.title_index.setdefault(normalized, i)
+        self.title_search = TitleIndex(ids.tolist(), self.titles)
+
+    def __len__(self) -> int:
+        return int(self.ids.shape[0])
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Sequence], version: int = 0, generation: int = 0) -> "CatalogSnapshot":
+        """
+        Builds a snapshot from (id, runtime, tone, pace, ending_type, genres[, title]) tuples.
+        """
+        n = len(rows)
+        ids = np.fromiter((r[0] for r in rows), dtype=np.int64, count=n)
+        runtimes = np.fromiter(
+            (r[1] if r[1] is not None else MISSING_CODE for r in rows),
+            dtype=np.int32, count=n
+        )
+
+        vocab: Dict[str, List[str]] = {}
+        codes: Dict[str, np.ndarray] = {}
+        for offset, column in enumerate(CATEGORICAL_COLUMNS, start=2):
+            lookup: Dict[str, int] = {}
+            column_codes = np.empty(n, dtype=np.int16)
+            for i, row in enumerate(rows):
+                value = row[offset]
+                if value is None:
+                    column_codes[i] = MISSING_CODE
+                else:
+                    column_codes[i] = lookup.setdefault(value, len(lookup))
+            vocab[column] = list(lookup)
+            codes[column] = column_codes
+
+        genre_lookup: Dict[str, int] = {}
+        for row in rows:
+            for genre in row[5] or []:
+                genre_lookup.setdefault(genre, len(genre_lookup))
+        genre_matrix = np.zeros((n, len(genre_lookup)), dtype=bool)
+        for i, row in enumerate(rows):
+            for genre in row[5] or []:
+                genre_matrix[i, genre_lookup[genre]] = True
+
+        titles = [row[6] if len(row) > 6 else None for row in rows]
+
+        return cls(ids, runtimes, codes, vocab, genre_matrix, list(genre_lookup), titles, version, generation)
+
+    def code(self, column: str, value: Optional[str]) -> int:
+        """
+        Returns the int code for a categorical value, or MISSING_CODE if unseen.
+        """
+        if value is None:
+            return MISSING_CODE
+        return self._code_lookup[column].get(value, MISSING_CODE)
+
+    def find_title(self, title: str) -> Optional[int]:
+        """
+        Movie id whose normalized title equals the given title's, if any.
+        """
+        normalized = normalize_title(title)
+        index = self.title_index.get(normalized) if normalized else None
+        return int(self.ids[index]) if index is not None else None
+
+    def match_title(self, title: str, max_edits: int = settings.TITLE_MATCH_MAX_EDITS) -> Optional[int]:
+        """
+        Movie id for a title mention: exact normalized match, else the
+        closest title within a few typos.
+        """
+        movie_id = self.find_title(title)
+        if movie_id is None:
+            movie_id = self.title_search.best_match(title, max_edits)
+        return movie_id
+
+    def search_titles(self, query: str, limit: int = 10, min_score: float = settings.TITLE_SEARCH_MIN_SCORE) -> List[TitleHit]:
+        return self.title_search.search(query, limit, min_score)
+
+    def autocomplete_titles(self, prefix: str, limit: int = 10, min_score: float = settings.TITLE_SEARCH_MIN_SCORE) -> List[TitleHit]:
+        """
+        Prefix matches first; a short list is topped up with fuzzy matches
+        so a typo in the prefix still suggests something.
+        """
+        hits = self.title_search.autocomplete(prefix, limit)
+        if len(hits) < limit:
+            seen = {hit.id for hit in hits}
+            for hit in self.title_search.search(prefix, limit, min_score):
+                if hit.id not in seen and len(hits) < limit:
+                    hits.append(hit)
+        return hits
+
+    def filter(
+        self,
+        *,
+        max_runtime: Optional[int] = None,
+        pace: Optional[str] = None,
+        ending_type: Optional[str] = None,
+        tone: Optional[str] = None,
+        exclude_genres: Optional[Sequence[str]] = None
+    ) -> np.ndarray:
+        """
+        Vectorized equivalent of MovieRepository.filter_by_constraints.
+        Returns the row indices (in catalog order) that pass every constraint.
+        """
+        mask = np.ones(len(self), dtype=bool)
+
+        if max_runtime is not None:
+            # Mirrors SQL semantics: NULL runtimes never satisfy `runtime <= x`
+            mask &= (self.runtimes != MISSING_CODE) & (self.runtimes <= max_runtime)
+
+        for column, value in (("pace", pace), ("ending_type", ending_type), ("tone", tone)):
+            if value is not None:
+                code = self.code(column, value)
+                if code == MISSING_CODE:
+                    return np.empty(0, dtype=np.int64)
+                mask &= self.codes[column] == code
+
+        if exclude_genres:
+            columns = [self._genre_lookup[g] for g in exclude_genres if g in self._genre_lookup]
+            if columns:
+                mask &= ~self.genre_matrix[:, columns].any(axis=1)
+
+        return np.flatnonzero(mask)
+
+
+class CatalogService:
+    """
+    Owns the process-wide CatalogSnapshot. The snapshot is loaded at startup
+    and reloaded lazily when the catalog version is bumped (any committed Movie
+    change in this process) or when it is older than CATALOG_REFRESH_SECONDS
+    (to pick up writes made by other workers or scripts).
+
+    Only one reload runs at a time. While it runs, callers keep getting the
+    current snapshot (stale-while-revalidate); async callers never load on
+    the event loop, the reload runs in a worker thread on its own session.
+    Only the very first load is awaited.
+    """
+
+    def __init__(self, refresh_seconds: int = settings.CATALOG_REFRESH_SECONDS):
+        self.refresh_seconds = refresh_seconds
+        self._lock = threading.Lock()
+        # Held for the whole of a reload, so concurrent reloads never stack up
+        self._reload_lock = threading.Lock()
+        self._version = 0
+        self._generation = 0
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._loaded_at = 0.0
+        self._refresh_task: Optional[asyncio.Future] = None
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def bump_version(self) -> None:
+        with self._lock:
+            self._version += 1
+
+    def is_stale(self) -> bool:
+        snapshot = self._snapshot
+        return (
+            snapshot is None
+            or snapshot.version != self._version
+            or time.monotonic() - self._loaded_at > self.refresh_seconds
+        )
+
+    def load(self, db: Session) -> CatalogSnapshot:
+        """
+        Reads only the columns needed for filtering/scoring/title lookup, skipping ORM hydration.
+        The snapshot (title index included) is fully built before it replaces the current one.
+        """
+        started = time.perf_counter()
+        version = self._version
+        stmt = select(
+            Movie.id, Movie.runtime, Movie.tone, Movie.pace, Movie.ending_type, Movie.genres, Movie.title
+        ).order_by(Movie.id)
+        rows = db.execute(stmt).all()
+
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+        snapshot = CatalogSnapshot.from_rows(rows, version=version, generation=generation)
+
+        with self._lock:
+            self._snapshot = snapshot
+            self._loaded_at = time.monotonic()
+
+        logger.info(
+            f"📦 Catalog snapshot loaded: {len(snapshot)} titles "
+            f"(version {version}) in {(time.perf_counter() - started) * 1000:.1f} ms"
+        )
+        return snapshot
+
+    def get_snapshot(self, db: Session) -> CatalogSnapshot:
+        snapshot = self._snapshot
+        if not self.is_stale():
+            return snapshot
+        # Someone else is already reloading: the current snapshot will do
+        if not self._reload_lock.acquire(blocking=snapshot is None):
+            return snapshot
+        try:
+            if not self.is_stale():
+                return self._snapshot
+            return self.load(db)
+        finally:
+            self._reload_lock.release()
+
+    async def get_snapshot_async(self) -> CatalogSnapshot:
+        snapshot = self._snapshot
+        if snapshot is not None and not self.is_stale():
+            return snapshot
+
+        task = self._refresh_task
+        if task is None or task.done():
+            task = self._refresh_task = asyncio.ensure_future(asyncio.to_thread(self._refresh))
+            task.add_done_callback(self._log_refresh_failure)
+        if snapshot is not None:
+            return snapshot
+        # Nothing to serve yet: wait for the first load (shielded, so one
+        # cancelled request doesn't abort it for everyone else)
+        return await asyncio.shield(task)
+
+    def _refresh(self) -> CatalogSnapshot:
+        with self._reload_lock:
+            if not self.is_stale():
+                return self._snapshot
+            db = SessionLocal()
+            try:
+                return self.load(db)
+            finally:
+                db.close()
+
+    @staticmethod
+    def _log_refresh_failure(task: asyncio.Future) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"❌ Catalog snapshot reload failed: {task.exception()}")
+
+
+catalog_service = CatalogService()
+
+
+@event.listens_for(Session, "after_flush")
+def _track_movie_changes(session: Session, flush_context) -> None:
+    changed = (session.new, session.dirty, session.deleted)
+    if any(isinstance(obj, Movie) for objs in changed for obj in objs):
+        session.info["catalog_changed"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_catalog_version_on_commit(session: Session) -> None:
+    if session.info.pop("catalog_changed", False):
+        catalog_service.bump_version()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_catalog_changes(session: Session) -> None:
+    session.info.pop("catalog_changed", None)
@@ -1,23 +1,116 @@
 # app/services/chat_service.py
 
+import asyncio
 import json
-from typing import List, Dict, Any, Optional
+import re
+from typing import List, Dict, Any, Optional, AsyncIterator, Tuple
 from app.services.gemini_service import GeminiService
 from app.services.data_sync_service import DataSyncService
+from app.services.catalog_service import catalog_service
+from app.repositories.movie_repository import AsyncMovieRepository
+from app.db.session import AsyncSessionLocal
 from app.core.logger import get_logger
 
 logger = get_logger(__name__)
 
+MAX_SUGGESTED_MOVIES = 3 # Limit to 3 enriched movies
+TITLE_MENTION_PATTERN = re.compile(r"\[\[(.*?)\]\]")
+
 class ChatService:
     def __init__(self):
         self.gemini = GeminiService()
         self.data_sync = DataSyncService()
-        
+
     async def get_chat_response(self, messages: List[Dict[str, str]], context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Processes a chat conversation and returns a cinematic response.
         Also attempts to extract and enrich movie mentions.
         """
+        full_prompt = self._build_prompt(messages, context)
+
+        response_text = await self.gemini.generate_raw_text(full_prompt)
+
+        # Extract movies wrapped in [[Title]]
+        movie_titles = TITLE_MENTION_PATTERN.findall(response_text)
+        titles = list(dict.fromkeys(movie_titles))[:MAX_SUGGESTED_MOVIES]
+
+        enriched = await self._enrich_titles(titles)
+        suggested_movies = [enriched[title] for title in titles if title in enriched]
+
+        return {
+            "message": {"role": "assistant", "content": response_text},
+            "suggested_movies": suggested_movies
+        }
+
+    async def stream_chat_response(
+        self,
+        messages: List[Dict[str, str]],
+        context: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Streaming variant of get_chat_response. Yields (event, data) pairs:
+        "token" for each chunk of the reply as it arrives, "suggested_movie"
+        as soon as each [[Title]] lookup finishes (lookups start the moment a
+        title is complete in the stream), then a final "done" with the full
+        message and suggestions in mention order.
+        """
+        full_prompt = self._build_prompt(messages, context)
+        events: asyncio.Queue = asyncio.Queue()
+        lookups: List[asyncio.Task] = []
+        enriched: Dict[str, Dict[str, Any]] = {}
+        titles: List[str] = []
+        reply: List[str] = []
+
+        async def enrich(title: str) -> None:
+            try:
+                movie = (await self._enrich_titles([title])).get(title)
+            except Exception as e:
+                logger.error(f"❌ Error enriching '{title}': {e}")
+                return
+            if movie:
+                enriched[title] = movie
+                await events.put(("suggested_movie", movie))
+
+        async def pump() -> None:
+            scanned = 0
+            try:
+                async for text in self.gemini.stream_raw_text(full_prompt):
+                    reply.append(text)
+                    await events.put(("token", {"text": text}))
+
+                    # Only look at text after the last complete mention; an
+                    # unterminated "[[Tit" is picked up once its "]]" arrives
+                    for match in TITLE_MENTION_PATTERN.finditer("".join(reply), scanned):
+                        title = match.group(1)
+                        if title not in titles and len(titles) < MAX_SUGGESTED_MOVIES:
+                            titles.append(title)
+                            lookups.append(asyncio.create_task(enrich(title)))
+                        scanned = match.end()
+
+                await asyncio.gather(*lookups)
+            finally:
+                await events.put(None)
+
+        producer = asyncio.create_task(pump())
+        try:
+            while True:
+                event = await events.get()
+                if event is None:
+                    break
+                yield event
+            await producer
+
+            yield "done", {
+                "message": {"role": "assistant", "content": "".join(reply)},
+                "suggested_movies": [enriched[title] for title in titles if title in enriched]
+            }
+        finally:
+            # Client went away (or we finished): stop the LLM stream and any pending lookups
+            producer.cancel()
+            for task in lookups:
+                task.cancel()
+
+    def _build_prompt(self, messages: List[Dict[str, str]], context: Optional[Dict[str, Any]]) -> str:
         system_prompt = """You are a friendly movie and TV series recommendation assistant called "CinePulse Assistant".
 
 IMPORTANT RULES:
@@ -36,36 +129,64 @@ RESPONSE STYLE:
 - It's okay to ask clarifying questions to give better recommendations
 
 User context: """ + str(context or "No specific context.")
-        
+
         # Convert messages to Gemini format (if needed, or pass as custom prompt)
         # For simplicity, we'll build a prompt from the history
         prompt_parts = [system_prompt]
         for msg in messages:
             role = "User: " if msg['role'] == 'user' else "Assistant: "
             prompt_parts.append(f"{role}{msg['content']}")
-        
+
         prompt_parts.append("Assistant: ")
-        full_prompt = "\n".join(prompt_parts)
-        
-        response_text = await self.gemini.generate_raw_text(full_prompt)
-        
-        # Extract movies wrapped in [[Title]]
-        import re
-        movie_titles = re.findall(r'\[\[(.*?)\]\]', response_text)
-        
-        suggested_movies = []
-        for title in list(set(movie_titles))[:3]: # Limit to 3 enriched movies
-            results = await self.data_sync.search_tmdb_movies(title)
-            if results:
-                match = results[0]
-                suggested_movies.append({
-                    "id": match.get('id'),
-                    "title": match.get('title'),
-                    "poster": f"https://image.tmdb.org/t/p/w200{match.get('poster_path')}" if match.get('poster_path') else None,
-                    "year": match.get('release_date', '').split('-')[0] if match.get('release_date') else None
-                })
-        
+        return "\n".join(prompt_parts)
+
+    async def _enrich_titles(self, titles: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Resolves titles against our own catalog first (exact, then fuzzy title
+        match on the in-memory snapshot, then one batched row fetch); only the
+        misses go to TMDB, concurrently.
+        """
+        found = await self._lookup_catalog(titles)
+        misses = [title for title in titles if title not in found]
+        if misses:
+            results = await asyncio.gather(*(self._search_tmdb(title) for title in misses))
+            found.update({title: movie for title, movie in zip(misses, results) if movie})
+        return found
+
+    async def _lookup_catalog(self, titles: List[str]) -> Dict[str, Dict[str, Any]]:
+        try:
+            async with AsyncSessionLocal() as db:
+                catalog = await catalog_service.get_snapshot_async()
+                movie_ids = {title: catalog.match_title(title) for title in titles}
+                movies = await AsyncMovieRepository.get_by_ids(
+                    db, [movie_id for movie_id in movie_ids.values() if movie_id is not None]
+                )
+        except Exception as e:
+            logger.warning(f"⚠️ Catalog lookup failed, falling back to TMDB: {e}")
+            return {}
+
+        movies_by_id = {movie.id: movie for movie in movies}
+        found = {}
+        for title, movie_id in movie_ids.items():
+            movie = movies_by_id.get(movie_id)
+            # Suggestions are keyed by TMDB id, so rows without one still go to TMDB
+            if movie and movie.tmdb_id:
+                found[title] = {
+                    "id": movie.tmdb_id,
+                    "title": movie.title,
+                    "poster": movie.poster_url,
+                    "year": str(movie.release_year) if movie.release_year else None
+                }
+        return found
+
+    async def _search_tmdb(self, title: str) -> Optional[Dict[str, Any]]:
+        results = await self.data_sync.search_tmdb_movies(title)
+        if not results:
+            return None
+        match = results[0]
         return {
-            "message": {"role": "assistant", "content": response_text},
-            "suggested_movies": suggested_movies
+            "id": match.get('id'),
+            "title": match.get('title'),
+            "poster": f"https://image.tmdb.org/t/p/w200{match.get('poster_path')}" if match.get('poster_path') else None,
+            "year": match.get('release_date', '').split('-')[0] if match.get('release_date') else None
         }
@@ -1,12 +1,40 @@
 import httpx
-from cachetools import TTLCache
 from typing import Dict, Any, Optional, List
 from app.core.config import get_settings
 from app.core.logger import get_logger
+from app.core.http_client import get_http_client, timeout_for, raise_for_upstream_error
+from app.core.circuit_breaker import CircuitOpenError, get_breaker
+from app.core.cache import TieredCache, disk_cache_store
+from app.core.metrics import metrics
 
 settings = get_settings()
 logger = get_logger(__name__)
 
+EXTERNAL_METRIC = "cinepulse_external_call_seconds"
+
+# Shared by every instance: an outage trips the breaker for all callers at once
+tmdb_breaker = get_breaker("tmdb")
+omdb_breaker = get_breaker("omdb")
+
+# Process-wide caches shared by every DataSyncService instance.
+# Memory LRU/TTL in front of the on-disk store so data survives restarts.
+search_cache = TieredCache(
+    "tmdb_search", ttl=settings.CACHE_TTL_SEARCH_SECONDS,
+    stale_ttl=settings.CACHE_STALE_SECONDS, store=disk_cache_store
+)
+details_cache = TieredCache(
+    "tmdb_details", ttl=settings.CACHE_TTL_DETAILS_SECONDS,
+    stale_ttl=settings.CACHE_STALE_SECONDS, store=disk_cache_store
+)
+streaming_cache = TieredCache(
+    "tmdb_providers", ttl=settings.CACHE_TTL_PROVIDERS_SECONDS,
+    stale_ttl=settings.CACHE_STALE_SECONDS, store=disk_cache_store
+)
+omdb_cache = TieredCache(
+    "omdb", ttl=settings.CACHE_TTL_OMDB_SECONDS,
+    stale_ttl=settings.CACHE_STALE_SECONDS, store=disk_cache_store
+)
+
 class DataSyncService:
     """
     Handles data retrieval from TMDB, OMDb, and JustWatch.
@@ -15,90 +43,120 @@ class DataSyncService:
     def __init__(self):
         self.tmdb_base = "https://api.themoviedb.org/3"
         self.omdb_base = "http://www.omdbapi.com"
-        # Persistence caches: 1 hour for general data, 24 hours for providers
-        self.search_cache = TTLCache(maxsize=100, ttl=3600)
-        self.details_cache = TTLCache(maxsize=100, ttl=3600)
-        self.streaming_cache = TTLCache(maxsize=100, ttl=86400)
 
     async def search_tmdb_movies(self, query: str) -> List[Dict[str, Any]]:
         """Search for movies on TMDB."""
-        if query in self.search_cache:
-            return self.search_cache[query]
+        results = await search_cache.get_or_fetch(query, lambda: self._search_tmdb(query))
+        return results if results is not None else []
 
+    @metrics.timed(EXTERNAL_METRIC, service="tmdb", operation="search")
+    async def _search_tmdb(self, query: str) -> Optional[List[Dict[str, Any]]]:
         if not settings.TMDB_API_KEY or "your_tmdb_api_key" in settings.TMDB_API_KEY:
             logger.warning("TMDB API key is missing or using placeholder.")
-            return []
+            return None
             
         try:
-            # Setting verify=False sometimes helps on Windows if local certs are missing
-            async with httpx.AsyncClient(verify=False) as client:
-                url = f"{self.tmdb_base}/search/movie"
-                params = {
-                    "api_key": settings.TMDB_API_KEY,
-                    "query": query,
-                    "language": "en-US"
-                }
-                response = await client.get(url, params=params, timeout=20.0)
-                response.raise_for_status()
-                results = response.json().get("results", [])
-                self.search_cache[query] = results
-                return results
+            client = get_http_client()
+            url = f"{self.tmdb_base}/search/movie"
+            params = {
+                "api_key": settings.TMDB_API_KEY,
+                "query": query,
+                "language": "en-US"
+            }
+            with tmdb_breaker.guard():
+                response = await client.get(url, params=params, timeout=timeout_for(url))
+                raise_for_upstream_error(response)
+            response.raise_for_status()
+            return response.json().get("results", [])
+        except CircuitOpenError:
+            logger.warning("⚡ TMDB circuit open, skipping search")
+            return None
         except httpx.ConnectError:
             logger.error(f"❌ Connection Error: Could not reach TMDB. Try checking your internet or using a VPN.")
-            return []
+            return None
         except Exception as e:
             logger.error(f"❌ Error searching TMDB: {str(e)}")
-            return []
+            return None
 
     async def fetch_tmdb_details(self, movie_id: int) -> Dict[str, Any]:
         """Fetch full movie details from TMDB."""
-        if movie_id in self.details_cache:
-            return self.details_cache[movie_id]
+        data = await details_cache.get_or_fetch(movie_id, lambda: self._fetch_tmdb_details(movie_id))
+        return data if data is not None else {}
 
+    @metrics.timed(EXTERNAL_METRIC, service="tmdb", operation="details")
+    async def _fetch_tmdb_details(self, movie_id: int) -> Optional[Dict[str, Any]]:
         if not settings.TMDB_API_KEY:
-            return {}
+            return None
             
         try:
-            async with httpx.AsyncClient(verify=False) as client:
-                url = f"{self.tmdb_base}/movie/{movie_id}"
-                params = {"api_key": settings.TMDB_API_KEY, "append_to_response": "credits,keywords"}
-                response = await client.get(url, params=params, timeout=20.0)
-                data = response.json()
-                self.details_cache[movie_id] = data
-                return data
+            client = get_http_client()
+            url = f"{self.tmdb_base}/movie/{movie_id}"
+            params = {"api_key": settings.TMDB_API_KEY, "append_to_response": "credits,keywords"}
+            with tmdb_breaker.guard():
+                response = await client.get(url, params=params, timeout=timeout_for(url))
+                raise_for_upstream_error(response)
+            # Don't persist TMDB error payloads
+            response.raise_for_status()
+            return response.json()
+        except CircuitOpenError:
+            logger.warning("⚡ TMDB circuit open, skipping details lookup")
+            return None
         except Exception as e:
             logger.error(f"❌ Error fetching TMDB details: {str(e)}")
-            return {}
-
-
+            return None
 
     async def fetch_omdb_data(self, title: str) -> Dict[str, Any]:
         """Fetch ratings and awards from OMDb."""
+        data = await omdb_cache.get_or_fetch(title, lambda: self._fetch_omdb_data(title))
+        return data if data is not None else {}
+
+    @metrics.timed(EXTERNAL_METRIC, service="omdb", operation="lookup")
+    async def _fetch_omdb_data(self, title: str) -> Optional[Dict[str, Any]]:
         if not settings.OMDB_API_KEY:
-            return {}
+            return None
             
-        async with httpx.AsyncClient() as client:
-            params = {"t": title, "apikey": settings.OMDB_API_KEY}
-            response = await client.get(self.omdb_base, params=params)
-            return response.json()
+        client = get_http_client()
+        params = {"t": title, "apikey": settings.OMDB_API_KEY}
+        with omdb_breaker.guard():
+            response = await client.get(self.omdb_base, params=params, timeout=timeout_for(self.omdb_base))
+            raise_for_upstream_error(response)
+        # Don't persist OMDb error payloads (e.g. 401 "Request limit reached!")
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            logger.error(f"❌ Error fetching OMDb data: {str(e)}")
+            return None
+        data = response.json()
+        if data.get("Response") == "False":
+            logger.warning(f"⚠️ OMDb has no data for '{title}': {data.get('Error')}")
+            return None
+        return data
 
     async def fetch_streaming_providers(self, movie_id: int) -> Dict[str, Any]:
         """Fetch streaming data (JustWatch integration via TMDB)."""
-        if movie_id in self.streaming_cache:
-            return self.streaming_cache[movie_id]
+        data = await streaming_cache.get_or_fetch(movie_id, lambda: self._fetch_streaming_providers(movie_id))
+        return data if data is not None else {}
 
+    @metrics.timed(EXTERNAL_METRIC, service="tmdb", operation="providers")
+    async def _fetch_streaming_providers(self, movie_id: int) -> Optional[Dict[str, Any]]:
         if not settings.TMDB_API_KEY:
-            return {}
+            return None
             
-        async with httpx.AsyncClient() as client:
-            url = f"{self.tmdb_base}/movie/{movie_id}/watch/providers"
-            params = {"api_key": settings.TMDB_API_KEY}
-            response = await client.get(url, params=params)
-            results = response.json().get("results", {})
-            # Return US providers as default or empty
-            provider_data = results.get("US", {})
-            self.streaming_cache[movie_id] = provider_data
-            return provider_data
+        client = get_http_client()
+        url = f"{self.tmdb_base}/movie/{movie_id}/watch/providers"
+        params = {"api_key": settings.TMDB_API_KEY}
+        with tmdb_breaker.guard():
+            response = await client.get(url, params=params, timeout=timeout_for(url))
+            raise_for_upstream_error(response)
+        # Don't persist TMDB error payloads (a 401 would cache "no providers")
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            logger.error(f"❌ Error fetching TMDB providers: {str(e)}")
+            return None
+        results = response.json().get("results", {})
+        # Return US providers as default or empty
+        return results.get("US", {})
 
     async def get_research_comparison(self, movie_id: int) -> Dict[str, Any]:
         """
@@ -1,10 +1,41 @@
+import asyncio
+import hashlib
+import json
+import re
+from typing import AsyncIterator, Dict, List, Optional
 import google.generativeai as genai
 from app.core.config import get_settings
+from app.core.cache import TieredCache, disk_cache_store
+from app.core.metrics import metrics
+from app.core.circuit_breaker import CircuitOpenError, get_breaker
+from app.core.concurrency import GateRejectedError, get_gate
 import logging
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+DEFAULT_INTENT = "watch something good"
+# Bump when the explanation prompt changes so old sentences aren't served for it
+EXPLANATION_PROMPT_VERSION = "v1"
+DISABLED_REPLY = "Hey! I'm having some technical issues right now, but I'd love to help you find a great movie. What are you in the mood for?"
+OVERLOADED_REPLY = "I'm a little overloaded right now, but I'd still love to help. Tell me what you're in the mood for and try again in a moment?"
+ERROR_REPLY = "Oops, something went wrong on my end. Could you try asking that again?"
+
+# Generated sentences keyed by (movie, mood, intent); shared by every instance
+explanation_cache = TieredCache(
+    "explanations",
+    ttl=settings.CACHE_TTL_EXPLANATIONS_SECONDS,
+    store=disk_cache_store if settings.EXPLANATION_CACHE_PERSISTENT else None
+)
+CODE_FENCE_PATTERN = re.compile(r"^```(?:json)?\s*|\s*```$")
+gemini_breaker = get_breaker("gemini")
+llm_gate = get_gate(
+    "gemini",
+    max_concurrency=settings.LLM_MAX_CONCURRENCY,
+    max_queue=settings.LLM_MAX_QUEUE,
+    queue_timeout=settings.LLM_QUEUE_TIMEOUT_SECONDS
+)
+
 class GeminiService:
     def __init__(self):
         self.enabled = False
@@ -17,10 +48,23 @@ class GeminiService:
             except Exception as e:
                 logger.error(f"Failed to initialize Gemini: {e}")
 
-    async def generate_explanation(self, movie_title: str, user_mood: str, user_intent: str) -> str:
+    async def generate_explanation(self, movie_title: str, user_mood: str, user_intent: str) -> Optional[str]:
+        """
+        One personalized sentence, or None when Gemini failed so the caller
+        can use its template reasoning and flag the response as degraded.
+        """
         if not self.enabled:
             return f"This movie is a great match for your {user_mood} mood!"
 
+        # Cached per (title, mood, intent); concurrent misses share one LLM call
+        reason = await explanation_cache.get_or_fetch(
+            explanation_key(movie_title, user_mood, user_intent),
+            lambda: self._generate_explanation(movie_title, user_mood, user_intent)
+        )
+        return reason
+
+    @metrics.timed("cinepulse_external_call_seconds", service="gemini", operation="explanation")
+    async def _generate_explanation(self, movie_title: str, user_mood: str, user_intent: str) -> Optional[str]:
         prompt = f"""
         User is feeling: {user_mood}
         User intent: {user_intent}
@@ -31,20 +75,145 @@ class GeminiService:
         """
         
         try:
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
+            return await self._complete(prompt)
+        except (CircuitOpenError, GateRejectedError):
+            # Fail fast so the caller can use its template reasoning instead
+            raise
         except Exception as e:
             logger.error(f"Gemini generation error: {e}")
-            return f"This movie really fits the vibe you're looking for right now!"
+            # Not cached, so the next request retries
+            return None
+
+    @metrics.timed("cinepulse_external_call_seconds", service="gemini", operation="explanation_batch")
+    async def generate_explanations(self, movie_titles: List[str], user_mood: str, user_intent: str) -> Dict[str, str]:
+        """
+        One prompt for several titles. Returns reasons keyed by title for the
+        entries that are cached or came back usable; callers fall back for the rest.
+        """
+        if not self.enabled or not movie_titles:
+            return {}
+
+        reasons: Dict[str, str] = {}
+        for title in movie_titles:
+            cached = await explanation_cache.get(explanation_key(title, user_mood, user_intent))
+            if cached:
+                reasons[title] = cached
+        movie_titles = [title for title in movie_titles if title not in reasons]
+        if not movie_titles:
+            return reasons
+
+        numbered = "\n".join(f"{i}. {title}" for i, title in enumerate(movie_titles, start=1))
+        prompt = f"""
+        User is feeling: {user_mood}
+        User intent: {user_intent}
+        Movies recommended:
+        {numbered}
+
+        For each movie, write a one-sentence, highly personalized, empathetic reason why it is a great choice for them right now.
+        Focus on the emotional connection. Use a warm, human tone. Avoid generic AI phrases.
+        Respond with a JSON object mapping each movie's number (as a string) to its sentence, e.g. {{"1": "...", "2": "..."}}.
+        """
+
+        try:
+            text = await self._complete(prompt, generation_config={"response_mime_type": "application/json"})
+        except (CircuitOpenError, GateRejectedError):
+            raise
+        except Exception as e:
+            logger.error(f"Gemini batch generation error: {e}")
+            return reasons
+
+        parsed = self._parse_batch(text)
+        generated = 0
+        for i, title in enumerate(movie_titles, start=1):
+            reason = parsed.get(str(i))
+            if isinstance(reason, str) and reason.strip():
+                reasons[title] = reason.strip()
+                await explanation_cache.set(explanation_key(title, user_mood, user_intent), reasons[title])
+                generated += 1
+        if generated < len(movie_titles):
+            logger.warning(f"Gemini batch returned {generated}/{len(movie_titles)} usable explanations")
+        return reasons
+
+    @staticmethod
+    def _parse_batch(text: str) -> Dict[str, object]:
+        try:
+            data = json.loads(CODE_FENCE_PATTERN.sub("", text.strip()))
+        except json.JSONDecodeError:
+            logger.warning("Gemini batch response was not valid JSON")
+            return {}
+        return data if isinstance(data, dict) else {}
 
+    @metrics.timed("cinepulse_external_call_seconds", service="gemini", operation="raw_text")
     async def generate_raw_text(self, prompt: str) -> str:
         if not self.enabled:
-            return "Hey! I'm having some technical issues right now, but I'd love to help you find a great movie. What are you in the mood for?"
+            return DISABLED_REPLY
             
         try:
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
+            return await self._complete(prompt)
+        except (CircuitOpenError, GateRejectedError) as e:
+            logger.warning(f"⚡ Gemini unavailable ({e}), returning fallback reply")
+            return OVERLOADED_REPLY
         except Exception as e:
             logger.error(f"Gemini raw generation error: {e}")
-            return "Oops, something went wrong on my end. Could you try asking that again?"
+            return ERROR_REPLY
+
+    async def stream_raw_text(self, prompt: str) -> AsyncIterator[str]:
+        """
+        Yields the completion in chunks as Gemini produces them. Holds one
+        gate slot for the whole stream; LLM_TIMEOUT_SECONDS bounds the wait
+        for each chunk. Falls back to the same canned replies as generate_raw_text.
+        """
+        if not self.enabled:
+            yield DISABLED_REPLY
+            return
+
+        emitted = False
+        try:
+            async with llm_gate.slot():
+                with gemini_breaker.guard(), metrics.timer("cinepulse_external_call_seconds", service="gemini", operation="stream"):
+                    response = await asyncio.wait_for(
+                        self.model.generate_content_async(prompt, stream=True),
+                        timeout=settings.LLM_TIMEOUT_SECONDS
+                    )
+                    chunks = response.__aiter__()
+                    while True:
+                        try:
+                            chunk = await asyncio.wait_for(chunks.__anext__(), timeout=settings.LLM_TIMEOUT_SECONDS)
+                        except StopAsyncIteration:
+                            break
+                        if chunk.text:
+                            emitted = True
+                            yield chunk.text
+        except (CircuitOpenError, GateRejectedError) as e:
+            logger.warning(f"⚡ Gemini unavailable ({e}), returning fallback reply")
+            yield OVERLOADED_REPLY
+        except Exception as e:
+            logger.error(f"Gemini streaming error: {e}")
+            # Keep whatever was already streamed; only answer with the canned reply if nothing was
+            if not emitted:
+                yield ERROR_REPLY
+
+    async def _complete(self, prompt: str, generation_config: Optional[dict] = None) -> str:
+        """
+        One non-blocking Gemini round-trip: admitted by the shared gate,
+        guarded by the circuit breaker and bounded by LLM_TIMEOUT_SECONDS.
+        """
+        async def call():
+            with gemini_breaker.guard():
+                return await asyncio.wait_for(
+                    self.model.generate_content_async(prompt, generation_config=generation_config),
+                    timeout=settings.LLM_TIMEOUT_SECONDS
+                )
+
+        response = await llm_gate.run(call)
+        return response.text.strip()
+
 
+def explanation_key(movie_title: str, user_mood: str, user_intent: str) -> str:
+    """
+    Content address of one explanation: prompt version plus the normalized
+    (title, mood, intent) triple.
+    """
+    parts = [EXPLANATION_PROMPT_VERSION, movie_title, user_mood, user_intent]
+    payload = json.dumps([part.strip().lower() for part in parts], separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
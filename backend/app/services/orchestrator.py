@@ -1,27 +1,42 @@
 from fastapi import Depends
-from sqlalchemy.orm import Session
-from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Dict, Any, Optional, Awaitable, TypeVar
+import asyncio
+import numpy as np
 
-from app.db.session import get_db
+from app.db.session import get_async_db
 from app.schemas.request import RecommendationRequest
 from app.schemas.response import RecommendationResponse, MovieRecommendation
-from app.repositories.movie_repository import MovieRepository
+from app.models.movie import Movie
+from app.repositories.movie_repository import AsyncMovieRepository
 from app.services.emotion_service import EmotionService
 from app.services.intent_service import IntentService
 from app.services.context_service import ContextService
 from app.services.arc_service import ArcService
 from app.services.scoring_service import ScoringService
 from app.services.explanation_service import ExplanationService
-from app.services.gemini_service import GeminiService
+from app.services.gemini_service import GeminiService, DEFAULT_INTENT
 from app.services.data_sync_service import DataSyncService
+from app.services.catalog_service import CatalogSnapshot, catalog_service
+from app.services.recommendation_cache import recommendation_cache
+from app.core.config import get_settings
+from app.core.deadline import Deadline
+from app.core.circuit_breaker import CircuitOpenError
+from app.core.concurrency import GateRejectedError
 from app.core.logger import get_logger
+from app.core.metrics import metrics
 
+settings = get_settings()
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+STAGE_METRIC = "cinepulse_stage_seconds"
+
 class RecommendationOrchestrator:
     def __init__(
         self,
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_async_db),
         emotion_service: EmotionService = Depends(),
         intent_service: IntentService = Depends(),
         context_service: ContextService = Depends(),
@@ -42,97 +57,295 @@ class RecommendationOrchestrator:
         self.data_sync_service = data_sync_service
 
     async def get_recommendations(self, request: RecommendationRequest) -> RecommendationResponse:
+        # One normalized request for both the cache key and the pipeline, so
+        # requests that share a cache entry also get the same safety filters
+        request = normalize_request(request)
         logger.info(f"Processing recommendation for mood: {request.mood}")
+        deadline = Deadline.from_ms(request.budget_ms or settings.RECOMMENDATION_BUDGET_MS)
+
+        with metrics.timer(STAGE_METRIC, stage="catalog_snapshot"):
+            catalog = await catalog_service.get_snapshot_async()
+
+        # Identical (normalized) requests against the same catalog reuse the last result
+        if not settings.RECOMMENDATION_CACHE_ENABLED:
+            with metrics.timer(STAGE_METRIC, stage="total"):
+                return await self._run_pipeline(request, catalog, deadline)
+
+        cache_key = recommendation_cache.make_key(request)
+        cached = recommendation_cache.get(cache_key, catalog.generation)
+        if cached is not None:
+            logger.info(f"⚡ Recommendation cache hit for mood: {request.mood}")
+            return cached
+
+        with metrics.timer(STAGE_METRIC, stage="total"):
+            response = await self._run_pipeline(request, catalog, deadline)
+        # Fallback content is only good enough for this response, not for the next caller
+        if not response.degraded:
+            recommendation_cache.set(cache_key, catalog.generation, response)
+        return response
 
+    async def _run_pipeline(
+        self,
+        request: RecommendationRequest,
+        catalog: CatalogSnapshot,
+        deadline: Deadline
+    ) -> RecommendationResponse:
         # 1. Emotional Safety Filter
         # If user is anxious/vulnerable, we filter out heavy content immediately
-        safety_constraints = self.emotion_service.get_safety_filters(request.mood)
+        with metrics.timer(STAGE_METRIC, stage="safety_filter"):
+            safety_constraints = self.emotion_service.get_safety_filters(request.mood)
         
         # 2. Contextual Constraints
         # Time of day, max runtime, etc.
-        context_constraints = self.context_service.get_constraints(request.context)
+        with metrics.timer(STAGE_METRIC, stage="context_constraints"):
+            context_constraints = self.context_service.get_constraints(request.context)
         
-        # Combine filters
-        candidates = MovieRepository.filter_by_constraints(
-            self.db,
-            max_runtime=context_constraints.get("max_runtime"),
-            tone=safety_constraints.get("tone_limit"),
-            pace=request.context.get("pace") if request.context else None
-        )
+        # Combine filters against the in-memory catalog snapshot
+        # (vectorized mask, no ORM hydration until the final top-k)
+        with metrics.timer(STAGE_METRIC, stage="candidate_fetch"):
+            candidate_indices = catalog.filter(
+                max_runtime=context_constraints.get("max_runtime"),
+                tone=safety_constraints.get("tone_limit"),
+                pace=request.context.get("pace") if request.context else None
+            )
 
-        if not candidates:
-            # Fallback if filters are too strict
-            candidates = MovieRepository.get_all(self.db)[:20]
+            if candidate_indices.size == 0:
+                # Fallback if filters are too strict
+                candidate_indices = np.arange(min(len(catalog), 20))
 
         # 3. Scoring / Alignment
-        # Instead of raw accuracy, we align with the user's current state
-        scored_candidates = []
-        for movie in candidates:
-            score_details = self.scoring_service.calculate_alignment(
-                movie=movie,
+        # Instead of raw accuracy, we align with the user's current state.
+        # All candidates are scored in one vectorized pass over the snapshot.
+        with metrics.timer(STAGE_METRIC, stage="scoring"):
+            batch_scores = self.scoring_service.score_batch(
+                catalog,
+                candidate_indices,
                 mood=request.mood,
-                intent=request.intent,
-                personality=request.personality
+                intent=request.intent
             )
-            scored_candidates.append((movie, score_details))
 
-        # Sort by alignment score
-        scored_candidates.sort(key=lambda x: x[1]["total_score"], reverse=True)
-        top_candidates = scored_candidates[:3]
-
-        # 4. Human-Centric Explanation Generation
-        recommendations = []
-        for movie, score_details in top_candidates:
-            reasoning_data = self.explanation_service.generate_detailed_reasoning(
-                movie=movie,
-                mood=request.mood,
-                score_details=score_details
+        # Bounded top-k selection (deterministic: score desc, then movie id)
+        with metrics.timer(STAGE_METRIC, stage="ranking"):
+            candidate_ids = catalog.ids[candidate_indices]
+            top_positions = self.scoring_service.select_top_k(
+                batch_scores["total"],
+                candidate_ids,
+                k=request.limit,
+                offset=request.offset
             )
+            top_scored = [
+                (int(candidate_ids[position]), self.scoring_service.breakdown_at(batch_scores, position))
+                for position in top_positions
+            ]
 
-            # AI Personalized Reasoning
-            ai_reason = await self.gemini_service.generate_explanation(
-                movie_title=movie.title,
-                user_mood=request.mood,
-                user_intent=request.intent or "watch something good"
-            )
-            
-            # Real-time Streaming Data (JustWatch)
-            streaming = []
-            if movie.tmdb_id:
-                streaming_data = await self.data_sync_service.fetch_streaming_providers(movie.tmdb_id)
-                # Parse flat list from providers
-                p_list = streaming_data.get('flatrate', [])
-                for p in p_list:
-                    streaming.append({
-                        "name": p.get('provider_name'),
-                        "icon": f"https://image.tmdb.org/t/p/original{p.get('logo_path')}",
-                        "url": f"https://www.themoviedb.org/movie/{movie.tmdb_id}/watch" # Deep link to TMDB watch
-                    })
-
-            recommendations.append(MovieRecommendation(
-                id=movie.id,
-                title=movie.title,
-                year=movie.release_year or 2024,
-                poster=movie.poster_url or f"https://images.unsplash.com/photo-1594908900066-3f47337549d8?w=800&h=1200&fit=crop", 
-                backdrop=movie.backdrop_url or "https://images.unsplash.com/photo-1536440136628-849c177e76a1?w=1200",
-                type=movie.content_type or "movie",
-                emotionalTag=movie.tone.capitalize() if movie.tone else "Balanced",
-                emotionalArc=" -> ".join(movie.emotional_arc) if movie.emotional_arc else "Steady journey",
-                trailerUrl=movie.trailer_url,
-                streamingPlatforms=streaming or movie.streaming_platforms or [],
-                reasons=reasoning_data["bullets"],
-                reasoning=ai_reason if self.gemini_service.enabled else reasoning_data["paragraph"],
-                alignmentScores=score_details.get("scores")
-            ))
+        # Hydrate only the movies we are actually going to return
+        with metrics.timer(STAGE_METRIC, stage="hydration"):
+            movies = await AsyncMovieRepository.get_by_ids(self.db, [movie_id for movie_id, _ in top_scored])
+        movies_by_id = {movie.id: movie for movie in movies}
+        top_candidates = [
+            (movies_by_id[movie_id], score_details)
+            for movie_id, score_details in top_scored
+            if movie_id in movies_by_id
+        ]
+
+        # 4. Human-Centric Explanation Generation
+        # LLM reasoning and streaming lookups for every pick run concurrently;
+        # gather() keeps the results in ranking order. Each call gets whatever is
+        # left of the request budget; anything that can't finish in time falls
+        # back to the template reasoning / stored providers.
+        semaphore = asyncio.Semaphore(settings.ENRICHMENT_CONCURRENCY)
+        batch_explanations = self._start_batch_explanations(
+            [movie for movie, _ in top_candidates], request, semaphore, deadline
+        )
+        try:
+            with metrics.timer(STAGE_METRIC, stage="enrichment"):
+                recommendations = await asyncio.gather(*(
+                    self._build_recommendation(movie, score_details, request, semaphore, deadline, batch_explanations)
+                    for movie, score_details in top_candidates
+                ))
+        finally:
+            if batch_explanations is not None:
+                batch_explanations.cancel()
 
         overall_explanation = self.explanation_service.generate_summary(
             mood=request.mood,
             top_movies=[m.title for m in recommendations]
         )
 
+        degraded = sorted({part for rec in recommendations for part in rec.degraded})
+        if degraded:
+            logger.warning(
+                f"⏱️ Degraded recommendation ({', '.join(degraded)}) for mood: {request.mood}, "
+                f"budget {deadline.budget:.2f}s"
+            )
+
         return RecommendationResponse(
-            recommendations=recommendations,
-            explanation=overall_explanation
+            recommendations=list(recommendations),
+            explanation=overall_explanation,
+            degraded=degraded
+        )
+
+    async def _build_recommendation(
+        self,
+        movie: Movie,
+        score_details: Dict[str, Any],
+        request: RecommendationRequest,
+        semaphore: asyncio.Semaphore,
+        deadline: Deadline,
+        batch_explanations: Optional["asyncio.Future[Optional[Dict[str, str]]]"] = None
+    ) -> MovieRecommendation:
+        reasoning_data = self.explanation_service.generate_detailed_reasoning(
+            movie=movie,
+            mood=request.mood,
+            score_details=score_details
+        )
+
+        # AI Personalized Reasoning + Real-time Streaming Data (JustWatch)
+        ai_reason, streaming = await asyncio.gather(
+            self._explain(movie, request, semaphore, deadline, batch_explanations),
+            self._bounded_call(
+                semaphore,
+                self._fetch_streaming(movie),
+                label=f"streaming providers for '{movie.title}'",
+                stage="streaming_enrichment",
+                deadline=deadline
+            )
+        )
+
+        degraded = []
+        if self.gemini_service.enabled and ai_reason is None:
+            degraded.append("reasoning")
+        if streaming is None:
+            degraded.append("streaming")
+
+        return MovieRecommendation(
+            id=movie.id,
+            title=movie.title,
+            year=movie.release_year or 2024,
+            poster=movie.poster_url or f"https://images.unsplash.com/photo-1594908900066-3f47337549d8?w=800&h=1200&fit=crop", 
+            backdrop=movie.backdrop_url or "https://images.unsplash.com/photo-1536440136628-849c177e76a1?w=1200",
+            type=movie.content_type or "movie",
+            emotionalTag=movie.tone.capitalize() if movie.tone else "Balanced",
+            emotionalArc=" -> ".join(movie.emotional_arc) if movie.emotional_arc else "Steady journey",
+            trailerUrl=movie.trailer_url,
+            streamingPlatforms=streaming or movie.streaming_platforms or [],
+            reasons=reasoning_data["bullets"],
+            reasoning=ai_reason if self.gemini_service.enabled and ai_reason else reasoning_data["paragraph"],
+            alignmentScores=score_details.get("scores"),
+            degraded=degraded
+        )
+
+    def _start_batch_explanations(
+        self,
+        movies: List[Movie],
+        request: RecommendationRequest,
+        semaphore: asyncio.Semaphore,
+        deadline: Deadline
+    ) -> Optional["asyncio.Future[Optional[Dict[str, str]]]"]:
+        """
+        Kicks off one LLM prompt covering every pick (shared mood/intent
+        preamble, per-title JSON back) so it overlaps the streaming lookups.
+        """
+        if not (settings.GEMINI_BATCH_EXPLANATIONS and self.gemini_service.enabled and len(movies) > 1):
+            return None
+        return asyncio.ensure_future(self._bounded_call(
+            semaphore,
+            self.gemini_service.generate_explanations(
+                movie_titles=[movie.title for movie in movies],
+                user_mood=request.mood,
+                user_intent=request.intent or DEFAULT_INTENT
+            ),
+            label=f"batched explanations for {len(movies)} titles",
+            stage="explanation_batch",
+            deadline=deadline
+        ))
+
+    async def _explain(
+        self,
+        movie: Movie,
+        request: RecommendationRequest,
+        semaphore: asyncio.Semaphore,
+        deadline: Deadline,
+        batch_explanations: Optional["asyncio.Future[Optional[Dict[str, str]]]"]
+    ) -> Optional[str]:
+        if batch_explanations is not None:
+            reasons = await batch_explanations
+            if reasons and reasons.get(movie.title):
+                return reasons[movie.title]
+            # Entry missing or unparseable: fall back to a per-title prompt
+            # (or, if the budget is gone, to the template reasoning)
+
+        return await self._bounded_call(
+            semaphore,
+            self.gemini_service.generate_explanation(
+                movie_title=movie.title,
+                user_mood=request.mood,
+                user_intent=request.intent or DEFAULT_INTENT
+            ),
+            label=f"explanation for '{movie.title}'",
+            stage="explanation",
+            deadline=deadline
+        )
+
+    async def _fetch_streaming(self, movie: Movie) -> List[Dict[str, Any]]:
+        if not movie.tmdb_id:
+            return []
+        streaming_data = await self.data_sync_service.fetch_streaming_providers(movie.tmdb_id)
+        # Parse flat list from providers
+        return [
+            {
+                "name": p.get('provider_name'),
+                "icon": f"https://image.tmdb.org/t/p/original{p.get('logo_path')}",
+                "url": f"https://www.themoviedb.org/movie/{movie.tmdb_id}/watch" # Deep link to TMDB watch
+            }
+            for p in streaming_data.get('flatrate', [])
+        ]
+
+    async def _bounded_call(
+        self,
+        semaphore: asyncio.Semaphore,
+        coro: Awaitable[T],
+        label: str,
+        stage: str,
+        deadline: Deadline
+    ) -> Optional[T]:
+        """
+        Runs one enrichment call under the shared concurrency cap. The timeout
+        (including time spent queued on the semaphore) is the per-call cap or
+        the remaining request budget, whichever is smaller. Returns None on
+        timeout/failure so callers fall back to DB/template data.
+        """
+        async def run() -> T:
+            async with semaphore:
+                with metrics.timer(STAGE_METRIC, stage=stage):
+                    return await coro
+
+        timeout = deadline.timeout(
+            cap=settings.ENRICHMENT_TIMEOUT_SECONDS,
+            reserve=settings.RECOMMENDATION_BUDGET_RESERVE_MS / 1000.0
         )
+        if timeout <= 0:
+            coro.close()
+            logger.warning(f"⏱️ No budget left for {label}")
+            return None
+        try:
+            return await asyncio.wait_for(run(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"⏱️ Timed out fetching {label}")
+        except (CircuitOpenError, GateRejectedError) as e:
+            logger.info(f"⚡ Skipped {label}: {e}")
+        except Exception as e:
+            logger.error(f"❌ Error fetching {label}: {e}")
+        return None
 
 
+def normalize_request(request: RecommendationRequest) -> RecommendationRequest:
+    """
+    Copy of the request with surrounding whitespace stripped from the
+    free-text signals (mood, intent, personality).
+    """
+    return request.model_copy(update={
+        field: value.strip()
+        for field in ("mood", "intent", "personality")
+        if isinstance(value := getattr(request, field), str)
+    })
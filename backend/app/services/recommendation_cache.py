@@ -0,0 +1,90 @@
+# app/services/recommendation_cache.py
+
+import hashlib
+import json
+import threading
+from typing import Optional
+
+from cachetools import TTLCache
+
+from app.schemas.request import RecommendationRequest
+from app.schemas.response import RecommendationResponse
+from app.core.config import get_settings
+from app.core.logger import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+
+class RecommendationCache:
+    """
+    Process-wide cache of full recommendation responses.
+
+    Entries are stored as serialized JSON so the memory bound is measured in
+    bytes and callers always get an independent copy. Eviction is TTL + LRU
+    (cachetools.TTLCache). The cache is tied to a catalog snapshot generation
+    and cleared as soon as the catalog is reloaded.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = settings.RECOMMENDATION_CACHE_TTL_SECONDS,
+        max_bytes: int = settings.RECOMMENDATION_CACHE_MAX_BYTES
+    ):
+        self._cache = TTLCache(maxsize=max_bytes, ttl=ttl_seconds, getsizeof=len)
+        self._lock = threading.Lock()
+        self._generation: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(request: RecommendationRequest) -> str:
+        """
+        Canonical key: case/whitespace-insensitive signals and sorted context keys.
+        """
+        def norm(value: Optional[str]) -> Optional[str]:
+            return value.strip().lower() if value else None
+
+        canonical = {
+            "mood": norm(request.mood),
+            "intent": norm(request.intent),
+            "personality": norm(request.personality),
+            "context": request.context or {},
+            "limit": request.limit,
+            "offset": request.offset
+        }
+        payload = json.dumps(canonical, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, generation: int) -> Optional[RecommendationResponse]:
+        with self._lock:
+            self._sync_generation(generation)
+            payload = self._cache.get(key)
+            if payload is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return RecommendationResponse.model_validate_json(payload)
+
+    def set(self, key: str, generation: int, response: RecommendationResponse) -> None:
+        payload = response.model_dump_json().encode("utf-8")
+        if len(payload) > self._cache.maxsize:
+            return
+        with self._lock:
+            self._sync_generation(generation)
+            self._cache[key] = payload
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def _sync_generation(self, generation: int) -> None:
+        # Catalog changed since these entries were computed: drop them all
+        if self._generation != generation:
+            if self._cache:
+                logger.info(f"🧹 Catalog reloaded, dropping {len(self._cache)} cached recommendations")
+            self._cache.clear()
+            self._generation = generation
+
+
+recommendation_cache = RecommendationCache()
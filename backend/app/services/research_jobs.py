@@ -0,0 +1,250 @@
+# app/services/research_jobs.py
+
+import asyncio
+import random
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Set
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import get_settings
+from app.core.logger import get_logger
+from app.core.concurrency import GateRejectedError
+from app.db.session import AsyncSessionLocal
+from app.models.research_job import ResearchJob, PENDING, SUCCEEDED, FAILED
+from app.repositories.research_job_repository import AsyncResearchJobRepository, utcnow
+from app.services.research_service import ResearchService
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+NOT_FOUND_ERROR = "No research results for this title"
+
+
+class ResearchJobQueue:
+    """
+    Runs movie research in the background instead of on the request.
+
+    Jobs are persisted in `research_jobs` and their ids go through an
+    in-process asyncio queue drained by `workers` tasks, so at most that many
+    researches run at once. A failed attempt goes back to pending and is
+    re-queued after an exponential backoff (with jitter) until
+    `max_attempts`; "no results" is a final answer, not a failure.
+
+    Several processes may share the table: a worker claims a job with one
+    conditional UPDATE (so only one runs it), holds a lease it renews while
+    running, and only records the outcome if it still holds that attempt.
+    A periodic sweep queues due pending jobs and jobs whose lease lapsed
+    because their process died.
+    """
+
+    def __init__(
+        self,
+        research: ResearchService,
+        workers: int = settings.RESEARCH_JOB_WORKERS,
+        max_queue: int = settings.RESEARCH_JOB_MAX_QUEUE,
+        max_attempts: int = settings.RESEARCH_JOB_MAX_ATTEMPTS,
+        backoff_seconds: float = settings.RESEARCH_JOB_BACKOFF_SECONDS,
+        max_backoff_seconds: float = settings.RESEARCH_JOB_MAX_BACKOFF_SECONDS,
+        timeout: float = settings.RESEARCH_JOB_TIMEOUT_SECONDS,
+        lease_seconds: float = settings.RESEARCH_JOB_LEASE_SECONDS,
+        sweep_seconds: float = settings.RESEARCH_JOB_SWEEP_SECONDS
+    ):
+        self.research = research
+        self.workers = workers
+        self.max_queue = max_queue
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.timeout = timeout
+        self.lease_seconds = lease_seconds
+        self.sweep_seconds = sweep_seconds
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._queued: Set[str] = set()
+        self._workers: List[asyncio.Task] = []
+        self._sweeper: Optional[asyncio.Task] = None
+        self._retries: Set[asyncio.TimerHandle] = set()
+        self.running = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.retried = 0
+        self.rejected = 0
+
+    @property
+    def started(self) -> bool:
+        return self._queue is not None
+
+    async def start(self) -> None:
+        if self.started:
+            return
+        self._queue = asyncio.Queue()
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"research-job-worker-{i}")
+            for i in range(self.workers)
+        ]
+        self._sweeper = asyncio.create_task(self._sweep_forever(), name="research-job-sweeper")
+
+    async def stop(self) -> None:
+        """
+        Stops the workers. Interrupted jobs stay `running` until their lease
+        lapses, then any worker (this process after a restart, or another
+        one) picks them up again.
+        """
+        for handle in self._retries:
+            handle.cancel()
+        self._retries.clear()
+        tasks = self._workers + ([self._sweeper] if self._sweeper else [])
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._workers = []
+        self._sweeper = None
+        self._queue = None
+        self._queued.clear()
+
+    async def submit(self, db: AsyncSession, title: str) -> ResearchJob:
+        """
+        Persists a pending job and queues it. Raises GateRejectedError when
+        the workers are not running or the backlog is already full.
+        """
+        if not self.started:
+            self.rejected += 1
+            raise GateRejectedError("research_jobs", "workers are not running")
+        if self._queue.qsize() >= self.max_queue:
+            self.rejected += 1
+            raise GateRejectedError("research_jobs", f"{self.max_queue} jobs already queued")
+
+        job = await AsyncResearchJobRepository.create(db, ResearchJob(title=title, status=PENDING, attempts=0))
+        self._enqueue(job.id)
+        return job
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": len(self._workers),
+            "queued": self._queue.qsize() if self._queue else 0,
+            "waiting_retry": len(self._retries),
+            "running": self.running,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "retried": self.retried,
+            "rejected": self.rejected,
+        }
+
+    def _enqueue(self, job_id: str) -> None:
+        if self._queue is not None and job_id not in self._queued:
+            self._queued.add(job_id)
+            self._queue.put_nowait(job_id)
+
+    async def sweep(self) -> int:
+        """
+        Queues every claimable job (pending and due, or orphaned by a dead
+        worker) and fails orphans that have no attempts left.
+        """
+        async with AsyncSessionLocal() as db:
+            exhausted = await AsyncResearchJobRepository.fail_orphaned(db, self.max_attempts)
+            job_ids = await AsyncResearchJobRepository.get_claimable_ids(db, self.max_attempts)
+        if exhausted:
+            self.failed += exhausted
+            logger.error(f"❌ {exhausted} orphaned research jobs had no attempts left")
+        new_ids = [job_id for job_id in job_ids if job_id not in self._queued]
+        for job_id in new_ids:
+            self._enqueue(job_id)
+        if new_ids:
+            logger.info(f"♻️ Queued {len(new_ids)} pending or orphaned research jobs")
+        return len(new_ids)
+
+    async def _sweep_forever(self) -> None:
+        while True:
+            try:
+                await self.sweep()
+            except Exception as e:
+                logger.warning(f"⚠️ Research job sweep failed: {e}")
+            await asyncio.sleep(self.sweep_seconds)
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            self._queued.discard(job_id)
+            self.running += 1
+            try:
+                await self._run(job_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Bookkeeping itself failed (e.g. DB down); the job keeps its
+                # state and the sweep retries it once it is claimable again
+                logger.error(f"❌ Research job {job_id} could not be processed: {e}")
+            finally:
+                self.running -= 1
+                self._queue.task_done()
+
+    async def _run(self, job_id: str) -> None:
+        async with AsyncSessionLocal() as db:
+            claimed = await AsyncResearchJobRepository.claim(db, job_id, self.max_attempts, self.lease_seconds)
+            if claimed is None:
+                return
+            title, attempt = claimed
+
+            heartbeat = asyncio.create_task(self._heartbeat(job_id, attempt))
+            try:
+                movie = await asyncio.wait_for(self.research.discover_movie(title, db), timeout=self.timeout)
+            except Exception as e:
+                await db.rollback()
+                await self._fail_attempt(db, job_id, title, attempt, str(e) or type(e).__name__)
+                return
+            finally:
+                heartbeat.cancel()
+
+            if movie is None:
+                outcome = {"status": FAILED, "error": NOT_FOUND_ERROR}
+            else:
+                outcome = {"status": SUCCEEDED, "movie_id": movie.id, "error": None}
+            if not await AsyncResearchJobRepository.finish_attempt(db, job_id, attempt, **outcome):
+                logger.warning(f"⚠️ Research job {job_id} lost its lease; outcome of attempt {attempt} discarded")
+                return
+
+            if movie is None:
+                self.failed += 1
+            else:
+                self.succeeded += 1
+                logger.info(f"✅ Research job {job_id} found '{movie.title}' (#{movie.id})")
+
+    async def _heartbeat(self, job_id: str, attempt: int) -> None:
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                # Own session: the job's session is busy with the research
+                async with AsyncSessionLocal() as db:
+                    await AsyncResearchJobRepository.extend_lease(db, job_id, attempt, self.lease_seconds)
+            except Exception as e:
+                logger.warning(f"⚠️ Could not renew lease of research job {job_id}: {e}")
+
+    async def _fail_attempt(self, db: AsyncSession, job_id: str, title: str, attempt: int, reason: str) -> None:
+        if attempt >= self.max_attempts:
+            if await AsyncResearchJobRepository.finish_attempt(db, job_id, attempt, status=FAILED, error=reason):
+                self.failed += 1
+                logger.error(f"❌ Research job {job_id} ('{title}') failed after {attempt} attempts: {reason}")
+            return
+
+        delay = min(self.backoff_seconds * 2 ** (attempt - 1), self.max_backoff_seconds)
+        delay *= random.uniform(0.5, 1.0)
+        retry_at = utcnow() + timedelta(seconds=delay)
+        if not await AsyncResearchJobRepository.finish_attempt(
+            db, job_id, attempt, status=PENDING, error=reason, available_at=retry_at
+        ):
+            return
+        self.retried += 1
+        logger.warning(f"⚠️ Research job {job_id} attempt {attempt} failed ({reason}); retrying in {delay:.1f}s")
+        self._schedule_retry(job_id, delay)
+
+    def _schedule_retry(self, job_id: str, delay: float) -> None:
+        # Timers, not sleeping workers: a backoff never holds a worker slot.
+        # (If this process goes away first, the sweep elsewhere picks it up.)
+        def requeue() -> None:
+            self._retries.discard(handle)
+            self._enqueue(job_id)
+
+        handle = asyncio.get_running_loop().call_later(delay, requeue)
+        self._retries.add(handle)
+
+
+research_job_queue = ResearchJobQueue(ResearchService())
@@ -1,11 +1,22 @@
+import asyncio
 import logging
-import httpx
-from typing import Optional, Dict, Any
+import threading
+import time
+from typing import Optional, Dict, Any, List
 from app.services.nlp_service import NLPService
 from app.services.data_sync_service import DataSyncService
 from app.models.movie import Movie
-from sqlalchemy.orm import Session
+from app.repositories.movie_repository import AsyncMovieRepository
+from app.services.catalog_service import catalog_service
+from app.db.session import AsyncSessionLocal
+from app.utils.text import normalize_title
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import get_settings
+from app.core.singleflight import SingleFlight
+from app.core.http_client import get_http_client, timeout_for, raise_for_upstream_error
+from app.core.circuit_breaker import CircuitOpenError, get_breaker
+from app.core.concurrency import GateRejectedError, get_thread_pool
 
 try:
     from firecrawl import FirecrawlApp
@@ -15,6 +26,68 @@ except ImportError:
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+firecrawl_breaker = get_breaker("research_firecrawl")
+serpapi_breaker = get_breaker("research_serpapi")
+# Synchronous provider SDKs (Firecrawl) run here instead of on the event loop
+provider_sdk_pool = get_thread_pool(
+    "provider_sdk",
+    max_workers=settings.BLOCKING_POOL_MAX_WORKERS,
+    max_queue=settings.BLOCKING_POOL_MAX_QUEUE,
+    timeout=settings.BLOCKING_CALL_TIMEOUT_SECONDS
+)
+
+# Concurrent discoveries of the same (normalized) title share one research job
+discovery_flight = SingleFlight()
+
+PROVIDERS = ["firecrawl", "serpapi", "duckduckgo", "generic_serp"]
+# Ranking cost of a miss: roughly the time lost before the next provider answers
+FAILURE_PENALTY_SECONDS = 5.0
+
+
+class ProviderStats:
+    """
+    Exponentially weighted latency and success rate of one research provider,
+    used to put the providers most likely to answer quickly first.
+    """
+
+    def __init__(self, alpha: float = settings.RESEARCH_STATS_ALPHA):
+        self.alpha = alpha
+        self.latency: Optional[float] = None
+        self.success_rate = 1.0 # Optimistic until measured
+        self.calls = 0
+
+    def record(self, latency: float, success: Optional[bool]) -> None:
+        """
+        `success=None` records a lower bound on latency only (a race loser
+        cancelled before it answered).
+        """
+        self.calls += 1
+        self.latency = latency if self.latency is None else self.alpha * latency + (1 - self.alpha) * self.latency
+        if success is not None:
+            self.success_rate = self.alpha * float(success) + (1 - self.alpha) * self.success_rate
+
+    def expected_cost(self) -> float:
+        # Expected seconds until a useful answer; unmeasured providers sort first
+        if self.latency is None:
+            return 0.0
+        return self.latency + (1 - self.success_rate) * FAILURE_PENALTY_SECONDS
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "latency_ewma_seconds": round(self.latency, 3) if self.latency is not None else None,
+            "success_rate_ewma": round(self.success_rate, 3),
+        }
+
+
+_stats_lock = threading.Lock()
+provider_stats: Dict[str, ProviderStats] = {provider: ProviderStats() for provider in PROVIDERS}
+
+
+def research_provider_stats() -> Dict[str, Dict[str, Any]]:
+    with _stats_lock:
+        return {provider: stats.snapshot() for provider, stats in provider_stats.items()}
+
 class ResearchService:
     """
     The 'Cinematic Detective' - researches unknown movies 
@@ -31,11 +104,26 @@ class ResearchService:
         if settings.FIRECRAWL_API_KEY and FirecrawlApp:
             self.firecrawl = FirecrawlApp(api_key=settings.FIRECRAWL_API_KEY)
 
-    async def discover_movie(self, title: str, db: Session) -> Optional[Movie]:
+    async def discover_movie(self, title: str, db: AsyncSession) -> Optional[Movie]:
         """
         Research a movie title from the web, analyze it, 
         save it to the DB, and return it.
+        Titles already in the catalog are returned without any research.
         """
+        normalized = normalize_title(title)
+        existing = await self._find_existing(db, title, None)
+        if existing:
+            logger.info(f"📚 '{title}' is already in the catalog (#{existing.id})")
+            return existing
+
+        # The job runs on its own session so it outlives any single caller;
+        # every caller then loads the row in its own session
+        movie_id = await discovery_flight.do(normalized or title, lambda: self._research_and_store(title))
+        if movie_id is None:
+            return None
+        return await AsyncMovieRepository.get_by_id(db, movie_id)
+
+    async def _research_and_store(self, title: str) -> Optional[int]:
         logger.info(f"🕵️ Researching new title: {title}")
         
         movie_data = await self._get_rotated_research(title)
@@ -54,6 +142,53 @@ class ResearchService:
             if poster_path:
                 poster_url = f"https://image.tmdb.org/t/p/w500{poster_path}"
 
+        async with AsyncSessionLocal() as db:
+            # Providers may return the canonical title (e.g. "RRR" for "rrr movie")
+            existing = await self._find_existing(db, movie_data['title'], tmdb_id)
+            if existing:
+                logger.info(f"📚 Research for '{title}' matched catalog title '{existing.title}' (#{existing.id})")
+                return existing.id
+
+            movie = self._build_movie(movie_data, tmdb_id, poster_url)
+
+            # 4. Save to DB for a smarter future
+            db.add(movie)
+            try:
+                await db.commit()
+            except IntegrityError:
+                # Another worker stored the same title first; use its row
+                await db.rollback()
+                existing = await self._find_existing(db, movie_data['title'], tmdb_id)
+                if existing is None:
+                    raise
+                logger.info(f"📚 '{movie_data['title']}' was stored concurrently (#{existing.id})")
+                return existing.id
+            return movie.id
+
+    async def _find_existing(self, db: AsyncSession, title: str, tmdb_id: Optional[int]) -> Optional[Movie]:
+        if tmdb_id:
+            movie = await AsyncMovieRepository.get_by_tmdb_id(db, tmdb_id)
+            if movie:
+                return movie
+        normalized = normalize_title(title)
+        if not normalized:
+            # No letters or digits: nothing to match a catalog title on
+            return None
+        movie = await AsyncMovieRepository.get_by_normalized_title(db, normalized)
+        if movie:
+            return movie
+        # Near-identical spellings and typos resolve to the catalog row too
+        catalog = await catalog_service.get_snapshot_async()
+        movie_id = catalog.match_title(title)
+        if movie_id is None:
+            return None
+        movie = await AsyncMovieRepository.get_by_id(db, movie_id)
+        # A typo match with a different TMDB id is another movie with a similar title
+        if movie is not None and tmdb_id and movie.tmdb_id and movie.tmdb_id != tmdb_id:
+            return None
+        return movie
+
+    def _build_movie(self, movie_data: Dict[str, Any], tmdb_id: Optional[int], poster_url: Optional[str]) -> Movie:
         # 3. Analyze the 'research' results using our Human-Centric NLP
         analysis = self.nlp.analyze_text(
             f"{movie_data['title']} {movie_data['overview']}"
@@ -74,36 +209,97 @@ class ResearchService:
             poster_url=poster_url
         )
         
-        # 4. Save to DB for a smarter future
-        db.add(new_movie)
-        db.commit()
-        db.refresh(new_movie)
-        
         return new_movie
 
     async def _get_rotated_research(self, title: str) -> Optional[Dict[str, Any]]:
         """
         Rotates between Google (Serp), DuckDuckGo, Firecrawl, and generic Serp.
         """
-        providers = ["firecrawl", "serpapi", "duckduckgo", "generic_serp"]
-        
         # Determine starting provider based on rotation counter
-        start_idx = ResearchService._rotation_counter % len(providers)
+        start_idx = ResearchService._rotation_counter % len(PROVIDERS)
         ResearchService._rotation_counter += 1
         
-        # Try providers in sequence starting from the rotated index
-        ordered_providers = providers[start_idx:] + providers[:start_idx]
-        
-        for provider in ordered_providers:
-            logger.info(f"🔄 Attempting research via: {provider}")
-            result = await self._call_provider(provider, title)
+        # Rotation spreads load; measured latency/success then moves the
+        # providers that answer fastest to the front (stable sort keeps the
+        # rotation among equals)
+        ordered_providers = [
+            provider for provider in PROVIDERS[start_idx:] + PROVIDERS[:start_idx]
+            if self._is_available(provider)
+        ]
+        with _stats_lock:
+            ordered_providers.sort(key=lambda provider: provider_stats[provider].expected_cost())
+
+        if settings.RESEARCH_HEDGING_ENABLED:
+            result = await self._race_providers(ordered_providers, title)
             if result:
-                logger.info(f"✅ Research successful via: {provider}")
                 return result
+        else:
+            # Try providers in sequence
+            for provider in ordered_providers:
+                logger.info(f"🔄 Attempting research via: {provider}")
+                result = await self._timed_call(provider, title)
+                if result:
+                    logger.info(f"✅ Research successful via: {provider}")
+                    return result
                 
         # Last fallback: Internal Knowledge Base
         return await self._get_fallback_knowledge(title)
 
+    async def _race_providers(self, providers: List[str], title: str) -> Optional[Dict[str, Any]]:
+        """
+        Hedged racing: starts the first provider, starts the next one whenever
+        the running ones have not answered within RESEARCH_HEDGE_DELAY_SECONDS
+        (or as soon as one comes back empty), returns the first valid result
+        and cancels the rest.
+        """
+        pending_providers = list(providers)
+        running: Dict[asyncio.Task, str] = {}
+        try:
+            while pending_providers or running:
+                if pending_providers:
+                    provider = pending_providers.pop(0)
+                    logger.info(f"🔄 Attempting research via: {provider}")
+                    running[asyncio.create_task(self._timed_call(provider, title))] = provider
+
+                done, _ = await asyncio.wait(
+                    running,
+                    timeout=settings.RESEARCH_HEDGE_DELAY_SECONDS if pending_providers else None,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    provider = running.pop(task)
+                    result = task.result()
+                    if result:
+                        logger.info(f"✅ Research successful via: {provider}")
+                        return result
+        finally:
+            for task in running:
+                task.cancel()
+        return None
+
+    async def _timed_call(self, provider: str, title: str) -> Optional[Dict[str, Any]]:
+        started = time.perf_counter()
+        try:
+            result = await self._call_provider(provider, title)
+        except asyncio.CancelledError:
+            # Lost a race: it was at least this slow, but we don't know if it would have answered
+            with _stats_lock:
+                provider_stats[provider].record(time.perf_counter() - started, None)
+            raise
+        except Exception as e:
+            logger.error(f"❌ Research provider {provider} failed: {e}")
+            result = None
+        with _stats_lock:
+            provider_stats[provider].record(time.perf_counter() - started, bool(result))
+        return result
+
+    def _is_available(self, provider: str) -> bool:
+        if provider == "firecrawl":
+            return self.firecrawl is not None
+        if provider == "serpapi":
+            return bool(settings.SERPAPI_API_KEY)
+        return True
+
     async def _call_provider(self, provider: str, title: str) -> Optional[Dict[str, Any]]:
         if provider == "firecrawl" and self.firecrawl:
             return await self._try_firecrawl(title)
@@ -118,10 +314,12 @@ class ResearchService:
     async def _try_firecrawl(self, title: str) -> Optional[Dict[str, Any]]:
         try:
             search_query = f"{title} movie plot summary runtime genre"
-            scrape_result = self.firecrawl.scrape_url(
-                f"https://www.google.com/search?q={search_query.replace(' ', '+')}",
-                params={'formats': ['markdown']}
-            )
+            with firecrawl_breaker.guard(ignore=(GateRejectedError,)):
+                scrape_result = await provider_sdk_pool.run(
+                    self.firecrawl.scrape_url,
+                    f"https://www.google.com/search?q={search_query.replace(' ', '+')}",
+                    params={'formats': ['markdown']}
+                )
             if scrape_result and scrape_result.get('markdown'):
                 return {
                     "title": title,
@@ -130,29 +328,36 @@ class ResearchService:
                     "genres": ["Research"],
                     "type": "movie"
                 }
+        except (CircuitOpenError, GateRejectedError) as e:
+            logger.info(f"⚡ Skipping Firecrawl: {e}")
         except Exception as e:
             logger.error(f"Firecrawl Error: {e}")
         return None
 
     async def _try_serpapi(self, title: str) -> Optional[Dict[str, Any]]:
         try:
-            async with httpx.AsyncClient() as client:
-                params = {
-                    "q": f"{title} movie overview genre runtime",
-                    "api_key": settings.SERPAPI_API_KEY,
-                    "engine": "google"
+            client = get_http_client()
+            url = "https://serpapi.com/search"
+            params = {
+                "q": f"{title} movie overview genre runtime",
+                "api_key": settings.SERPAPI_API_KEY,
+                "engine": "google"
+            }
+            with serpapi_breaker.guard():
+                response = await client.get(url, params=params, timeout=timeout_for(url))
+                raise_for_upstream_error(response)
+            data = response.json()
+            kg = data.get("knowledge_graph", {})
+            if kg:
+                return {
+                    "title": kg.get("title", title),
+                    "overview": kg.get("description", "A fascinating story discovered through web analysis."),
+                    "runtime": 120,
+                    "genres": [kg.get("type", "Drama")],
+                    "type": "series" if "series" in str(kg).lower() else "movie"
                 }
-                response = await client.get("https://serpapi.com/search", params=params)
-                data = response.json()
-                kg = data.get("knowledge_graph", {})
-                if kg:
-                    return {
-                        "title": kg.get("title", title),
-                        "overview": kg.get("description", "A fascinating story discovered through web analysis."),
-                        "runtime": 120,
-                        "genres": [kg.get("type", "Drama")],
-                        "type": "series" if "series" in str(kg).lower() else "movie"
-                    }
+        except CircuitOpenError:
+            logger.info("⚡ SerpApi circuit open, skipping provider")
         except Exception as e:
             logger.error(f"SerpApi Error: {e}")
         return None
@@ -1,9 +1,29 @@
 from typing import Dict, Any, Optional
+import numpy as np
 from app.models.movie import Movie
+from app.services.catalog_service import CatalogSnapshot, MISSING_CODE
 from app.core.config import get_settings
 
 settings = get_settings()
 
+# Simple heuristic: how well the movie's tone matches the requested mood
+# In a real app, this would use a more complex mapping
+MOOD_TONE_MAP = {
+    "happy": "uplifting",
+    "sad": "heavy",
+    "anxious": "uplifting", # Complementary tone
+    "bored": "dynamic"
+}
+
+INTENT_PACE_MAP = {
+    "relax": "slow",
+    "inspire": "medium",
+    "escape": "fast"
+}
+
+ARC_RESONANCE_SCORE = 0.85 # Mocked for now
+
+
 class ScoringService:
     def calculate_alignment(
         self,
@@ -18,33 +38,99 @@ class ScoringService:
         """
         emotion_score = self._score_emotion(movie, mood)
         intent_score = self._score_intent(movie, intent)
-        
+
         total_score = (
             (emotion_score * settings.EMOTION_WEIGHT) +
             (intent_score * settings.INTENT_WEIGHT)
         )
-        
+
+        return self._breakdown(emotion_score, intent_score, ARC_RESONANCE_SCORE, round(total_score, 2))
+
+    def score_batch(
+        self,
+        catalog: CatalogSnapshot,
+        indices: np.ndarray,
+        mood: str,
+        intent: Optional[str] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Vectorized calculate_alignment over a set of catalog rows.
+        Returns one array per sub-score plus the weighted total, aligned with `indices`.
+        Like calculate_alignment, the total weighs emotion and intent only.
+        """
+        tones = catalog.codes["tone"][indices]
+        paces = catalog.codes["pace"][indices]
+
+        target_tone = catalog.code("tone", MOOD_TONE_MAP.get(mood.lower(), "neutral"))
+        emotion = np.where((tones == target_tone) & (target_tone != MISSING_CODE), 1.0, 0.5)
+
+        if intent:
+            target_pace = catalog.code("pace", INTENT_PACE_MAP.get(intent.lower()))
+            intent_scores = np.where((paces == target_pace) & (target_pace != MISSING_CODE), 1.0, 0.5)
+        else:
+            intent_scores = np.ones(indices.shape[0])
+
+        total = (emotion * settings.EMOTION_WEIGHT) + (intent_scores * settings.INTENT_WEIGHT)
+
+        return {
+            "emotion": emotion,
+            "intent": intent_scores,
+            "arc": np.full(indices.shape[0], ARC_RESONANCE_SCORE),
+            "total": np.round(total, 2)
+        }
+
+    def select_top_k(
+        self,
+        scores: np.ndarray,
+        ids: np.ndarray,
+        k: int,
+        offset: int = 0
+    ) -> np.ndarray:
+        """
+        Returns the positions of ranks [offset, offset + k) ordered by score
+        (descending), ties broken by movie id (ascending). Uses a partition
+        instead of a full sort, so cost stays ~O(n) for small pages.
+        """
+        n = scores.shape[0]
+        need = min(offset + k, n)
+        if k <= 0 or offset >= need:
+            return np.empty(0, dtype=np.int64)
+
+        if need < n:
+            # Keep everything tied with the need-th best score so tie-breaking
+            # doesn't depend on which equal elements the partition happened to pick
+            threshold = np.partition(scores, n - need)[n - need]
+            positions = np.flatnonzero(scores >= threshold)
+        else:
+            positions = np.arange(n)
+
+        order = np.lexsort((ids[positions], -scores[positions]))
+        return positions[order][offset:need]
+
+    def breakdown_at(self, batch_scores: Dict[str, np.ndarray], position: int) -> Dict[str, Any]:
+        """
+        Builds the calculate_alignment-style breakdown for one row of a score_batch result.
+        """
+        return self._breakdown(
+            float(batch_scores["emotion"][position]),
+            float(batch_scores["intent"][position]),
+            float(batch_scores["arc"][position]),
+            float(batch_scores["total"][position])
+        )
+
+    def _breakdown(self, emotion_score: float, intent_score: float, arc_score: float, total_score: float) -> Dict[str, Any]:
         return {
-            "total_score": round(total_score, 2),
+            "total_score": total_score,
             "scores": {
                 "Emotional Sync": round(emotion_score * 100, 0),
                 "Intent Match": round(intent_score * 100, 0),
-                "Arc Resonance": 85, # Mocked for now
+                "Arc Resonance": round(arc_score * 100, 0),
                 "DNA Compatibility": round(total_score * 100, 0)
             }
         }
 
     def _score_emotion(self, movie: Movie, mood: str) -> float:
-        # Simple heuristic: how well the movie's tone matches the requested mood
-        # In a real app, this would use a more complex mapping
-        tone_map = {
-            "happy": "uplifting",
-            "sad": "heavy",
-            "anxious": "uplifting", # Complementary tone
-            "bored": "dynamic"
-        }
-        
-        target_tone = tone_map.get(mood.lower(), "neutral")
+        target_tone = MOOD_TONE_MAP.get(mood.lower(), "neutral")
         if movie.tone == target_tone:
             return 1.0
         return 0.5
@@ -52,15 +138,8 @@ class ScoringService:
     def _score_intent(self, movie: Movie, intent: Optional[str]) -> float:
         if not intent:
             return 1.0
-            
-        intent_pace_map = {
-            "relax": "slow",
-            "inspire": "medium",
-            "escape": "fast"
-        }
-        
-        target_pace = intent_pace_map.get(intent.lower())
+
+        target_pace = INTENT_PACE_MAP.get(intent.lower())
         if movie.pace == target_pace:
             return 1.0
         return 0.5
-
@@ -0,0 +1,226 @@
+# app/services/title_index.py
+
+from bisect import bisect_left
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from app.utils.text import normalize_title
+
+# Sequel markers: titles that differ only in these are different movies
+ROMAN_NUMERALS = {"i", "ii", "iii", "iv", "v", "vi", "vii", "viii", "ix", "x"}
+# One typo allowed per this many characters of the normalized title
+CHARS_PER_EDIT = 8
+
+
+class TitleHit(NamedTuple):
+    id: int
+    title: str
+    score: float
+
+
+def trigrams(normalized: str) -> FrozenSet[str]:
+    """
+    pg_trgm-style trigrams: each word padded with two leading spaces and one
+    trailing space, so word starts weigh more than word endings.
+    """
+    return frozenset().union(*map(word_trigrams, normalized.split()))
+
+
+@lru_cache(maxsize=1 << 16)
+def word_trigrams(word: str) -> FrozenSet[str]:
+    # Cached: most words recur across many titles when an index is built
+    padded = f"  {word} "
+    return frozenset([padded[i:i + 3] for i in range(len(padded) - 2)])
+
+
+def sequel_markers(normalized: str) -> FrozenSet[str]:
+    return frozenset(word for word in normalized.split() if word.isdigit() or word in ROMAN_NUMERALS)
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    Levenshtein distance, giving up (returning limit + 1) once every
+    alignment already needs more than `limit` edits.
+    """
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, start=1):
+        current = [i]
+        for j, char_b in enumerate(b, start=1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b)
+            ))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+class TitleIndex:
+    """
+    In-process fuzzy title index over the catalog snapshot.
+
+    - Trigram posting lists give typo-tolerant search: a title's score is
+      the mean of query containment (share of the query's trigrams found in
+      the title, so "godfather" finds "The Godfather Part II") and Jaccard
+      similarity (which prefers titles close to the query as a whole).
+      Postings are one flat row array sliced by per-trigram offsets, so
+      counting shared trigrams and scoring are vectorized over the catalog.
+    - Two sorted key lists (whole normalized titles, and every word-start
+      suffix of them) answer prefix autocomplete with a bisect plus a scan
+      of at most `limit` entries.
+    """
+
+    def __init__(self, ids: Sequence[int], titles: Sequence[Optional[str]]):
+        self.ids: List[int] = []
+        self.titles: List[str] = []
+        self.normalized: List[str] = []
+        # Unseen trigrams get the next id on lookup
+        self._gram_ids: Dict[str, int] = defaultdict()
+        self._gram_ids.default_factory = self._gram_ids.__len__
+        gram_counts: List[int] = []
+        posting_grams: List[int] = []
+        posting_rows: List[int] = []
+        title_keys: List[Tuple[str, int, int]] = []
+        word_keys: List[Tuple[str, int, int]] = []
+
+        for movie_id, title in zip(ids, titles):
+            if not title:
+                continue
+            normalized = normalize_title(title)
+            if not normalized:
+                continue
+            row = len(self.ids)
+            movie_id = int(movie_id)
+            self.ids.append(movie_id)
+            self.titles.append(title)
+            self.normalized.append(normalized)
+            grams = trigrams(normalized)
+            gram_counts.append(len(grams))
+            posting_grams.extend(map(self._gram_ids.__getitem__, grams))
+            posting_rows.extend([row] * len(grams))
+
+            title_keys.append((normalized, movie_id, row))
+            words = normalized.split()
+            for start in range(1, len(words)):
+                word_keys.append((" ".join(words[start:]), movie_id, row))
+
+        self._ids = np.array(self.ids, dtype=np.int64)
+        self._lengths = np.array([len(normalized) for normalized in self.normalized], dtype=np.int32)
+        self._gram_counts = np.array(gram_counts, dtype=np.int32)
+        # Stable sort by trigram keeps each posting list in row order
+        grams_array = np.array(posting_grams, dtype=np.int32)
+        self._posting_rows = np.array(posting_rows, dtype=np.int32)[np.argsort(grams_array, kind="stable")]
+        self._posting_offsets = np.zeros(len(self._gram_ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(grams_array, minlength=len(self._gram_ids)), out=self._posting_offsets[1:])
+
+        # Lookups must not add trigrams from here on
+        self._gram_ids = dict(self._gram_ids)
+
+        # (key, id) order: alphabetical, duplicates by lowest id
+        title_keys.sort()
+        word_keys.sort()
+        self._title_keys = [key for key, _, _ in title_keys]
+        self._title_rows = [row for _, _, row in title_keys]
+        self._word_keys = [key for key, _, _ in word_keys]
+        self._word_rows = [row for _, _, row in word_keys]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def search(self, query: str, limit: int = 10, min_score: float = 0.0) -> List[TitleHit]:
+        """
+        Titles sharing trigrams with the query, best score first (ties by id).
+        """
+        normalized = normalize_title(query)
+        if not normalized or limit <= 0:
+            return []
+        query_grams = trigrams(normalized)
+        shared = self._shared_counts(query_grams)
+        # containment >= score, so rows sharing too few trigrams can be skipped unscored
+        rows = np.flatnonzero(shared >= max(min_score * len(query_grams), 1))
+        shared = shared[rows]
+        containment = shared / len(query_grams)
+        jaccard = shared / (len(query_grams) + self._gram_counts[rows] - shared)
+        scores = (containment + jaccard) / 2
+        keep = scores >= min_score
+        rows, scores = rows[keep], scores[keep]
+        if len(rows) > limit:
+            # Only the rows tied with or above the limit-th best need ordering
+            cutoff = np.partition(scores, len(scores) - limit)[len(scores) - limit]
+            keep = scores >= cutoff
+            rows, scores = rows[keep], scores[keep]
+        best = np.lexsort((self._ids[rows], -scores))[:limit]
+        return [self._hit(int(rows[i]), float(scores[i])) for i in best]
+
+    def autocomplete(self, prefix: str, limit: int = 10) -> List[TitleHit]:
+        """
+        Titles starting with the prefix first, then titles with a later word
+        starting with it, each alphabetically. Scores are the share of the
+        title already typed.
+        """
+        normalized = normalize_title(prefix)
+        if not normalized or limit <= 0:
+            return []
+        hits: List[TitleHit] = []
+        seen: Set[int] = set()
+        for keys, rows in ((self._title_keys, self._title_rows), (self._word_keys, self._word_rows)):
+            i = bisect_left(keys, normalized)
+            while i < len(keys) and len(hits) < limit and keys[i].startswith(normalized):
+                row = rows[i]
+                if row not in seen:
+                    seen.add(row)
+                    hits.append(self._hit(row, len(normalized) / len(self.normalized[row])))
+                i += 1
+        return hits
+
+    def best_match(self, title: str, max_edits: int) -> Optional[int]:
+        """
+        Id of the catalog title a mention most likely means: fewest typos
+        (edit distance), at most one per CHARS_PER_EDIT characters and
+        `max_edits` overall, so short titles ("Psyche" / "Psycho") must
+        match exactly. Sequel numbers must agree ("Toy Story 2" never
+        matches "Toy Story 3") and a title that merely extends the other
+        ("Alien" / "Aliens") is a different movie, not a typo.
+        """
+        normalized = normalize_title(title)
+        allowed = min(max_edits, len(normalized) // CHARS_PER_EDIT)
+        if allowed <= 0:
+            return None
+        query_grams = trigrams(normalized)
+        markers = sequel_markers(normalized)
+        # Each edit breaks at most three trigrams per side, and changes the length by at most one
+        candidates = np.flatnonzero(
+            (self._shared_counts(query_grams) >= max(len(query_grams) - 3 * allowed, 1))
+            & (np.abs(self._lengths - len(normalized)) <= allowed)
+        )
+        best: Optional[Tuple[int, int]] = None
+        # Lowest id first, so it wins ties on distance
+        for row in candidates[np.argsort(self._ids[candidates], kind="stable")].tolist():
+            candidate = self.normalized[row]
+            if sequel_markers(candidate) != markers or candidate.startswith(normalized) or normalized.startswith(candidate):
+                continue
+            distance = edit_distance(normalized, candidate, allowed)
+            if distance <= allowed and (best is None or distance < best[0]):
+                best = (distance, row)
+        return self.ids[best[1]] if best else None
+
+    def _shared_counts(self, query_grams: FrozenSet[str]) -> np.ndarray:
+        """
+        Number of the query's trigrams each row contains.
+        """
+        postings = []
+        for gram in query_grams:
+            gram_id = self._gram_ids.get(gram)
+            if gram_id is not None:
+                postings.append(self._posting_rows[self._posting_offsets[gram_id]:self._posting_offsets[gram_id + 1]])
+        if not postings:
+            return np.zeros(len(self.ids), dtype=np.int64)
+        return np.bincount(np.concatenate(postings), minlength=len(self.ids))
+
+    def _hit(self, row: int, score: float) -> TitleHit:
+        return TitleHit(self.ids[row], self.titles[row], round(score, 3))
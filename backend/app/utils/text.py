@@ -1,4 +1,29 @@
 import re
+import unicodedata
+
+LEADING_ARTICLE_PATTERN = re.compile(r"^(the|a|an) ")
+TRAILING_YEAR_PATTERN = re.compile(r"\s*\((19|20)\d{2}\)\s*$")
+# Anything but letters and digits, in any script
+NON_ALNUM_PATTERN = re.compile(r"[\W_]+")
 
 def clean_text(text: str) -> str:
     return re.sub(r'\s+', ' ', text).strip()
+
+def normalize_title(title: str) -> str:
+    """
+    Canonical form for title matching: accents, case, punctuation, a
+    trailing "(1999)" and a leading article are ignored, so
+    "The Lord of the Rings: The Two Towers (2002)" matches
+    "lord of the rings the two towers". Only Latin-style accents are
+    dropped; non-Latin titles keep their letters ("千と千尋の神隠し"), and a
+    title with no letters or digits normalizes to "" (no usable key).
+    """
+    title = TRAILING_YEAR_PATTERN.sub("", title)
+    title = unicodedata.normalize("NFKD", title)
+    # Strip the combining diacritics block only: kana voicing marks and
+    # Hangul jamo are part of the letter and are recomposed below
+    title = "".join(ch for ch in title if not "\u0300" <= ch <= "\u036f")
+    title = unicodedata.normalize("NFC", title)
+    title = title.casefold().replace("&", " and ")
+    title = NON_ALNUM_PATTERN.sub(" ", title).strip()
+    return LEADING_ARTICLE_PATTERN.sub("", title)
@@ -0,0 +1,39 @@
+# backend/scripts/bulk_load.py
+
+import argparse
+import logging
+from sqlalchemy.orm import Session
+from app.db.session import SessionLocal
+from app.services.catalog_loader import load_catalog_file
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def bulk_load(path: str, fmt: str = None, batch_size: int = 1000, update_existing: bool = True):
+    db: Session = SessionLocal()
+    try:
+        stats = load_catalog_file(db, path, fmt=fmt, batch_size=batch_size, update_existing=update_existing)
+        logger.info(
+            f"🎬 Loaded {path}: {stats['inserted']} inserted, {stats['updated']} updated, "
+            f"{stats['skipped']} skipped, {stats['invalid']} invalid "
+            f"in {stats['seconds']}s ({stats['rows_per_second']} rows/s)"
+        )
+        return stats
+    except Exception as e:
+        logger.error(f"❌ Error loading catalog: {e}")
+        # Callers (and the CLI exit status) must see the failure
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk import a catalog dump (JSON array, JSONL or CSV).")
+    parser.add_argument("path", help="Path to the catalog file")
+    parser.add_argument("--format", choices=["json", "jsonl", "ndjson", "csv"], help="Defaults to the file extension")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Rows per batched insert/update")
+    parser.add_argument("--skip-existing", action="store_true", help="Leave rows that already exist untouched")
+    args = parser.parse_args()
+
+    bulk_load(args.path, fmt=args.format, batch_size=args.batch_size, update_existing=not args.skip_existing)
@@ -6,6 +6,7 @@ from app.models.movie import Movie
 from app.models.user import User
 from app.models.watchlist import Watchlist
 from app.models.share import Share
+from app.models.research_job import ResearchJob
 
 def init_db():
     print("🚀 Initializing database tables...")
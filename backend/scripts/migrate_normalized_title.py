@@ -0,0 +1,110 @@
+# backend/scripts/migrate_normalized_title.py
+
+import argparse
+import logging
+from typing import Dict, List
+from sqlalchemy import inspect, select, text, update
+from app.db.session import SessionLocal, engine
+from app.models.movie import Movie
+from app.utils.text import normalize_title
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+INDEX_NAME = "ix_movies_normalized_title"
+
+
+def add_column() -> None:
+    columns = {column["name"] for column in inspect(engine).get_columns("movies")}
+    if "normalized_title" in columns:
+        logger.info("ℹ️ movies.normalized_title already exists")
+        return
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE movies ADD COLUMN normalized_title VARCHAR(255)"))
+    logger.info("✅ Added movies.normalized_title")
+
+
+def backfill(chunk_size: int = 1000) -> List[Dict]:
+    """
+    Fills normalized_title in id order. The first (lowest id) row per
+    normalized title keeps it; later duplicates stay NULL and are returned
+    for manual review, since watchlists and shares may still reference them.
+    Titles without letters or digits have no key and stay NULL; empty keys
+    left by earlier runs are cleared and filled again.
+    """
+    db = SessionLocal()
+    duplicates: List[Dict] = []
+    try:
+        cleared = db.execute(
+            update(Movie).where(Movie.normalized_title == "").values(normalized_title=None)
+        ).rowcount
+        db.commit()
+        if cleared:
+            logger.info(f"🧹 Cleared {cleared} empty normalized titles")
+        taken = {
+            value: movie_id for movie_id, value in db.execute(
+                select(Movie.id, Movie.normalized_title).where(Movie.normalized_title.is_not(None))
+            )
+        }
+        last_id = 0
+        filled = 0
+        while True:
+            rows = db.execute(
+                select(Movie.id, Movie.title)
+                .where(Movie.normalized_title.is_(None), Movie.id > last_id)
+                .order_by(Movie.id)
+                .limit(chunk_size)
+            ).all()
+            if not rows:
+                break
+
+            updates = []
+            for movie_id, title in rows:
+                normalized = normalize_title(title)
+                if not normalized:
+                    continue
+                if normalized in taken:
+                    duplicates.append({"id": movie_id, "title": title, "duplicate_of": taken[normalized]})
+                    continue
+                taken[normalized] = movie_id
+                updates.append({"id": movie_id, "normalized_title": normalized})
+
+            if updates:
+                db.execute(update(Movie), updates)
+            db.commit()
+            filled += len(updates)
+            last_id = rows[-1].id
+            logger.info(f"📦 Backfilled {filled} rows (through id {last_id})")
+    finally:
+        db.close()
+
+    for duplicate in duplicates:
+        logger.warning(
+            f"⚠️ Duplicate title left unindexed: #{duplicate['id']} '{duplicate['title']}' "
+            f"(same as #{duplicate['duplicate_of']})"
+        )
+    return duplicates
+
+
+def create_unique_index() -> None:
+    indexes = {index["name"] for index in inspect(engine).get_indexes("movies")}
+    if INDEX_NAME in indexes:
+        logger.info(f"ℹ️ {INDEX_NAME} already exists")
+        return
+    with engine.begin() as conn:
+        conn.execute(text(f"CREATE UNIQUE INDEX {INDEX_NAME} ON movies (normalized_title)"))
+    logger.info(f"✅ Created unique index {INDEX_NAME}")
+
+
+def migrate(chunk_size: int = 1000) -> None:
+    add_column()
+    duplicates = backfill(chunk_size)
+    create_unique_index()
+    logger.info(f"🎬 Migration complete ({len(duplicates)} duplicate rows need review)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Add, backfill and uniquely index movies.normalized_title.")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="Rows backfilled per transaction")
+    args = parser.parse_args()
+    migrate(chunk_size=args.chunk_size)
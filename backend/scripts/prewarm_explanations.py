@@ -0,0 +1,117 @@
+# backend/scripts/prewarm_explanations.py
+
+import argparse
+import asyncio
+import logging
+import time
+from collections import Counter
+from typing import List, Optional, Tuple
+from sqlalchemy import select
+from app.db.session import SessionLocal
+from app.models.movie import Movie
+from app.models.share import Share
+from app.services.gemini_service import GeminiService, DEFAULT_INTENT
+from app.services.scoring_service import MOOD_TONE_MAP, INTENT_PACE_MAP
+from app.core.rate_limit import TokenBucket
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def most_recommended(top_titles: int, top_combos: int) -> Tuple[List[str], List[Tuple[str, Optional[str]]]]:
+    """
+    Counts shared recommendation lists to find the titles we recommend most
+    and the (mood, intent) pairs people ask for most.
+    """
+    db = SessionLocal()
+    try:
+        movie_counts: Counter = Counter()
+        combo_counts: Counter = Counter()
+        stmt = select(Share.mood, Share.intent, Share.movie_ids).execution_options(yield_per=1000)
+        for mood, intent, movie_ids in db.execute(stmt):
+            movie_counts.update(movie_ids or [])
+            combo_counts[(mood.strip().lower(), intent.strip().lower() if intent else None)] += 1
+
+        movie_ids = [movie_id for movie_id, _ in movie_counts.most_common(top_titles)]
+        titles_by_id = dict(db.execute(select(Movie.id, Movie.title).where(Movie.id.in_(movie_ids))).all())
+        titles = [titles_by_id[movie_id] for movie_id in movie_ids if movie_id in titles_by_id]
+    finally:
+        db.close()
+
+    combos = [combo for combo, _ in combo_counts.most_common(top_combos)]
+    if len(combos) < top_combos:
+        # Not enough history yet: fill up with every mood x intent the scorer knows
+        for mood in MOOD_TONE_MAP:
+            for intent in [None, *INTENT_PACE_MAP]:
+                if (mood, intent) not in combos and len(combos) < top_combos:
+                    combos.append((mood, intent))
+    return titles, combos
+
+
+async def prewarm(
+    top_titles: int = 100,
+    top_combos: int = 12,
+    batch_size: int = 5,
+    concurrency: int = 4,
+    rate: float = 2.0
+):
+    """
+    Generates (or confirms cached) explanations for the most-recommended
+    titles under the most common mood/intent pairs, using the batched
+    prompt so each LLM call covers `batch_size` titles.
+    """
+    gemini = GeminiService()
+    if not gemini.enabled:
+        logger.error("❌ Gemini is not configured (GOOGLE_API_KEY); nothing to prewarm.")
+        return
+
+    titles, combos = most_recommended(top_titles, top_combos)
+    if not titles:
+        logger.warning("⚠️ No shared recommendations yet; nothing to prewarm.")
+        return
+    logger.info(f"🔥 Prewarming {len(titles)} titles x {len(combos)} mood/intent pairs")
+
+    semaphore = asyncio.Semaphore(concurrency)
+    bucket = TokenBucket(rate)
+    started = time.perf_counter()
+
+    async def warm(batch: List[str], mood: str, intent: Optional[str]) -> int:
+        async with semaphore:
+            await bucket.acquire()
+            try:
+                reasons = await gemini.generate_explanations(batch, mood, intent or DEFAULT_INTENT)
+            except Exception as e:
+                logger.warning(f"⚠️ Batch failed for {mood}/{intent}: {e}")
+                return 0
+            return len(reasons)
+
+    jobs = [
+        warm(titles[i:i + batch_size], mood, intent)
+        for mood, intent in combos
+        for i in range(0, len(titles), batch_size)
+    ]
+    warmed = sum(await asyncio.gather(*jobs))
+
+    elapsed = time.perf_counter() - started
+    logger.info(f"✅ {warmed}/{len(titles) * len(combos)} explanations cached in {elapsed:.1f}s")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Pre-generate LLM explanations for popular titles.")
+    parser.add_argument("--top-titles", type=int, default=100, help="Most-recommended titles to cover")
+    parser.add_argument("--top-combos", type=int, default=12, help="Most common mood/intent pairs to cover")
+    parser.add_argument("--batch-size", type=int, default=5, help="Titles per LLM prompt")
+    parser.add_argument("--concurrency", type=int, default=4, help="Max concurrent LLM prompts")
+    parser.add_argument("--rate", type=float, default=2.0, help="Max LLM prompts per second")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    asyncio.run(prewarm(
+        top_titles=args.top_titles,
+        top_combos=args.top_combos,
+        batch_size=args.batch_size,
+        concurrency=args.concurrency,
+        rate=args.rate
+    ))
@@ -1,66 +1,175 @@
 # backend/scripts/sync_tmdb.py
 
+import argparse
 import asyncio
+import json
 import logging
+import os
+import time
+from typing import Any, Dict, Optional
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 from app.db.session import SessionLocal
 from app.models.movie import Movie
 from app.services.data_sync_service import DataSyncService
 from app.core.config import get_settings
+from app.core.http_client import close_http_client
+from app.core.rate_limit import TokenBucket
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
-async def sync_all_movies():
+DEFAULT_CHECKPOINT = "data/cache/sync_tmdb_checkpoint.json"
+
+
+def load_checkpoint(path: str) -> int:
+    try:
+        with open(path, "r") as f:
+            return int(json.load(f).get("last_id", 0))
+    except FileNotFoundError:
+        return 0
+
+
+def save_checkpoint(path: str, last_id: int, synced: int) -> None:
+    # Write-then-rename so an interrupted run never leaves a corrupt checkpoint
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"last_id": last_id, "synced": synced, "updated_at": time.time()}, f)
+    os.replace(tmp_path, path)
+
+
+async def sync_movie(
+    data_sync: DataSyncService,
+    row,
+    semaphore: asyncio.Semaphore,
+    bucket: TokenBucket
+) -> Optional[Dict[str, Any]]:
+    """
+    Looks up one movie on TMDB and returns the column updates for it (or None).
+    """
+    async with semaphore:
+        # Search on TMDB
+        await bucket.acquire()
+        results = await data_sync.search_tmdb_movies(row.title)
+        if not results:
+            logger.warning(f"⚠️ No TMDB results for: {row.title}")
+            return None
+
+        # Find the best match (closest title or first result)
+        match = results[0]
+        tmdb_id = match.get('id')
+        poster_path = match.get('poster_path')
+        backdrop_path = match.get('backdrop_path')
+
+        values: Dict[str, Any] = {"id": row.id}
+        if tmdb_id:
+            values["tmdb_id"] = tmdb_id
+        if poster_path:
+            values["poster_url"] = f"https://image.tmdb.org/t/p/w500{poster_path}"
+        if backdrop_path:
+            values["backdrop_url"] = f"https://image.tmdb.org/t/p/original{backdrop_path}"
+
+        # Try to get more details (runtime, etc.)
+        if tmdb_id:
+            await bucket.acquire()
+            details = await data_sync.fetch_tmdb_details(tmdb_id)
+            if details:
+                if not row.overview and details.get('overview'):
+                    values["overview"] = details['overview']
+                if details.get('runtime'):
+                    values["runtime"] = details['runtime']
+
+    logger.info(f"✅ Synced: {row.title} (TMDB ID: {tmdb_id})")
+    return values if len(values) > 1 else None
+
+
+async def sync_all_movies(
+    chunk_size: int = 200,
+    concurrency: int = 8,
+    rate: float = 35.0,
+    checkpoint_path: str = DEFAULT_CHECKPOINT,
+    restart: bool = False
+):
+    """
+    Streams poster-less movies in id order, looks them up concurrently
+    (bounded by a semaphore and a token-bucket rate limit), writes each chunk
+    in one bulk UPDATE and checkpoints the last processed id so an interrupted
+    run resumes where it stopped.
+    """
     db: Session = SessionLocal()
     data_sync = DataSyncService()
-    
+    semaphore = asyncio.Semaphore(concurrency)
+    bucket = TokenBucket(rate)
+
+    last_id = 0 if restart else load_checkpoint(checkpoint_path)
+    if last_id:
+        logger.info(f"⏩ Resuming sync after movie id {last_id}")
+
+    processed = 0
+    synced = 0
+    started = time.perf_counter()
+
     try:
-        movies = db.query(Movie).filter(Movie.poster_url == None).all()
-        logger.info(f"🔍 Found {len(movies)} movies missing poster URLs.")
-        
-        for movie in movies:
-            logger.info(f"🔄 Syncing: {movie.title}...")
-            # Search on TMDB
-            results = await data_sync.search_tmdb_movies(movie.title)
-            
-            if results:
-                # Find the best match (closest title or first result)
-                match = results[0]
-                tmdb_id = match.get('id')
-                poster_path = match.get('poster_path')
-                backdrop_path = match.get('backdrop_path')
-                
-                if tmdb_id:
-                    movie.tmdb_id = tmdb_id
-                if poster_path:
-                    movie.poster_url = f"https://image.tmdb.org/t/p/w500{poster_path}"
-                if backdrop_path:
-                    movie.backdrop_url = f"https://image.tmdb.org/t/p/original{backdrop_path}"
-                
-                # Try to get more details (runtime, etc.)
-                details = await data_sync.fetch_tmdb_details(tmdb_id)
-                if details:
-                    if not movie.overview:
-                        movie.overview = details.get('overview', movie.overview)
-                    if details.get('runtime'):
-                        movie.runtime = details.get('runtime')
-                
-                logger.info(f"✅ Synced: {movie.title} (TMDB ID: {tmdb_id})")
-            else:
-                logger.warning(f"⚠️ No TMDB results for: {movie.title}")
-            
-            # Commit periodically to see progress
+        while True:
+            # Keyset pagination: only this chunk is held in memory
+            stmt = (
+                select(Movie.id, Movie.title, Movie.overview)
+                .where(Movie.poster_url.is_(None), Movie.id > last_id)
+                .order_by(Movie.id)
+                .limit(chunk_size)
+            )
+            rows = db.execute(stmt).all()
+            if not rows:
+                break
+
+            logger.info(f"🔄 Syncing {len(rows)} movies (ids {rows[0].id}-{rows[-1].id})...")
+            results = await asyncio.gather(*(
+                sync_movie(data_sync, row, semaphore, bucket) for row in rows
+            ))
+            updates = [values for values in results if values]
+
+            if updates:
+                db.execute(update(Movie), updates)
             db.commit()
-            
-        logger.info("🎬 TMDb Sync complete!")
-        
+
+            processed += len(rows)
+            synced += len(updates)
+            last_id = rows[-1].id
+            save_checkpoint(checkpoint_path, last_id, synced)
+
+            elapsed = time.perf_counter() - started
+            logger.info(f"📈 Progress: {processed} processed, {synced} synced ({processed / elapsed:.1f} movies/s)")
+
+        if os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+        logger.info(f"🎬 TMDb Sync complete! {synced}/{processed} movies updated.")
+
     except Exception as e:
-        logger.error(f"❌ Error during sync: {e}")
+        logger.error(f"❌ Error during sync (resume from id {last_id} by re-running): {e}")
         db.rollback()
     finally:
         db.close()
+        await close_http_client()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Sync missing TMDB metadata for catalog movies.")
+    parser.add_argument("--chunk-size", type=int, default=200, help="Movies fetched and written per batch")
+    parser.add_argument("--concurrency", type=int, default=8, help="Max concurrent TMDB lookups")
+    parser.add_argument("--rate", type=float, default=35.0, help="Max TMDB requests per second")
+    parser.add_argument("--checkpoint", default=DEFAULT_CHECKPOINT, help="Checkpoint file used to resume")
+    parser.add_argument("--restart", action="store_true", help="Ignore any existing checkpoint")
+    return parser.parse_args()
+
 
 if __name__ == "__main__":
-    asyncio.run(sync_all_movies())
+    args = parse_args()
+    asyncio.run(sync_all_movies(
+        chunk_size=args.chunk_size,
+        concurrency=args.concurrency,
+        rate=args.rate,
+        checkpoint_path=args.checkpoint,
+        restart=args.restart
+    ))
@@ -0,0 +1,102 @@
+import io
+import json
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.models.movie import Movie
+from app.services.catalog_loader import CatalogLoader, _iter_json_array, iter_catalog_records
+
+RECORDS = [
+    {
+        "title": "Inception",
+        "overview": "A thief who steals corporate secrets through dream-sharing.",
+        "runtime": 148,
+        "genres": ["Action", "Sci-Fi"],
+        "emotional_arc": ["curiosity", "tension", "wonder"],
+        "ending_type": "open",
+        "pace": "fast",
+        "tone": "neutral",
+    },
+    {
+        "title": "Amélie",
+        "overview": "A shy waitress decides to change the lives of those around her.",
+        "genres": ["Comedy", "Romance"],
+        "emotional_arc": ["whimsy", "warmth"],
+        "ending_type": "happy",
+        "pace": "medium",
+        "tone": "uplifting",
+        "type": "movie",
+    },
+]
+
+def make_session() -> Session:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[Movie.__table__])
+    return Session(engine)
+
+def test_readers_yield_the_same_records(tmp_path):
+    (tmp_path / "catalog.json").write_text(json.dumps(RECORDS), encoding="utf-8")
+    (tmp_path / "catalog.jsonl").write_text("\n".join(json.dumps(r) for r in RECORDS) + "\n", encoding="utf-8")
+    csv_lines = ["title,overview,runtime,genres,emotional_arc,ending_type,pace,tone"]
+    for r in RECORDS:
+        csv_lines.append(
+            f'"{r["title"]}","{r["overview"]}",{r.get("runtime", "")},'
+            f'{"|".join(r["genres"])},"{json.dumps(r["emotional_arc"]).replace(chr(34), chr(34) * 2)}",'
+            f'{r["ending_type"]},{r["pace"]},{r["tone"]}'
+        )
+    (tmp_path / "catalog.csv").write_text("\n".join(csv_lines) + "\n", encoding="utf-8")
+
+    assert list(iter_catalog_records(str(tmp_path / "catalog.json"))) == RECORDS
+    assert list(iter_catalog_records(str(tmp_path / "catalog.jsonl"))) == RECORDS
+    rows = list(iter_catalog_records(str(tmp_path / "catalog.csv")))
+    assert [row["title"] for row in rows] == ["Inception", "Amélie"]
+    assert rows[0]["genres"] == ["Action", "Sci-Fi"]
+    assert rows[1]["emotional_arc"] == ["whimsy", "warmth"]
+    assert "runtime" not in rows[1] # Empty cells are left out, not loaded as ""
+
+def test_json_array_reader_handles_values_split_across_reads():
+    items = list(_iter_json_array(io.StringIO(json.dumps(RECORDS, indent=2)), read_size=7))
+    assert items == RECORDS
+
+def test_update_keeps_columns_the_dump_does_not_supply():
+    db = make_session()
+    db.add(Movie(
+        title="Inception", overview="old", runtime=148, genres=["Action"], emotional_arc=["tension"],
+        ending_type="open", pace="fast", tone="neutral", tmdb_id=27205,
+        poster_url="https://image.tmdb.org/t/p/w500/inception.jpg", release_year=2010
+    ))
+    db.commit()
+
+    stats = CatalogLoader(db).load(iter(RECORDS))
+    assert stats["updated"] == 1 and stats["inserted"] == 1
+
+    inception = db.execute(select(Movie).where(Movie.title == "Inception")).scalar_one()
+    db.refresh(inception)
+    assert inception.overview == RECORDS[0]["overview"]
+    assert inception.tmdb_id == 27205
+    assert inception.poster_url == "https://image.tmdb.org/t/p/w500/inception.jpg"
+    assert inception.release_year == 2010
+
+def test_insert_uses_column_defaults_for_missing_fields():
+    db = make_session()
+    CatalogLoader(db).load(iter(RECORDS))
+
+    inception = db.execute(select(Movie).where(Movie.title == "Inception")).scalar_one()
+    assert inception.release_year == 2024
+    assert inception.content_type == "movie"
+    assert inception.normalized_title == "inception"
+
+def test_non_latin_and_keyless_titles_are_not_collapsed():
+    records = [
+        {**RECORDS[1], "title": title}
+        for title in ("千と千尋の神隠し", "올드보이", "...", "???", "올드보이")
+    ]
+    db = make_session()
+    stats = CatalogLoader(db).load(iter(records))
+    assert (stats["inserted"], stats["skipped"]) == (4, 1)
+
+    normalized = dict(db.execute(select(Movie.title, Movie.normalized_title)).all())
+    assert normalized == {"千と千尋の神隠し": "千と千尋の神隠し", "올드보이": "올드보이", "...": None, "???": None}
+    assert Movie(title="!!").normalized_title is None
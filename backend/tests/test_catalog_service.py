@@ -0,0 +1,102 @@
+import asyncio
+import threading
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.base import Base
+from app.models.movie import Movie
+from app.services import catalog_service as catalog_module
+from app.services.catalog_service import CatalogService, CatalogSnapshot
+
+ROWS = [
+    (1, 95, "uplifting", "slow", "hopeful", ["Comedy"], "Up"),
+    (2, 140, "heavy", "fast", "bittersweet", ["Drama"], "Heat"),
+]
+
+class CountingCatalogService(CatalogService):
+    """
+    Loads from ROWS instead of the database, slowly, counting loads.
+    """
+
+    def __init__(self):
+        super().__init__(refresh_seconds=300)
+        self.loads = 0
+        self.load_threads = set()
+
+    def load(self, db):
+        self.loads += 1
+        self.load_threads.add(threading.get_ident())
+        time.sleep(0.05)
+        snapshot = CatalogSnapshot.from_rows(ROWS, version=self._version, generation=self.loads)
+        self._snapshot = snapshot
+        self._loaded_at = time.monotonic()
+        return snapshot
+
+def test_concurrent_first_load_runs_once_off_the_loop():
+    service = CountingCatalogService()
+
+    async def scenario():
+        return await asyncio.gather(*(service.get_snapshot_async() for _ in range(20)))
+
+    snapshots = asyncio.run(scenario())
+    assert service.loads == 1
+    assert threading.get_ident() not in service.load_threads
+    assert all(snapshot is snapshots[0] for snapshot in snapshots)
+
+def test_stale_snapshot_is_served_while_one_refresh_runs():
+    service = CountingCatalogService()
+
+    async def scenario():
+        first = await service.get_snapshot_async()
+        service.bump_version()
+        served = await asyncio.gather(*(service.get_snapshot_async() for _ in range(20)))
+        await service._refresh_task
+        return first, served, await service.get_snapshot_async()
+
+    first, served, refreshed = asyncio.run(scenario())
+    assert all(snapshot is first for snapshot in served)
+    assert service.loads == 2
+    assert refreshed is not first and refreshed.version == service.version
+
+def test_reload_builds_the_title_index_before_swapping_it_in(monkeypatch):
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine, tables=[Movie.__table__])
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(catalog_module, "SessionLocal", factory)
+
+    index_threads = set()
+    original_index = catalog_module.TitleIndex
+
+    def recording_index(ids, titles):
+        index_threads.add(threading.get_ident())
+        return original_index(ids, titles)
+
+    monkeypatch.setattr(catalog_module, "TitleIndex", recording_index)
+
+    def add_movie(title):
+        with factory() as db:
+            db.add(Movie(
+                title=title, overview="", genres=["Drama"], emotional_arc=["calm"],
+                ending_type="happy", pace="slow", tone="uplifting", runtime=100
+            ))
+            db.commit()
+
+    service = CatalogService(refresh_seconds=300)
+
+    async def scenario():
+        add_movie("Heat")
+        first = await service.get_snapshot_async()
+        add_movie("Ratatouille")
+        service.bump_version()
+        # The previous snapshot keeps answering searches during the reload
+        served = await service.get_snapshot_async()
+        await service._refresh_task
+        return first, served, await service.get_snapshot_async()
+
+    first, served, refreshed = asyncio.run(scenario())
+    assert served is first and first.match_title("Ratatouile") is None
+    assert refreshed.match_title("Ratatouile") == 2
+    assert threading.get_ident() not in index_threads
@@ -0,0 +1,81 @@
+import asyncio
+
+from app.models.movie import Movie
+from app.services import chat_service as chat_module
+from app.services.catalog_service import CatalogSnapshot
+from app.services.chat_service import ChatService
+
+CATALOG_ROWS = [
+    (1, 152, "heavy", "fast", "bittersweet", ["Action"], "The Dark Knight"),
+    (2, 169, "neutral", "slow", "hopeful", ["Sci-Fi"], "Interstellar"),
+]
+MOVIES = {
+    1: Movie(id=1, title="The Dark Knight", tmdb_id=155, poster_url="/dark-knight.jpg", release_year=2008),
+    2: Movie(id=2, title="Interstellar", tmdb_id=None), # Not synced yet: still needs TMDB
+}
+
+class FakeSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+def stub_catalog(monkeypatch):
+    snapshot = CatalogSnapshot.from_rows(CATALOG_ROWS)
+
+    async def get_snapshot_async():
+        return snapshot
+
+    async def get_by_ids(db, movie_ids):
+        return [MOVIES[movie_id] for movie_id in movie_ids if movie_id in MOVIES]
+
+    monkeypatch.setattr(chat_module, "AsyncSessionLocal", FakeSession)
+    monkeypatch.setattr(chat_module.catalog_service, "get_snapshot_async", get_snapshot_async)
+    monkeypatch.setattr(chat_module.AsyncMovieRepository, "get_by_ids", get_by_ids)
+
+def test_enrich_titles_uses_catalog_first_and_searches_misses_concurrently(monkeypatch):
+    stub_catalog(monkeypatch)
+    service = ChatService()
+    searched = []
+    in_flight = 0
+    max_in_flight = 0
+
+    async def search_tmdb_movies(query):
+        nonlocal in_flight, max_in_flight
+        searched.append(query)
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        if query == "Nowhere Film":
+            return []
+        return [{"id": 157336 if query == "Interstellar" else 38, "title": query, "release_date": "2014-11-05"}]
+
+    monkeypatch.setattr(service.data_sync, "search_tmdb_movies", search_tmdb_movies)
+
+    titles = ["the dark knight", "Interstellar", "Eternal Sunshine", "Nowhere Film"]
+    found = asyncio.run(service._enrich_titles(titles))
+
+    assert found["the dark knight"] == {"id": 155, "title": "The Dark Knight", "poster": "/dark-knight.jpg", "year": "2008"}
+    assert found["Interstellar"]["id"] == 157336
+    assert found["Eternal Sunshine"]["year"] == "2014"
+    assert "Nowhere Film" not in found
+    assert sorted(searched) == ["Eternal Sunshine", "Interstellar", "Nowhere Film"]
+    assert max_in_flight == 3
+
+def test_enrich_titles_falls_back_to_tmdb_when_catalog_lookup_fails(monkeypatch):
+    stub_catalog(monkeypatch)
+
+    async def broken_snapshot():
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(chat_module.catalog_service, "get_snapshot_async", broken_snapshot)
+    service = ChatService()
+
+    async def search_tmdb_movies(query):
+        return [{"id": 155, "title": "The Dark Knight", "poster_path": "/p.jpg"}]
+
+    monkeypatch.setattr(service.data_sync, "search_tmdb_movies", search_tmdb_movies)
+    found = asyncio.run(service._enrich_titles(["The Dark Knight"]))
+    assert found["The Dark Knight"]["poster"] == "https://image.tmdb.org/t/p/w200/p.jpg"
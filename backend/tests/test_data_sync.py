@@ -0,0 +1,54 @@
+import asyncio
+
+import httpx
+
+from app.core.cache import TieredCache
+from app.services import data_sync_service as sync_module
+from app.services.data_sync_service import DataSyncService
+
+class FakeClient:
+    def __init__(self, status_code, payload):
+        self.status_code = status_code
+        self.payload = payload
+        self.calls = 0
+
+    async def get(self, url, params=None, timeout=None):
+        self.calls += 1
+        return httpx.Response(self.status_code, json=self.payload, request=httpx.Request("GET", url))
+
+def stub_upstream(monkeypatch, status_code, payload):
+    client = FakeClient(status_code, payload)
+    monkeypatch.setattr(sync_module, "get_http_client", lambda: client)
+    monkeypatch.setattr(sync_module.settings, "OMDB_API_KEY", "omdb-key")
+    monkeypatch.setattr(sync_module.settings, "TMDB_API_KEY", "tmdb-key")
+    monkeypatch.setattr(sync_module, "omdb_cache", TieredCache("test_omdb", ttl=60))
+    monkeypatch.setattr(sync_module, "streaming_cache", TieredCache("test_providers", ttl=60))
+    return client
+
+def test_omdb_errors_are_not_cached(monkeypatch):
+    client = stub_upstream(monkeypatch, 401, {"Response": "False", "Error": "Request limit reached!"})
+    service = DataSyncService()
+
+    async def scenario():
+        return [await service.fetch_omdb_data("Heat") for _ in range(2)]
+
+    assert asyncio.run(scenario()) == [{}, {}]
+    assert client.calls == 2
+
+def test_omdb_false_response_is_not_cached(monkeypatch):
+    client = stub_upstream(monkeypatch, 200, {"Response": "False", "Error": "Movie not found!"})
+
+    async def scenario():
+        return await DataSyncService().fetch_omdb_data("Heat"), await sync_module.omdb_cache.get("Heat")
+
+    assert asyncio.run(scenario()) == ({}, None)
+    assert client.calls == 1
+
+def test_tmdb_provider_errors_are_not_cached(monkeypatch):
+    client = stub_upstream(monkeypatch, 401, {"status_code": 7, "status_message": "Invalid API key"})
+
+    async def scenario():
+        return await DataSyncService().fetch_streaming_providers(949), await sync_module.streaming_cache.get(949)
+
+    assert asyncio.run(scenario()) == ({}, None)
+    assert client.calls == 1
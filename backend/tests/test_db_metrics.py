@@ -0,0 +1,25 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from app.core.metrics import metrics
+from app.db.session import _instrument_queries
+
+def query_count(label):
+    for line in metrics.render_prometheus().splitlines():
+        if line.startswith(f'cinepulse_db_query_seconds_count{{engine="{label}"}}'):
+            return int(line.split()[-1])
+    return 0
+
+def test_failed_statements_leave_no_timing_state_on_the_connection():
+    engine = create_engine("sqlite://")
+    _instrument_queries(engine, "test")
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        with pytest.raises(OperationalError):
+            conn.execute(text("SELECT missing FROM nowhere"))
+        conn.execute(text("SELECT 2"))
+        assert conn.info == {}
+
+    assert query_count("test") == 2
@@ -0,0 +1,56 @@
+import asyncio
+
+from app.core.cache import TieredCache
+from app.core.deadline import Deadline
+from app.models.movie import Movie
+from app.schemas.request import RecommendationRequest
+from app.services import gemini_service as gemini_module
+from app.services.arc_service import ArcService
+from app.services.context_service import ContextService
+from app.services.data_sync_service import DataSyncService
+from app.services.emotion_service import EmotionService
+from app.services.explanation_service import ExplanationService
+from app.services.gemini_service import GeminiService
+from app.services.intent_service import IntentService
+from app.services.orchestrator import RecommendationOrchestrator
+from app.services.scoring_service import ScoringService
+
+class FailingGemini(GeminiService):
+    def __init__(self):
+        self.enabled = True
+
+    async def _complete(self, prompt, generation_config=None):
+        raise RuntimeError("upstream 500")
+
+def test_failed_explanation_uses_template_reasoning_and_is_degraded(monkeypatch):
+    monkeypatch.setattr(gemini_module, "explanation_cache", TieredCache("test_explanations", ttl=60))
+    gemini = FailingGemini()
+    orchestrator = RecommendationOrchestrator(
+        db=None,
+        emotion_service=EmotionService(),
+        intent_service=IntentService(),
+        context_service=ContextService(),
+        arc_service=ArcService(),
+        scoring_service=ScoringService(),
+        explanation_service=ExplanationService(),
+        gemini_service=gemini,
+        data_sync_service=DataSyncService()
+    )
+    movie = Movie(
+        id=1, title="Paddington", tone="uplifting", pace="medium", emotional_arc=["warmth"],
+        genres=["Comedy"], ending_type="happy", runtime=95
+    )
+    request = RecommendationRequest(mood="happy")
+
+    async def scenario():
+        reason = await gemini.generate_explanation("Paddington", "happy", "relax")
+        recommendation = await orchestrator._build_recommendation(
+            movie, {}, request, asyncio.Semaphore(2), Deadline(5.0)
+        )
+        return reason, recommendation
+
+    reason, recommendation = asyncio.run(scenario())
+    assert reason is None
+    template = ExplanationService().generate_detailed_reasoning(movie, "happy", {})["paragraph"]
+    assert recommendation.reasoning == template
+    assert recommendation.degraded == ["reasoning"]
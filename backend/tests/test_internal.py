@@ -0,0 +1,45 @@
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+
+from app.api import deps
+from app.api.deps import get_current_user
+from app.main import app
+
+client = TestClient(app)
+
+def as_user(**fields):
+    user = SimpleNamespace(**{"id": 1, "is_active": True, "is_superuser": False, **fields})
+    app.dependency_overrides[get_current_user] = lambda: user
+
+def test_internal_stats_require_a_token():
+    app.dependency_overrides.clear()
+    assert client.get("/api/v1/internal/stats/caches").status_code == 401
+
+def test_internal_stats_reject_regular_users():
+    as_user()
+    try:
+        assert client.get("/api/v1/internal/stats/concurrency").status_code == 403
+    finally:
+        app.dependency_overrides.clear()
+
+def test_internal_stats_allow_superusers():
+    as_user(is_superuser=True)
+    try:
+        response = client.get("/api/v1/internal/stats/research-jobs")
+        assert response.status_code == 200
+        assert "queued" in response.json()
+    finally:
+        app.dependency_overrides.clear()
+
+def test_metrics_require_the_scrape_token_or_a_superuser(monkeypatch):
+    monkeypatch.setattr(deps.settings, "METRICS_TOKEN", "scrape-me")
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer scrape-me"}).status_code == 200
+
+    users = {"regular": SimpleNamespace(is_active=True, is_superuser=False), "admin": SimpleNamespace(is_active=True, is_superuser=True)}
+    monkeypatch.setattr(deps, "get_current_user", lambda db, token: users[token])
+    assert client.get("/metrics", headers={"Authorization": "Bearer regular"}).status_code == 403
+    response = client.get("/metrics", headers={"Authorization": "Bearer admin"})
+    assert response.status_code == 200
+    assert "cinepulse_research_jobs_queued" in response.text
@@ -6,7 +6,8 @@ client = TestClient(app)
 def test_health_check():
     response = client.get("/health")
     assert response.status_code == 200
-    assert response.json() == {"status": "ok"}
+    assert response.json()["status"] == "ok"
+    assert "circuits" in response.json()
 
 def test_recommendation_endpoint():
     # Note: This might fail if the DB is not initialized, 
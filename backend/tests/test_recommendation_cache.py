@@ -0,0 +1,64 @@
+import asyncio
+
+from app.models.movie import Movie
+from app.schemas.request import RecommendationRequest
+from app.services import orchestrator as orchestrator_module
+from app.services.arc_service import ArcService
+from app.services.catalog_service import CatalogSnapshot
+from app.services.context_service import ContextService
+from app.services.data_sync_service import DataSyncService
+from app.services.emotion_service import EmotionService
+from app.services.explanation_service import ExplanationService
+from app.services.gemini_service import GeminiService
+from app.services.intent_service import IntentService
+from app.services.orchestrator import RecommendationOrchestrator
+from app.services.recommendation_cache import RecommendationCache
+from app.services.scoring_service import ScoringService
+
+MOVIES = [
+    Movie(id=1, title="Heat", tone="heavy", pace="fast", emotional_arc=["tension"], genres=["Crime"], ending_type="sad", runtime=170),
+    Movie(id=2, title="Paddington", tone="uplifting", pace="medium", emotional_arc=["warmth"], genres=["Comedy"], ending_type="happy", runtime=95),
+]
+
+class OfflineGemini(GeminiService):
+    def __init__(self):
+        self.enabled = False
+
+def test_whitespace_variants_share_a_key_and_the_safety_filter(monkeypatch):
+    catalog = CatalogSnapshot.from_rows([
+        (m.id, m.runtime, m.tone, m.pace, m.ending_type, m.genres, m.title) for m in MOVIES
+    ])
+    cache = RecommendationCache(ttl_seconds=60, max_bytes=1 << 20)
+
+    async def get_snapshot_async():
+        return catalog
+
+    async def get_by_ids(db, ids):
+        return [movie for movie in MOVIES if movie.id in ids]
+
+    monkeypatch.setattr(orchestrator_module.catalog_service, "get_snapshot_async", get_snapshot_async)
+    monkeypatch.setattr(orchestrator_module.AsyncMovieRepository, "get_by_ids", staticmethod(get_by_ids))
+    monkeypatch.setattr(orchestrator_module, "recommendation_cache", cache)
+    orchestrator = RecommendationOrchestrator(
+        db=None,
+        emotion_service=EmotionService(),
+        intent_service=IntentService(),
+        context_service=ContextService(),
+        arc_service=ArcService(),
+        scoring_service=ScoringService(),
+        explanation_service=ExplanationService(),
+        gemini_service=OfflineGemini(),
+        data_sync_service=DataSyncService()
+    )
+    padded = RecommendationRequest(mood="stress ", intent=" relax", limit=2)
+    plain = RecommendationRequest(mood="stress", intent="relax", limit=2)
+
+    async def scenario():
+        return [await orchestrator.get_recommendations(request) for request in (padded, plain)]
+
+    first, second = asyncio.run(scenario())
+    assert cache.make_key(padded) == cache.make_key(plain)
+    assert (cache.misses, cache.hits) == (1, 1)
+    # Heavy titles are filtered out for a stressed user, however the mood is spelled
+    assert [rec.title for rec in first.recommendations] == ["Paddington"]
+    assert [rec.title for rec in second.recommendations] == ["Paddington"]
@@ -0,0 +1,117 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import select
+
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.db.base import Base
+from app.models.movie import Movie
+from app.models.research_job import ResearchJob, PENDING, RUNNING, SUCCEEDED, FAILED
+from app.repositories.research_job_repository import utcnow
+from app.services import research_jobs as jobs_module
+from app.services.research_jobs import ResearchJobQueue
+
+class FakeResearch:
+    def __init__(self, fail_first: int = 0):
+        self.calls = []
+        self.fail_first = fail_first
+
+    async def discover_movie(self, title, db):
+        self.calls.append(title)
+        await asyncio.sleep(0.05)
+        if len(self.calls) <= self.fail_first:
+            raise RuntimeError("provider timeout")
+        movie = Movie(
+            title=title, overview="", genres=[], emotional_arc=["calm"],
+            ending_type="happy", pace="slow", tone="uplifting", runtime=90
+        )
+        db.add(movie)
+        await db.commit()
+        return movie
+
+@pytest.fixture
+def sessions(tmp_path, monkeypatch):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'jobs.db'}")
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(jobs_module, "AsyncSessionLocal", factory)
+
+    async def create_tables():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all, tables=[Movie.__table__, ResearchJob.__table__])
+
+    asyncio.run(create_tables())
+    yield factory
+    asyncio.run(engine.dispose())
+
+async def job_rows(factory):
+    async with factory() as db:
+        return {job.title: job for job in (await db.execute(select(ResearchJob))).scalars()}
+
+def test_a_job_runs_once_across_processes(sessions):
+    research = FakeResearch()
+    # Two queues over one table stand in for two uvicorn workers
+    first = ResearchJobQueue(research, workers=2, sweep_seconds=60)
+    second = ResearchJobQueue(research, workers=2, sweep_seconds=60)
+
+    async def scenario():
+        await first.start()
+        await second.start()
+        async with sessions() as db:
+            await first.submit(db, "Paddington")
+        await asyncio.gather(first.sweep(), second.sweep(), second.sweep())
+        await asyncio.sleep(0.3)
+        await first.stop()
+        await second.stop()
+        return await job_rows(sessions)
+
+    jobs = asyncio.run(scenario())
+    assert research.calls == ["Paddington"]
+    assert jobs["Paddington"].status == SUCCEEDED
+    assert jobs["Paddington"].attempts == 1
+
+def test_failed_attempt_is_retried_after_backoff(sessions):
+    research = FakeResearch(fail_first=1)
+    queue = ResearchJobQueue(research, workers=1, backoff_seconds=0.1, sweep_seconds=60)
+
+    async def scenario():
+        await queue.start()
+        async with sessions() as db:
+            await queue.submit(db, "Paddington")
+        await asyncio.sleep(0.6)
+        await queue.stop()
+        return await job_rows(sessions)
+
+    jobs = asyncio.run(scenario())
+    assert research.calls == ["Paddington", "Paddington"]
+    assert jobs["Paddington"].status == SUCCEEDED
+    assert jobs["Paddington"].attempts == 2
+
+def test_only_orphaned_running_jobs_are_recovered(sessions):
+    research = FakeResearch()
+    queue = ResearchJobQueue(research, workers=2, max_attempts=3, sweep_seconds=60)
+    now = utcnow()
+
+    async def scenario():
+        async with sessions() as db:
+            db.add_all([
+                ResearchJob(title="Orphaned", status=RUNNING, attempts=1, lease_expires_at=now - timedelta(seconds=5)),
+                ResearchJob(title="Leased", status=RUNNING, attempts=1, lease_expires_at=now + timedelta(minutes=5)),
+                ResearchJob(title="Exhausted", status=RUNNING, attempts=3, lease_expires_at=now - timedelta(seconds=5)),
+                ResearchJob(title="Backing off", status=PENDING, attempts=1, available_at=now + timedelta(minutes=5)),
+            ])
+            await db.commit()
+        await queue.start()
+        await asyncio.sleep(0.3)
+        await queue.stop()
+        return await job_rows(sessions)
+
+    jobs = asyncio.run(scenario())
+    assert research.calls == ["Orphaned"]
+    assert jobs["Orphaned"].status == SUCCEEDED and jobs["Orphaned"].attempts == 2
+    assert jobs["Leased"].status == RUNNING
+    assert jobs["Exhausted"].status == FAILED
+    assert jobs["Backing off"].status == PENDING
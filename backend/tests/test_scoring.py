@@ -0,0 +1,41 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from app.services.catalog_service import CatalogSnapshot
+from app.services.scoring_service import ScoringService
+
+ROWS = [
+    (1, 95, "uplifting", "slow", "hopeful", ["Comedy"]),
+    (2, 140, "heavy", "fast", "bittersweet", ["Drama", "Horror"]),
+    (3, None, "neutral", "medium", "neutral", ["Documentary"]),
+    (4, 110, "uplifting", "fast", "hopeful", ["Sci-Fi"]),
+]
+
+def test_snapshot_filter_matches_sql_semantics():
+    catalog = CatalogSnapshot.from_rows(ROWS)
+    assert catalog.filter(max_runtime=120).tolist() == [0, 3]
+    assert catalog.filter(tone="uplifting", pace="fast").tolist() == [3]
+    assert catalog.filter(tone="unknown").tolist() == []
+    assert catalog.filter(exclude_genres=["Horror"]).tolist() == [0, 2, 3]
+
+def test_batch_scores_match_per_movie_alignment():
+    catalog = CatalogSnapshot.from_rows(ROWS)
+    scoring = ScoringService()
+    indices = catalog.filter()
+
+    for mood in ("happy", "sad", "bored"):
+        for intent in (None, "relax", "escape", "learn"):
+            batch = scoring.score_batch(catalog, indices, mood=mood, intent=intent)
+            for position, row in enumerate(ROWS):
+                movie = SimpleNamespace(tone=row[2], pace=row[3])
+                expected = scoring.calculate_alignment(movie, mood=mood, intent=intent)
+                assert scoring.breakdown_at(batch, position) == expected
+
+def test_select_top_k_breaks_ties_by_id_and_pages():
+    scoring = ScoringService()
+    scores = np.array([0.4, 0.55, 0.4, 0.55, 0.3, 0.4])
+    ids = np.array([10, 6, 3, 2, 1, 7])
+    assert ids[scoring.select_top_k(scores, ids, k=3)].tolist() == [2, 6, 3]
+    assert ids[scoring.select_top_k(scores, ids, k=3, offset=3)].tolist() == [7, 10, 1]
+    assert scoring.select_top_k(scores, ids, k=3, offset=6).tolist() == []
@@ -0,0 +1,66 @@
+from types import SimpleNamespace
+
+import pytest
+
+from fastapi.testclient import TestClient
+
+from app.api.v1 import search as search_module
+from app.db.session import get_async_db
+from app.main import app
+from app.repositories.movie_repository import AsyncMovieRepository
+from app.services.catalog_service import CatalogSnapshot
+
+ROWS = [
+    (1, 152, "heavy", "fast", "bittersweet", ["Action"], "The Dark Knight"),
+    (2, 92, "uplifting", "medium", "happy", ["Animation"], "Toy Story 2"),
+    (3, 103, "uplifting", "medium", "bittersweet", ["Animation"], "Toy Story 3"),
+    (4, 117, "heavy", "slow", "open", ["Horror"], "Alien"),
+]
+
+client = TestClient(app)
+
+@pytest.fixture(autouse=True)
+def stub_catalog(monkeypatch):
+    catalog = CatalogSnapshot.from_rows(ROWS)
+    requested = []
+
+    async def get_snapshot_async():
+        return catalog
+
+    async def get_by_ids(db, ids):
+        requested.append(list(ids))
+        # Row 3 was deleted after the snapshot was taken
+        return [
+            SimpleNamespace(id=row[0], title=row[6], release_year=1999 + row[0], poster_url=None, content_type="movie")
+            for row in ROWS if row[0] in ids and row[0] != 3
+        ]
+
+    async def no_db():
+        yield None
+
+    monkeypatch.setattr(search_module.catalog_service, "get_snapshot_async", get_snapshot_async)
+    monkeypatch.setattr(AsyncMovieRepository, "get_by_ids", staticmethod(get_by_ids))
+    app.dependency_overrides[get_async_db] = no_db
+    yield requested
+    app.dependency_overrides.clear()
+
+def test_search_returns_catalog_rows_in_score_order(stub_catalog):
+    response = client.get("/api/v1/search/", params={"q": "toy storry", "limit": 5})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["query"] == "toy storry"
+    # Hits missing from the database are dropped
+    assert [result["id"] for result in body["results"]] == [2]
+    assert body["results"][0]["year"] == 2001
+    assert 0 < body["results"][0]["score"] <= 1
+    assert stub_catalog == [[2, 3]]
+
+def test_autocomplete_is_served_from_the_snapshot(stub_catalog):
+    response = client.get("/api/v1/search/autocomplete", params={"q": "toy"})
+    assert response.status_code == 200
+    assert [suggestion["title"] for suggestion in response.json()["suggestions"]] == ["Toy Story 2", "Toy Story 3"]
+    assert stub_catalog == []
+
+def test_search_validates_its_parameters():
+    assert client.get("/api/v1/search/", params={"q": ""}).status_code == 422
+    assert client.get("/api/v1/search/autocomplete", params={"q": "toy", "limit": 50}).status_code == 422
@@ -0,0 +1,63 @@
+from app.services.catalog_service import CatalogSnapshot
+from app.services.title_index import TitleHit, TitleIndex
+from app.utils.text import normalize_title
+
+ROWS = [
+    (1, 95, "uplifting", "slow", "hopeful", ["Comedy"]),
+    (2, 140, "heavy", "fast", "bittersweet", ["Drama", "Horror"]),
+    (3, None, "neutral", "medium", "neutral", ["Documentary"]),
+    (4, 110, "uplifting", "fast", "hopeful", ["Sci-Fi"]),
+]
+
+def snapshot(titles):
+    return CatalogSnapshot.from_rows([row + (title,) for row, title in zip(ROWS, titles)])
+
+def test_normalize_title():
+    assert normalize_title("The Matrix (1999)") == "matrix"
+    assert normalize_title("Amélie") == "amelie"
+    assert normalize_title("Fast & Furious") == "fast and furious"
+    assert normalize_title("  Spider-Man:  Homecoming ") == "spider man homecoming"
+    assert normalize_title("千と千尋の神隠し") == "千と千尋の神隠し"
+    assert normalize_title("올드보이") == "올드보이"
+    assert normalize_title("Straße") == "strasse"
+    assert normalize_title("?!") == ""
+
+def test_snapshot_title_index_uses_normalized_titles():
+    catalog = snapshot(["The Matrix", "Amélie", "Fast & Furious", "Matrix"])
+    assert catalog.find_title("matrix (1999)") == 1
+    assert catalog.find_title("AMELIE") == 2
+    assert catalog.find_title("Fast and Furious") == 3
+    assert catalog.find_title("Up") is None
+
+def test_non_latin_and_punctuation_only_titles():
+    catalog = snapshot(["千と千尋の神隠し", "올드보이", "...", "Amélie"])
+    assert catalog.find_title("千と千尋の神隠し") == 1
+    assert catalog.find_title("올드보이") == 2
+    assert catalog.find_title("羅生門") is None
+    assert catalog.find_title("???") is None
+    assert catalog.match_title("...") is None
+    assert [hit.id for hit in catalog.search_titles("千と千尋")] == [1]
+    assert len(catalog.title_search) == 3
+
+def test_snapshot_fuzzy_title_search():
+    catalog = snapshot(["The Dark Knight", "Toy Story 2", "Toy Story 3", "Alien"])
+    assert [hit.id for hit in catalog.search_titles("toy story")] == [2, 3]
+    assert catalog.search_titles("dark knigt")[0].id == 1
+    assert [hit.id for hit in catalog.autocomplete_titles("knig")] == [1]
+    assert [hit.id for hit in catalog.autocomplete_titles("toy")] == [2, 3]
+    assert catalog.match_title("The Dark Knigt") == 1
+    assert catalog.match_title("Toy Storry 3") == 3
+    assert catalog.match_title("Toy Story 4") is None
+    assert catalog.match_title("Aliens") is None
+
+def test_short_titles_need_an_exact_match():
+    catalog = snapshot(["Psycho", "Heat", "Ratatouille", "Se7en"])
+    assert catalog.match_title("Psyche") is None
+    assert catalog.match_title("Heap") is None
+    assert catalog.match_title("Ratatouile") == 3
+
+def test_search_ranks_ties_by_id():
+    index = TitleIndex([30, 10, 20, 40], ["Cars", "Cars", "Cars 2", "Planes"])
+    assert [hit.id for hit in index.search("cars")] == [10, 30, 20]
+    assert [hit.id for hit in index.search("cars", limit=1)] == [10]
+    assert index.search("planes", min_score=1.0) == [TitleHit(40, "Planes", 1.0)]